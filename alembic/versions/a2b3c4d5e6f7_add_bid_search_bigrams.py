@@ -0,0 +1,67 @@
+"""add search_bigrams to bid_announcements for short search terms
+
+Revision ID: a2b3c4d5e6f7
+Revises: f1a2b3c4d5e6
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.utils.search_text import build_search_bigrams
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a2b3c4d5e6f7"
+down_revision: Union[str, None] = "f1a2b3c4d5e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_bid_announcements_search_bigrams"
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    """Add 2 character grams of search_text, backfill them and index them with GIN (PostgreSQL).
+
+    pg_trgm extracts no trigram from 2 character terms, so LIKE '%소방%' scans the whole trigram index.
+    """
+    is_postgresql = op.get_bind().dialect.name == "postgresql"
+    column_type = postgresql.ARRAY(sa.Text()) if is_postgresql else sa.JSON()
+    op.add_column("bid_announcements", sa.Column("search_bigrams", column_type, nullable=True))
+
+    bids = sa.table(
+        "bid_announcements",
+        sa.column("id", sa.Integer()),
+        sa.column("search_text", sa.Text()),
+        sa.column("search_bigrams", column_type),
+    )
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(bids.c.id, bids.c.search_text)
+            .where(bids.c.id > last_id)
+            .order_by(bids.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        connection.execute(
+            bids.update().where(bids.c.id == sa.bindparam("bid_id")).values(search_bigrams=sa.bindparam("grams")),
+            [{"bid_id": row.id, "grams": build_search_bigrams(row.search_text)} for row in rows],
+        )
+        last_id = rows[-1].id
+
+    if is_postgresql:
+        op.create_index(INDEX_NAME, "bid_announcements", ["search_bigrams"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    """Remove search_bigrams (and its index) from bid_announcements."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index(INDEX_NAME, table_name="bid_announcements")
+    op.drop_column("bid_announcements", "search_bigrams")
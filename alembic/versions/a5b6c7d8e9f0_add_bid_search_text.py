@@ -0,0 +1,63 @@
+"""add search_text to bid_announcements
+
+Revision ID: a5b6c7d8e9f0
+Revises: f4a5b6c7d8e9
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.search_text import build_search_text
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a5b6c7d8e9f0"
+down_revision: Union[str, None] = "f4a5b6c7d8e9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    """Add normalized search_text column and backfill existing bids."""
+    op.add_column(
+        "bid_announcements",
+        sa.Column("search_text", sa.Text(), nullable=True),
+    )
+
+    bids = sa.table(
+        "bid_announcements",
+        sa.column("id", sa.Integer()),
+        sa.column("title", sa.String()),
+        sa.column("content", sa.Text()),
+        sa.column("attachment_content", sa.Text()),
+        sa.column("search_text", sa.Text()),
+    )
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(bids.c.id, bids.c.title, bids.c.content, bids.c.attachment_content)
+            .where(bids.c.id > last_id)
+            .order_by(bids.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        connection.execute(
+            bids.update().where(bids.c.id == sa.bindparam("bid_id")).values(search_text=sa.bindparam("text")),
+            [
+                {"bid_id": row.id, "text": build_search_text(row.title, row.content, row.attachment_content)}
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    """Remove search_text column from bid_announcements."""
+    op.drop_column("bid_announcements", "search_text")
@@ -0,0 +1,40 @@
+"""add pg_trgm index on bid_announcements.search_text
+
+Revision ID: b6c7d8e9f0a1
+Revises: a5b6c7d8e9f0
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b6c7d8e9f0a1"
+down_revision: Union[str, None] = "a5b6c7d8e9f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_bid_announcements_search_text_trgm"
+
+
+def upgrade() -> None:
+    """Trigram GIN index so that search_text LIKE '%단어%' is an index scan (PostgreSQL only)."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        INDEX_NAME,
+        "bid_announcements",
+        ["search_text"],
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Drop the trigram index (the pg_trgm extension is left installed)."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index(INDEX_NAME, table_name="bid_announcements")
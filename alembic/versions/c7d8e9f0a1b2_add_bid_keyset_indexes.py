@@ -0,0 +1,38 @@
+"""add keyset pagination indexes on bid_announcements
+
+Revision ID: c7d8e9f0a1b2
+Revises: b6c7d8e9f0a1
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d8e9f0a1b2"
+down_revision: Union[str, None] = "b6c7d8e9f0a1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # bid_announcements: 게시일순 목록 / 커서 (posted_at, id) < (?, ?) 조회
+    op.create_index(
+        "ix_bid_announcements_posted_id",
+        "bid_announcements",
+        ["posted_at", "id"],
+    )
+
+    # bid_announcements: 중요도순 목록 / 커서 (importance_score, id) < (?, ?) 조회
+    op.create_index(
+        "ix_bid_announcements_importance_id",
+        "bid_announcements",
+        ["importance_score", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_bid_announcements_importance_id", table_name="bid_announcements")
+    op.drop_index("ix_bid_announcements_posted_id", table_name="bid_announcements")
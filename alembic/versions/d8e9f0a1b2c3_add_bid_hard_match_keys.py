@@ -0,0 +1,114 @@
+"""add hard match keys (match_region_code, match_licenses) to bid_announcements
+
+Revision ID: d8e9f0a1b2c3
+Revises: c7d8e9f0a1b2
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.utils.hard_match import bid_license_keys, bid_region_code
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d8e9f0a1b2c3"
+down_revision: Union[str, None] = "c7d8e9f0a1b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+JSON_LIST = sa.JSON().with_variant(postgresql.JSONB(), "postgresql")
+
+
+def upgrade() -> None:
+    """Add derived region / license keys, backfill them, and index them for SQL hard matching."""
+    is_postgresql = op.get_bind().dialect.name == "postgresql"
+    if is_postgresql:
+        # JSON → JSONB (포함 연산자 @> / <@ 사용)
+        op.alter_column(
+            "bid_announcements",
+            "license_requirements",
+            type_=postgresql.JSONB(),
+            postgresql_using="license_requirements::jsonb",
+        )
+
+    op.add_column("bid_announcements", sa.Column("match_region_code", sa.String(length=2), nullable=True))
+    op.add_column(
+        "bid_announcements",
+        sa.Column("match_licenses", JSON_LIST, nullable=False, server_default=sa.text("'[]'")),
+    )
+
+    bids = sa.table(
+        "bid_announcements",
+        sa.column("id", sa.Integer()),
+        sa.column("title", sa.String()),
+        sa.column("agency", sa.String()),
+        sa.column("region_code", sa.String()),
+        sa.column("license_requirements", JSON_LIST),
+        sa.column("search_text", sa.Text()),
+        sa.column("match_region_code", sa.String()),
+        sa.column("match_licenses", JSON_LIST),
+    )
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(
+                bids.c.id,
+                bids.c.title,
+                bids.c.agency,
+                bids.c.region_code,
+                bids.c.license_requirements,
+                bids.c.search_text,
+            )
+            .where(bids.c.id > last_id)
+            .order_by(bids.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        connection.execute(
+            bids.update()
+            .where(bids.c.id == sa.bindparam("bid_id"))
+            .values(match_region_code=sa.bindparam("region"), match_licenses=sa.bindparam("licenses")),
+            [
+                {
+                    "bid_id": row.id,
+                    "region": bid_region_code(row.region_code, row.agency, row.title),
+                    "licenses": bid_license_keys(row.license_requirements, row.search_text),
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+    op.create_index("ix_bid_announcements_match_region_code", "bid_announcements", ["match_region_code"])
+    if is_postgresql:
+        # match_licenses ?| :보유 면허 키 (BidRepository._licenses_covered)
+        op.create_index(
+            "ix_bid_announcements_match_licenses",
+            "bid_announcements",
+            ["match_licenses"],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    """Drop hard match keys (license_requirements goes back to JSON on PostgreSQL)."""
+    is_postgresql = op.get_bind().dialect.name == "postgresql"
+    if is_postgresql:
+        op.drop_index("ix_bid_announcements_match_licenses", table_name="bid_announcements")
+    op.drop_index("ix_bid_announcements_match_region_code", table_name="bid_announcements")
+    op.drop_column("bid_announcements", "match_licenses")
+    op.drop_column("bid_announcements", "match_region_code")
+    if is_postgresql:
+        op.alter_column(
+            "bid_announcements",
+            "license_requirements",
+            type_=sa.JSON(),
+            postgresql_using="license_requirements::json",
+        )
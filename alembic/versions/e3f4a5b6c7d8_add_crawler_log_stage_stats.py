@@ -0,0 +1,31 @@
+"""add stage_stats to crawler_logs
+
+Revision ID: e3f4a5b6c7d8
+Revises: d2e3f4a5b6c7
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e3f4a5b6c7d8"
+down_revision: Union[str, None] = "d2e3f4a5b6c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add per-stage timing/throughput stats column to crawler_logs."""
+    op.add_column(
+        "crawler_logs",
+        sa.Column("stage_stats", sa.JSON(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Remove stage_stats column from crawler_logs."""
+    op.drop_column("crawler_logs", "stage_stats")
@@ -0,0 +1,52 @@
+"""add bid_matches (materialized matching feed) and user_profiles.matched_at
+
+Revision ID: e9f0a1b2c3d4
+Revises: d8e9f0a1b2c3
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e9f0a1b2c3d4"
+down_revision: Union[str, None] = "d8e9f0a1b2c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create bid_matches; existing profiles are matched on their next feed request (matched_at is NULL)."""
+    op.create_table(
+        "bid_matches",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("bid_id", sa.Integer(), nullable=False),
+        sa.Column("posted_at", sa.DateTime(), nullable=False),
+        sa.Column("hard_score", sa.Float(), nullable=True),
+        sa.Column("soft_score", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["bid_id"], ["bid_announcements.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "bid_id", name="uq_bid_matches_user_bid"),
+    )
+    # 매칭 피드: user_id = ? ORDER BY posted_at DESC, bid_id DESC / 커서 (posted_at, bid_id) < (?, ?)
+    op.create_index("ix_bid_matches_user_posted_bid", "bid_matches", ["user_id", "posted_at", "bid_id"])
+    # 공고 재매칭 시 DELETE ... WHERE bid_id IN (...)
+    op.create_index("ix_bid_matches_bid_id", "bid_matches", ["bid_id"])
+
+    op.add_column("user_profiles", sa.Column("matched_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop bid_matches and user_profiles.matched_at."""
+    op.drop_column("user_profiles", "matched_at")
+    op.drop_index("ix_bid_matches_bid_id", table_name="bid_matches")
+    op.drop_index("ix_bid_matches_user_posted_bid", table_name="bid_matches")
+    op.drop_table("bid_matches")
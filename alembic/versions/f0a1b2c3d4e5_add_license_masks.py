@@ -0,0 +1,116 @@
+"""replace match_licenses keys with license_mask bitmasks (bid_announcements, user_profiles)
+
+Revision ID: f0a1b2c3d4e5
+Revises: e9f0a1b2c3d4
+Create Date: 2026-10-17 23:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.utils.hard_match import bid_license_keys
+from app.utils.license_taxonomy import license_taxonomy
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f0a1b2c3d4e5"
+down_revision: Union[str, None] = "e9f0a1b2c3d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+JSON_LIST = sa.JSON().with_variant(postgresql.JSONB(), "postgresql")
+
+
+def _backfill_bids(connection, column: str, type_: sa.types.TypeEngine, value) -> None:
+    """bid_announcements 전체를 id 순으로 돌며 column = value(row) 저장"""
+    bids = sa.table(
+        "bid_announcements",
+        sa.column("id", sa.Integer()),
+        sa.column("license_requirements", JSON_LIST),
+        sa.column("search_text", sa.Text()),
+        sa.column(column, type_),
+    )
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(bids.c.id, bids.c.license_requirements, bids.c.search_text)
+            .where(bids.c.id > last_id)
+            .order_by(bids.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        connection.execute(
+            bids.update().where(bids.c.id == sa.bindparam("bid_id")).values({column: sa.bindparam("value")}),
+            [{"bid_id": row.id, "value": value(row)} for row in rows],
+        )
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Add license bitmasks (app.utils.license_taxonomy), backfill them, and drop the string keys."""
+    connection = op.get_bind()
+    op.add_column(
+        "bid_announcements",
+        sa.Column("license_mask", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+    )
+    op.add_column(
+        "user_profiles",
+        sa.Column("license_mask", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+    )
+
+    _backfill_bids(
+        connection,
+        "license_mask",
+        sa.BigInteger(),
+        lambda row: license_taxonomy.required_mask(row.license_requirements, row.search_text),
+    )
+
+    licenses = sa.table("user_licenses", sa.column("profile_id", sa.Integer()), sa.column("license_name", sa.String()))
+    names_by_profile: dict[int, list[str]] = {}
+    for row in connection.execute(sa.select(licenses.c.profile_id, licenses.c.license_name)):
+        names_by_profile.setdefault(row.profile_id, []).append(row.license_name)
+    profiles = sa.table("user_profiles", sa.column("id", sa.Integer()), sa.column("license_mask", sa.BigInteger()))
+    params = [
+        {"profile_id": profile_id, "mask": license_taxonomy.mask(names)}
+        for profile_id, names in names_by_profile.items()
+    ]
+    if params:
+        connection.execute(
+            profiles.update()
+            .where(profiles.c.id == sa.bindparam("profile_id"))
+            .values(license_mask=sa.bindparam("mask")),
+            params,
+        )
+
+    if connection.dialect.name == "postgresql":
+        op.drop_index("ix_bid_announcements_match_licenses", table_name="bid_announcements")
+    op.drop_column("bid_announcements", "match_licenses")
+
+
+def downgrade() -> None:
+    """Restore match_licenses string keys and drop the bitmasks."""
+    op.add_column(
+        "bid_announcements",
+        sa.Column("match_licenses", JSON_LIST, nullable=False, server_default=sa.text("'[]'")),
+    )
+    _backfill_bids(
+        op.get_bind(),
+        "match_licenses",
+        JSON_LIST,
+        lambda row: bid_license_keys(row.license_requirements, row.search_text),
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        op.create_index(
+            "ix_bid_announcements_match_licenses",
+            "bid_announcements",
+            ["match_licenses"],
+            postgresql_using="gin",
+        )
+    op.drop_column("user_profiles", "license_mask")
+    op.drop_column("bid_announcements", "license_mask")
@@ -0,0 +1,78 @@
+"""recompute bid_announcements.match_region_code with the region gazetteer
+
+Revision ID: f1a2b3c4d5e6
+Revises: f0a1b2c3d4e5
+Create Date: 2026-10-18 01:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.hard_match import bid_region_code
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f1a2b3c4d5e6"
+down_revision: Union[str, None] = "f0a1b2c3d4e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    """
+    Re-resolve stored bid regions (app.utils.region_gazetteer) and fix the old Jeju profile code (49 -> 50).
+
+    Materialized feeds (bid_matches) were computed with the old regions, so profiles are marked for rematch
+    (matched_at = NULL): all of them if any bid region changed, otherwise only the recoded Jeju profiles.
+    """
+    connection = op.get_bind()
+    bids = sa.table(
+        "bid_announcements",
+        sa.column("id", sa.Integer()),
+        sa.column("title", sa.String()),
+        sa.column("agency", sa.String()),
+        sa.column("region_code", sa.String()),
+        sa.column("match_region_code", sa.String()),
+    )
+    last_id = 0
+    regions_changed = False
+    while True:
+        rows = connection.execute(
+            sa.select(bids.c.id, bids.c.title, bids.c.agency, bids.c.region_code, bids.c.match_region_code)
+            .where(bids.c.id > last_id)
+            .order_by(bids.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        params = [
+            {"bid_id": row.id, "region": region}
+            for row in rows
+            if (region := bid_region_code(row.region_code, row.agency, row.title)) != row.match_region_code
+        ]
+        if params:
+            regions_changed = True
+            connection.execute(
+                bids.update()
+                .where(bids.c.id == sa.bindparam("bid_id"))
+                .values(match_region_code=sa.bindparam("region")),
+                params,
+            )
+        last_id = rows[-1].id
+
+    profiles = sa.table(
+        "user_profiles", sa.column("location_code", sa.String()), sa.column("matched_at", sa.DateTime())
+    )
+    connection.execute(
+        profiles.update().where(profiles.c.location_code == "49").values(location_code="50", matched_at=None)
+    )
+    if regions_changed:
+        connection.execute(profiles.update().where(profiles.c.matched_at.is_not(None)).values(matched_at=None))
+
+
+def downgrade() -> None:
+    """Stored regions stay as resolved by the gazetteer (the previous substring rule no longer exists)."""
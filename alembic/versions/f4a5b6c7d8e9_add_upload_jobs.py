@@ -0,0 +1,55 @@
+"""add upload_jobs table
+
+Revision ID: f4a5b6c7d8e9
+Revises: e3f4a5b6c7d8
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f4a5b6c7d8e9"
+down_revision: Union[str, None] = "e3f4a5b6c7d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add upload_jobs table for asynchronous file upload processing."""
+    op.create_table(
+        "upload_jobs",
+        sa.Column("id", sa.String(length=32), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False, server_default="queued"),
+        sa.Column("filename", sa.String(), nullable=False),
+        sa.Column("spool_path", sa.String(), nullable=True),
+        sa.Column("file_size", sa.Integer(), nullable=False),
+        sa.Column("sha256", sa.String(length=64), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("agency", sa.String(), nullable=True),
+        sa.Column("url", sa.String(), nullable=False),
+        sa.Column("bid_id", sa.Integer(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["bid_id"], ["bid_announcements.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_upload_jobs_user_id"), "upload_jobs", ["user_id"], unique=False)
+    op.create_index(op.f("ix_upload_jobs_status"), "upload_jobs", ["status"], unique=False)
+    op.create_index(op.f("ix_upload_jobs_sha256"), "upload_jobs", ["sha256"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop upload_jobs table."""
+    op.drop_index(op.f("ix_upload_jobs_sha256"), table_name="upload_jobs")
+    op.drop_index(op.f("ix_upload_jobs_status"), table_name="upload_jobs")
+    op.drop_index(op.f("ix_upload_jobs_user_id"), table_name="upload_jobs")
+    op.drop_table("upload_jobs")
@@ -15,7 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.security import get_current_user
 from app.db.models import User
 from app.db.repositories.bid_repository import BidRepository
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.services.crawler_service import G2BCrawlerService
 from app.services.notification_service import NotificationService
 from app.services.rag_service import RAGService
@@ -34,6 +34,18 @@ Usage:
         ...
 """
 
+ReadDbSession = Annotated[AsyncSession, Depends(get_read_db)]
+"""
+Read-only Database Session Dependency (읽기 복제본, 지연 초과/미설정 시 primary)
+
+쓰기를 하지 않고 방금 쓴 데이터를 바로 읽을 필요도 없는 조회(목록, 통계, 내보내기)에만 사용합니다.
+
+Usage:
+    @router.get("/stats")
+    async def stats(session: ReadDbSession):
+        ...
+"""
+
 
 # ============================================
 # Authentication
@@ -71,6 +83,22 @@ Usage:
 """
 
 
+def get_read_bid_repository(session: ReadDbSession) -> BidRepository:
+    """Read-only Bid Repository Factory (ReadDbSession)"""
+    return BidRepository(session)
+
+
+ReadBidRepo = Annotated[BidRepository, Depends(get_read_bid_repository)]
+"""
+Read-only Bid Repository Dependency
+
+Usage:
+    @router.get("/bids")
+    async def list_bids(repo: ReadBidRepo):
+        return await repo.get_multi()
+"""
+
+
 # ============================================
 # Services
 # ============================================
@@ -15,7 +15,7 @@ from app.core.cache import get_cached, set_cached
 from app.core.logging import logger
 from app.core.security import get_current_user
 from app.db.models import BidAnnouncement, User
-from app.db.session import get_db
+from app.db.session import get_read_db
 from app.services.rate_limiter import limiter
 
 router = APIRouter()
@@ -25,7 +25,7 @@ router = APIRouter()
 @limiter.limit("30/minute")
 async def get_analytics_summary(
     request: Request,
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> dict:
     """
@@ -101,7 +101,7 @@ async def get_analytics_summary(
 async def get_trends(
     request: Request,
     days: int = Query(default=30, ge=1, le=365, description="조회 기간 (1-365일)"),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> list[dict]:
     """
@@ -167,7 +167,7 @@ async def get_trends(
 @limiter.limit("30/minute")
 async def get_deadline_alerts(
     request: Request,
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> list[dict]:
     """
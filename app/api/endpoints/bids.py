@@ -1,21 +1,22 @@
 import os
+import uuid
 from datetime import datetime
+from typing import Literal
 
-from fastapi import APIRouter, Depends, File, HTTPException, Path, Query, Request, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Path, Query, Request, Response, UploadFile, status
 
 # from fastapi_cache.decorator import cache  # Removed due to dependency conflict
-from sqlalchemy import func, select
-
 from app.api import deps
 from app.core.cache import get_cached, set_cached
 from app.core.constants import ALLOWED_FILE_EXTENSIONS, MAX_FILE_SIZE_BYTES
 from app.core.logging import logger
-from app.db.models import BidAnnouncement, User
-from app.db.repositories.bid_repository import BidRepository
-from app.schemas.bid import BidCreate, BidListResponse, BidResponse, BidUpdate
+from app.db.models import UploadJob, User
+from app.db.repositories.bid_repository import BidRepository, bid_sort_key, bid_sort_types
+from app.schemas.bid import BidCreate, BidListResponse, BidResponse, BidUpdate, UploadJobResponse
 from app.services.bid_service import bid_service
-from app.services.file_service import file_service
 from app.services.rate_limiter import limiter
+from app.services.upload_service import UploadTooLargeError, upload_service
+from app.utils.cursor import MAX_CURSOR_LENGTH, decode_cursor, encode_cursor
 
 router = APIRouter()
 logger.info("CORE_MODULE_LOADED: bids.py with BidListResponse")
@@ -55,6 +56,55 @@ async def create_bid(
     return await bid_service.create_bid(repo, bid_in)
 
 
+@router.get("/matched", response_model=BidListResponse)
+@limiter.limit("30/minute")
+async def read_matching_bids(
+    request: Request,
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=500),
+    cursor: str | None = Query(default=None, max_length=MAX_CURSOR_LENGTH, description="이전 응답의 next_cursor"),
+    repo: BidRepository = Depends(deps.get_bid_repository),
+    current_user: User = Depends(deps.get_current_user),
+):
+    """
+    Retrieve bids that match the user's profile conditions (Hard Match).
+    - Checks Region Code
+    - Checks Performance Capacity
+    - Checks License Requirements
+    - Order: 게시일 최신순, cursor(이전 응답의 next_cursor)가 있으면 skip 대신 keyset 페이지네이션
+    - 매칭은 공고 수집 / 프로필 수정 시 미리 계산된 bid_matches를 읽음 (match_score: Soft Match 점수)
+    """
+    if not current_user.full_profile:
+        # If no profile, we can't match. Return empty.
+        return {"items": [], "total": 0, "skip": skip, "limit": limit}
+
+    after = None
+    if cursor:
+        decoded = decode_cursor(cursor, "matched", bid_sort_types("latest"))
+        after, skip = decoded.key, decoded.position
+
+    page = await bid_service.get_matching_page(
+        repo, current_user.full_profile, user=current_user, skip=skip, limit=limit, after=after
+    )
+    hits = page.items
+    # 한 페이지를 꽉 채웠으면 다음 페이지가 있을 수 있음 (플랜 한도로 limit이 줄면 채우지 못해 종료)
+    next_cursor = None
+    if hits and len(hits) == limit:
+        next_cursor = encode_cursor("matched", bid_sort_key(hits[-1].bid, "latest"), skip + len(hits))
+
+    # total: 매칭된 공고 수 (DB에서 센 값, 대량이면 플래너 추정치 + total_exact=False)
+    return {
+        "items": [
+            BidResponse.model_validate(hit.bid).model_copy(update={"match_score": hit.soft_score}) for hit in hits
+        ],
+        "total": page.total,
+        "total_exact": page.total_exact,
+        "skip": skip,
+        "limit": limit,
+        "next_cursor": next_cursor,
+    }
+
+
 @router.get(
     "/{bid_id}",
     response_model=BidResponse,
@@ -118,18 +168,27 @@ async def read_bids(
     limit: int = Query(default=100, ge=1, le=500, description="조회 개수 (최대 500)"),
     keyword: str | None = Query(default=None, min_length=1, max_length=100, description="검색 키워드"),
     agency: str | None = Query(default=None, min_length=1, max_length=200, description="기관명"),
-    repo: BidRepository = Depends(deps.get_bid_repository),
+    sort: Literal["relevance", "latest", "importance"] | None = Query(
+        default=None, description="정렬 (기본: keyword가 있으면 relevance, 없으면 latest)"
+    ),
+    cursor: str | None = Query(default=None, max_length=MAX_CURSOR_LENGTH, description="이전 응답의 next_cursor"),
+    repo: BidRepository = Depends(deps.get_read_bid_repository),
 ):
     """
-    Retrieve bids with optional filtering and caching (5분).
+    Retrieve bids with optional filtering and caching (5분). 읽기 복제본 사용 (ReadDbSession).
 
-    - **skip**: 건너뛸 개수 (기본 0)
+    - **skip**: 건너뛸 개수 (기본 0, cursor가 있으면 무시)
     - **limit**: 조회 개수 (최대 500)
-    - **keyword**: 제목/내용 검색 키워드
+    - **keyword**: 제목/내용/첨부 검색 키워드 (공백으로 나눈 단어 모두 포함, 관련도순 + 미리보기)
     - **agency**: 기관명 필터
+    - **sort**: relevance(관련도, keyword 필요) / latest(게시일) / importance(중요도), 모두 내림차순
+    - **cursor**: 이전 응답의 next_cursor (keyset 페이지네이션: 페이지 깊이와 무관하게 일정한 속도)
     """
+    if sort is None or (sort == "relevance" and not keyword):
+        sort = "relevance" if keyword else "latest"
+
     # Redis 캐시 확인 (5분 TTL)
-    cache_key = f"bids:list:{skip}:{limit}:{keyword or ''}:{agency or ''}"
+    cache_key = f"bids:list:{skip}:{limit}:{keyword or ''}:{agency or ''}:{sort}:{cursor or ''}"
     cached_data = await get_cached(cache_key)
     if cached_data:
         return cached_data
@@ -138,96 +197,87 @@ async def read_bids(
     # but strictly speaking, stripping implementation details is good.
     # However, the previous implementation was overly aggressive (replacing common chars).
 
-    bids = await bid_service.get_bids(repo, skip=skip, limit=limit, keyword=keyword, agency=agency)
-
-    # Get total count (Assuming the caller wants the total count matching filter)
-    # The previous code did raw SQL execute for count on ALL bids, ignoring filters!
-    # "select(func.count(BidAnnouncement.id))" counts everything.
-    # To do this right using Repository, we should add a count method.
-    # For now, let's keep it simple or fix it.
-    # We can inject DB session for raw count if needed or add count to Repo.
-    # Let's use session from repo to count all (to match previous behavior) or refactor properly.
-    # Previous behavior was: total = total_result.scalar() -> Count *ALL*
-
-    # We will replicate previous behavior for "total" (all bids in DB), but using repo.session
-    total_result = await repo.session.execute(select(func.count(BidAnnouncement.id)))
-    total = total_result.scalar()
-
-    result = {"items": bids, "total": total, "skip": skip, "limit": limit}
-
-    # Redis에 캐싱 (5분 TTL)
-    await set_cached(cache_key, result, expire=300)
-    return result
-
-
-@router.get("/matched", response_model=BidListResponse)
-@limiter.limit("30/minute")
-async def read_matching_bids(
-    request: Request,
-    skip: int = Query(default=0, ge=0),
-    limit: int = Query(default=100, ge=1, le=500),
-    repo: BidRepository = Depends(deps.get_bid_repository),
-    current_user: User = Depends(deps.get_current_user),
-):
-    """
-    Retrieve bids that match the user's profile conditions (Hard Match).
-    - Checks Region Code
-    - Checks Performance Capacity
-    - Checks License Requirements
-    """
-    # Redis 캐시 확인 (3분 TTL - 사용자별 맞춤 데이터)
-    cache_key = f"bids:matched:{current_user.id}:{skip}:{limit}"
-    cached_data = await get_cached(cache_key)
-    if cached_data:
-        return cached_data
-
-    if not current_user.full_profile:
-        # If no profile, we can't match. Return empty.
-        return {"items": [], "total": 0, "skip": skip, "limit": limit}
-
-    bids = await bid_service.get_matching_bids(
-        repo, current_user.full_profile, user=current_user, skip=skip, limit=limit
-    )
+    after = None
+    if cursor:
+        types = (float, datetime, int) if sort == "relevance" else bid_sort_types(sort)
+        decoded = decode_cursor(cursor, sort, types)
+        after, skip = decoded.key, decoded.position
+
+    # 다음 페이지가 있는지 알기 위해 1건 더 조회 (total은 같은 쿼리의 count(*) OVER () 또는 플래너 추정치)
+    if keyword:
+        page = await bid_service.search_bids(
+            repo,
+            keyword,
+            skip=skip,
+            limit=limit + 1,
+            agency=agency,
+            sort=None if sort == "relevance" else sort,
+            after=after,
+            position=skip,
+        )
+        keys = [
+            (hit.rank, hit.bid.posted_at, hit.bid.id) if sort == "relevance" else bid_sort_key(hit.bid, sort)
+            for hit in page.items
+        ]
+        bids = [
+            BidResponse.model_validate(hit.bid).model_copy(update={"search_rank": hit.rank, "snippet": hit.snippet})
+            for hit in page.items
+        ]
+    else:
+        page = await bid_service.get_bids_page(
+            repo, skip=skip, limit=limit + 1, agency=agency, sort=sort, after=after, position=skip
+        )
+        bids = page.items
+        keys = [bid_sort_key(bid, sort) for bid in bids]
 
-    # We should return the count of MATCHED bids as total, not all DB.
-    # Unlike read_bids logic above, matched listing implies 'total found'.
-    # Since we filter in Python (potentially) or simple SQL without count query,
-    # and get_hard_matches returns all matches (or paginated).
-    # If get_hard_matches is paginated, we don't know total unless we query count.
-    # For now, simplistic approach: total = len(bids) if paginated (inaccurate)
-    # OR we just return len(bids) + skip?
-    # Ideally, Repo should return (items, count).
-    # For MVP Phase 3, we'll just set total = 9999 or len(bids).
-    # Better: return len(bids) for now, acknowledging pagination limits total visibility.
+    next_cursor = encode_cursor(sort, keys[limit - 1], skip + limit) if len(bids) > limit else None
+    bids = bids[:limit]
 
     result = {
         "items": bids,
-        "total": len(bids),
+        "total": page.total,
+        "total_exact": page.total_exact,
         "skip": skip,
         "limit": limit,
-    }  # Placeholder for actual total count
+        "next_cursor": next_cursor,
+    }
 
-    # Redis에 캐싱 (3분 TTL)
-    await set_cached(cache_key, result, expire=180)
+    # Redis에 캐싱 (5분 TTL)
+    await set_cached(cache_key, result, expire=300)
     return result
 
 
-@router.post("/upload", response_model=BidResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/upload",
+    response_model=UploadJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="파일 업로드로 공고 생성",
+    responses={
+        202: {"description": "업로드 접수 (처리 상태는 Location 헤더의 URL로 조회)"},
+        400: {"description": "지원하지 않는 파일 형식 또는 크기 초과"},
+        401: {"description": "인증 필요"},
+        503: {"description": "작업 큐 사용 불가"},
+    },
+)
 @limiter.limit("10/minute")
 async def upload_bid(
     request: Request,
-    file: UploadFile = File(..., description="PDF 또는 HWP 파일"),
+    response: Response,
+    session: deps.DbSession,
+    file: UploadFile = File(..., description="PDF, HWP 또는 HWPX 파일"),
     title: str = Query(..., min_length=1, max_length=200, description="공고 제목"),
     agency: str = Query(default="Unknown", max_length=200, description="기관명"),
     url: str = Query(default="http://uploaded.file", max_length=500, description="원본 URL"),
-    repo: BidRepository = Depends(deps.get_bid_repository),
     current_user: User = Depends(deps.get_current_user),
 ):
     """
-    Upload a PDF/HWP file, extract text, and create a bid.
-    Triggers async analysis.
+    PDF/HWP/HWPX 파일을 업로드하여 공고 생성 작업 등록
+
+    파일은 임시 파일에 청크 단위로 저장하고(크기 상한 검사 / SHA-256 계산),
+    텍스트 추출 → 공고 생성 → AI 분석은 Taskiq 작업(process_bid_upload)이 처리합니다.
+    진행 상태는 GET /bids/upload/{job_id}로 조회합니다.
 
-    - 지원 파일 형식: PDF, HWP
+    - 지원 파일 형식: PDF, HWP, HWPX
     - 최대 파일 크기: 10MB
     """
     # 파일 확장자 검증
@@ -242,39 +292,76 @@ async def upload_bid(
             detail=f"지원하지 않는 파일 형식입니다. 허용: {', '.join(ALLOWED_EXTENSIONS)}",
         )
 
-    # 파일 크기 검증
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
+    # 임시 파일에 저장 (크기 초과 시 즉시 중단)
+    try:
+        spooled = await upload_service.spool(file, max_bytes=MAX_FILE_SIZE)
+    except UploadTooLargeError:
         raise HTTPException(
             status_code=400,
             detail=f"파일 크기가 너무 큽니다. 최대 {MAX_FILE_SIZE // (1024*1024)}MB",
-        )
-
-    # 파일 포인터 리셋
-    await file.seek(0)
-
-    logger.info(f"파일 업로드: {filename}, size={len(content)}, user={current_user.email}")
-
-    # 1. Extract Text
-    text_content = await file_service.get_text_from_file(file)
-
-    # 2. Create Bid Object
-    bid_in = BidCreate(
+        ) from None
+
+    logger.info(f"파일 업로드: {filename}, size={spooled.size}, user={current_user.email}")
+
+    job = UploadJob(
+        id=uuid.uuid4().hex,
+        user_id=current_user.id,
+        status="queued",
+        filename=file.filename,
+        spool_path=str(spooled.path),
+        file_size=spooled.size,
+        sha256=spooled.sha256,
         title=title,
-        content=text_content,
         agency=agency,
-        posted_at=datetime.now(),
-        url=f"{url}/{file.filename}-{datetime.now().timestamp()}",  # Fake unique URL
+        url=url,
     )
+    session.add(job)
+    await session.commit()
+
+    # 처리 작업 등록 (lazy import to avoid circular dependency)
+    try:
+        from app.worker.taskiq_tasks import process_bid_upload
+
+        await process_bid_upload.kiq(job.id)
+    except Exception as e:
+        logger.error(f"업로드 작업 등록 실패: job={job.id}: {e}", exc_info=True)
+        upload_service.discard(spooled.path)
+        job.status = "failed"
+        job.error = "작업 큐에 등록하지 못했습니다."
+        job.spool_path = None
+        job.finished_at = datetime.utcnow()
+        await session.commit()
+        raise HTTPException(
+            status_code=503,
+            detail="파일 처리 서비스를 사용할 수 없습니다. 잠시 후 다시 시도하세요.",
+        ) from e
 
-    # 3. Save to DB
-    new_bid = await bid_service.create_bid(repo, bid_in)
-
-    # 4. Trigger Analysis Worker (lazy import to avoid circular dependency)
-    from app.worker.tasks import process_bid_analysis
-
-    process_bid_analysis.delay(new_bid.id)
+    await session.refresh(job)
+    response.headers["Location"] = str(request.url_for("get_upload_job", job_id=job.id))
+    return job
 
-    logger.info(f"공고 생성 완료: id={new_bid.id}, title={title}")
 
-    return new_bid
+@router.get(
+    "/upload/{job_id}",
+    response_model=UploadJobResponse,
+    summary="파일 업로드 처리 상태 조회",
+    responses={
+        200: {"description": "작업 상태 (completed면 bid_id 포함)"},
+        401: {"description": "인증 필요"},
+        404: {"description": "작업을 찾을 수 없음"},
+    },
+)
+@limiter.limit("60/minute")
+async def get_upload_job(
+    request: Request,
+    session: deps.DbSession,
+    current_user: deps.CurrentUser,
+    job_id: str = Path(..., min_length=1, max_length=32, description="업로드 작업 ID"),
+):
+    """
+    업로드 작업 상태 조회 (본인이 등록한 작업만)
+    """
+    job = await session.get(UploadJob, job_id)
+    if not job or job.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Upload job not found")
+    return job
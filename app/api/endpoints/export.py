@@ -17,7 +17,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.logging import logger
 from app.core.security import get_current_user
 from app.db.models import BidAnnouncement, User
-from app.db.session import get_db
+from app.db.session import get_read_db
 from app.schemas.query import BidSource
 from app.services.rate_limiter import limiter
 
@@ -31,7 +31,7 @@ async def export_bids_to_excel(
     importance_score: int | None = Query(default=None, ge=1, le=3, description="중요도 필터 (1-3)"),
     source: BidSource | None = Query(default=None, description="출처 필터 (G2B, Onbid)"),
     agency: str | None = Query(default=None, min_length=1, max_length=200, description="기관명 필터"),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -154,7 +154,7 @@ async def export_priority_agencies_excel(
         max_length=1000,
         description="콤마로 구분된 기관명 (최대 20개)",
     ),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -24,6 +24,18 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str | None = None
     POSTGRES_DB: str | None = None
     POSTGRES_PORT: str | None = None
+    # 읽기 전용 복제본 (app/db/session.py ReadDbSession: 공고 목록 / 통계 / 엑셀 내보내기). None이면 primary 사용
+    DATABASE_READ_URL: str | None = None
+    DB_READ_POOL_SIZE: int = 5
+    DB_READ_MAX_OVERFLOW: int = 10
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5.0  # 복제 지연이 이 값을 넘으면 읽기도 primary 사용
+    DB_REPLICA_CHECK_INTERVAL: float = 5.0  # 복제 지연 확인 주기 (초)
+    # 목록 전체 건수(total): 플래너 추정 건수가 이 값을 넘으면 정확한 count 대신 추정치 사용
+    BID_COUNT_EXACT_THRESHOLD: int = 10_000
+    BID_COUNT_ESTIMATE_TTL: int = 300  # 같은 목록 조건의 추정 건수(EXPLAIN) 재사용 시간 (초)
+    # 매칭 피드(bid_matches): 프로필 수정 후 재매칭 대상 = 최근 N일 게시 공고 (이후 신규 공고는 수집 시 매칭)
+    MATCH_REMATCH_DAYS: int = 90
+    MATCH_REMATCH_SWEEP_LIMIT: int = 500  # 재매칭이 끝나지 않은 프로필을 한 번에 다시 등록하는 최대 수 (10분마다)
 
     # Redis - Railway provides REDIS_URL directly
     REDIS_URL: str | None = None
@@ -41,6 +53,50 @@ class Settings(BaseSettings):
     G2B_API_KEY: str | None = None
     G2B_API_ENDPOINT: str = "https://apis.data.go.kr/1230000/ao/PubDataOpnStdService/getDataSetOpnStdBidPblancInfo"
     G2B_RESULT_API_ENDPOINT: str = "https://apis.data.go.kr/1230000/OpengResultService/getOpengResultInfoListSet"
+    G2B_PAGE_SIZE: int = 100  # 페이지당 공고 수 (numOfRows)
+    G2B_PAGE_CONCURRENCY: int = 4  # 동시 페이지 요청 수 (API 호출 한도 보호)
+    G2B_MAX_PAGES: int | None = None  # 최대 페이지 수 (None이면 totalCount 기준 전체)
+
+    # Onbid 크롤링 (임대 공고)
+    ONBID_MAX_PAGES: int = 5  # 최대 목록 페이지 수
+    ONBID_PAGE_CONCURRENCY: int = 3  # 동시 목록 페이지 요청 수
+    ONBID_DETAIL_CONCURRENCY: int = 4  # 상세 페이지 조회 워커 수
+
+    # 첨부파일 스크래핑 파이프라인
+    ATTACHMENT_CONCURRENCY: int = 8  # 동시 다운로드 공고 수
+    ATTACHMENT_PER_HOST_CONCURRENCY: int = 2  # 호스트별 동시 요청 수 (대상 서버 부하 방지)
+    ATTACHMENT_PARSE_CONCURRENCY: int = 2  # 동시 파싱 작업 수
+    ATTACHMENT_MAX_BYTES: int = 10 * 1024 * 1024  # 첨부파일 최대 크기 (초과 시 스트리밍 중단)
+    ATTACHMENT_TEXT_MAX_CHARS: int = 20_000  # 첨부파일 텍스트 추출 최대 글자 수 (0이면 전체 추출)
+    SEARCH_TEXT_ATTACHMENT_CHARS: int = 5_000  # 공고 검색 텍스트(search_text)에 포함할 첨부파일 앞부분 글자 수
+
+    # 첨부파일 추출 텍스트 캐시 (app/services/attachment_cache.py)
+    ATTACHMENT_CACHE_ENABLED: bool = True
+    ATTACHMENT_CACHE_DIR: str | None = None  # 디스크 캐시 경로 (None이면 시스템 임시 디렉터리 하위)
+    ATTACHMENT_CACHE_MAX_MB: int = 256  # 디스크 캐시 최대 크기 (초과 시 LRU 삭제)
+    ATTACHMENT_CACHE_REDIS: bool = False  # Redis에도 저장하여 워커 간 공유
+    ATTACHMENT_CACHE_REDIS_TTL: int = 7 * 24 * 3600  # Redis 캐시 TTL (초)
+
+    # 파일 업로드 공고 생성 (POST /bids/upload → Taskiq process_bid_upload)
+    UPLOAD_SPOOL_DIR: str | None = None  # 업로드 파일 임시 저장 경로 (API와 워커가 공유, None이면 시스템 임시 디렉터리)
+    UPLOAD_JOB_STALE_MINUTES: int = 30  # 이 시간 넘게 queued/processing인 업로드 작업은 실패 처리 (워커 중단)
+
+    # PDF/HWP 텍스트 추출 프로세스 풀 (app/core/process_pool.py)
+    EXTRACTION_POOL_WORKERS: int = 2  # 추출 워커 프로세스 수 (0이면 워커 스레드에서 실행)
+    EXTRACTION_TIMEOUT: float = 60.0  # 문서별 추출 제한 시간 (초, 초과 시 워커 종료)
+    EXTRACTION_MAX_MEMORY_MB: int = 1024  # 워커 프로세스 메모리 상한 (0이면 제한 없음, POSIX 전용)
+
+    # 외부 API HTTP 클라이언트 풀 (app/core/http_client.py)
+    HTTP_CLIENT_HTTP2: bool = False  # HTTP/2 사용 (h2 패키지 필요)
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 20  # 업스트림별 최대 연결 수
+    HTTP_CLIENT_MAX_KEEPALIVE: int = 10  # 업스트림별 유휴 keep-alive 연결 수
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = 30.0  # 유휴 연결 유지 시간 (초)
+
+    # 키워드 알림 발송 (deliver_bid_notifications)
+    NOTIFICATION_BATCH_SIZE: int = 100  # 발송 작업 1건당 사용자 수
+    NOTIFICATION_SLACK_CONCURRENCY: int = 4  # Slack 동시 발송 수
+    NOTIFICATION_EMAIL_CONCURRENCY: int = 8  # 이메일 동시 발송 수
+    SLACK_WEBHOOK_MIN_INTERVAL: float = 1.0  # 웹훅 URL별 최소 전송 간격 (초, Slack 한도: 초당 1건)
 
     # Phase 1: Slack Notification
     SLACK_WEBHOOK_URL: str | None = None
@@ -94,6 +150,11 @@ class Settings(BaseSettings):
             if all([server, user, password, db, port]):
                 values["DATABASE_URL"] = f"postgresql+asyncpg://{user}:{password}@{server}:{port}/{db}"
 
+        read_url = values.get("DATABASE_READ_URL")
+        if read_url:
+            read_url = read_url.replace("postgres://", "postgresql+asyncpg://", 1)
+            values["DATABASE_READ_URL"] = read_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
         # REDIS_URL assembly
         redis_url = values.get("REDIS_URL")
         if not redis_url:
@@ -27,7 +27,7 @@ ML_N_ESTIMATORS = 100
 # File Upload
 MAX_FILE_SIZE_MB = 10
 MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
-ALLOWED_FILE_EXTENSIONS = {".pdf", ".hwp"}
+ALLOWED_FILE_EXTENSIONS = {".pdf", ".hwp", ".hwpx"}
 
 # Price Thresholds
 PRICE_THRESHOLD_HIGH = 100_000_000  # 1억원
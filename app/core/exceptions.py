@@ -221,6 +221,15 @@ class ModelNotTrainedError(BadRequestError):
         super().__init__(detail="ML 모델이 학습되지 않았습니다. 먼저 모델을 학습시켜 주세요.")
 
 
+class InvalidCursorError(BadRequestError):
+    """목록 커서 해석 실패 (손상되었거나 다른 정렬/목록의 커서)"""
+
+    error_code = "BID_INVALID_CURSOR"
+
+    def __init__(self, detail: str = "잘못된 커서입니다. 첫 페이지부터 다시 조회해 주세요."):
+        super().__init__(detail=detail)
+
+
 # ============================================
 # Domain-Specific: Crawler
 # ============================================
@@ -0,0 +1,268 @@
+"""
+외부 API 공유 HTTP 클라이언트 레지스트리
+
+업스트림(G2B, Onbid, Slack, Tosspayments, SendGrid)별로 튜닝된 httpx.AsyncClient를
+프로세스 단위로 하나씩 유지하여 매 요청마다 TCP/TLS 핸드셰이크를 반복하지 않도록 합니다.
+
+- keep-alive 커넥션 풀 / 업스트림별 연결 수 제한
+- 선택적 HTTP/2 (HTTP_CLIENT_HTTP2=true, h2 패키지 필요)
+- httpcore trace 이벤트 기반 풀 메트릭 (사용 중 연결 수, 풀 대기 시간, 재사용 비율)
+- FastAPI / Taskiq 종료 시 close_http_clients()로 일괄 정리
+
+사용법:
+    from app.core.http_client import get_http_client
+
+    client = get_http_client("slack")
+    response = await client.post(webhook_url, json=payload)
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+import httpx
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.metrics import (
+    HTTP_CLIENT_CONNECTIONS_IN_USE,
+    HTTP_CLIENT_POOL_WAIT_SECONDS,
+    HTTP_CLIENT_REQUESTS_TOTAL,
+)
+
+BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """업스트림별 커넥션 풀 설정 (None이면 settings 기본값 사용)"""
+
+    timeout: float = 30.0
+    connect_timeout: float = 10.0
+    max_connections: int | None = None
+    max_keepalive_connections: int | None = None
+    keepalive_expiry: float | None = None
+    follow_redirects: bool = False
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+UPSTREAM_POOLS: dict[str, PoolConfig] = {
+    # 공고 목록 API + 첨부파일 페이지 (동시 페이지 요청 수보다 여유 있게)
+    "g2b": PoolConfig(timeout=30.0),
+    "onbid": PoolConfig(timeout=30.0, headers=BROWSER_HEADERS),
+    "slack": PoolConfig(timeout=10.0, max_connections=10, max_keepalive_connections=5),
+    "tosspayments": PoolConfig(timeout=15.0, max_connections=10, max_keepalive_connections=5),
+    "sendgrid": PoolConfig(timeout=15.0, max_connections=10, max_keepalive_connections=5),
+}
+
+
+@dataclass
+class PoolStats:
+    """업스트림별 누적 풀 통계"""
+
+    requests: int = 0
+    new_connections: int = 0
+    reused_connections: int = 0
+    in_use: int = 0
+    wait_seconds_total: float = 0.0
+
+    @property
+    def reuse_ratio(self) -> float:
+        dispatched = self.new_connections + self.reused_connections
+        return self.reused_connections / dispatched if dispatched else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "in_use": self.in_use,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "reuse_ratio": round(self.reuse_ratio, 4),
+        }
+
+
+class _PoolTracer:
+    """
+    요청 1건의 httpcore trace 이벤트를 받아 풀 메트릭을 기록
+
+    - 풀 대기: request 훅 시점 ~ 첫 connect_tcp / send_request_headers 시점
+    - 신규 연결: connect_tcp 이벤트 발생 여부
+    - 사용 중 연결: send_request_headers 시작 ~ response_closed (또는 실패)
+    """
+
+    def __init__(self, upstream: str, stats: PoolStats):
+        self.upstream = upstream
+        self.stats = stats
+        self.started = time.perf_counter()
+        self.acquired = False
+        self.new_connection = False
+        self.in_use = False
+
+    def _acquire(self) -> None:
+        if self.acquired:
+            return
+        self.acquired = True
+        wait = time.perf_counter() - self.started
+        self.stats.wait_seconds_total += wait
+        HTTP_CLIENT_POOL_WAIT_SECONDS.labels(upstream=self.upstream).observe(wait)
+
+    def _release(self) -> None:
+        if not self.in_use:
+            return
+        self.in_use = False
+        self.stats.in_use -= 1
+        HTTP_CLIENT_CONNECTIONS_IN_USE.labels(upstream=self.upstream).dec()
+
+    async def __call__(self, event_name: str, info: dict) -> None:
+        if event_name == "connection.connect_tcp.started":
+            self._acquire()
+            self.new_connection = True
+        elif event_name.endswith(".send_request_headers.started"):
+            self._acquire()
+            if not self.in_use:
+                self.in_use = True
+                self.stats.in_use += 1
+                HTTP_CLIENT_CONNECTIONS_IN_USE.labels(upstream=self.upstream).inc()
+                connection = "new" if self.new_connection else "reused"
+                if self.new_connection:
+                    self.stats.new_connections += 1
+                else:
+                    self.stats.reused_connections += 1
+                HTTP_CLIENT_REQUESTS_TOTAL.labels(upstream=self.upstream, connection=connection).inc()
+        elif event_name.endswith(".response_closed.complete") or event_name.endswith(".failed"):
+            self._release()
+
+
+class HttpClientRegistry:
+    """업스트림 이름 → 공유 httpx.AsyncClient 레지스트리"""
+
+    def __init__(self, pools: dict[str, PoolConfig] | None = None):
+        self.pools = pools if pools is not None else UPSTREAM_POOLS
+        self._clients: dict[str, tuple[asyncio.AbstractEventLoop | None, httpx.AsyncClient]] = {}
+        # 다른 루프에서 교체되었지만 그 루프가 멈춰 있어 아직 닫지 못한 클라이언트 (close_all에서 종료)
+        self._replaced: list[tuple[str, httpx.AsyncClient]] = []
+        self._stats: dict[str, PoolStats] = {}
+
+    def get(self, upstream: str) -> httpx.AsyncClient:
+        """
+        업스트림 공유 클라이언트 반환 (최초 호출 시 생성)
+
+        클라이언트 풀은 이벤트 루프에 묶이므로, 다른 루프에서 호출되거나
+        이미 닫힌 경우 새로 생성합니다. 교체된 클라이언트는 _retire가 닫습니다.
+        """
+        if upstream not in self.pools:
+            raise KeyError(f"등록되지 않은 업스트림: {upstream}")
+
+        loop = _running_loop()
+        entry = self._clients.get(upstream)
+        if entry is not None:
+            client_loop, client = entry
+            if client_loop is loop and client.is_closed is not True:
+                return client
+            if client.is_closed is not True:
+                self._retire(upstream, client_loop, client)
+
+        client = self._create(upstream)
+        self._clients[upstream] = (loop, client)
+        return client
+
+    def _retire(self, upstream: str, loop: asyncio.AbstractEventLoop | None, client: httpx.AsyncClient) -> None:
+        """
+        다른 루프의 클라이언트를 교체할 때 기존 클라이언트 정리
+
+        그 루프가 (다른 스레드에서) 아직 돌고 있으면 그 루프에서 닫고,
+        멈췄거나 루프 밖에서 만든 클라이언트는 close_all까지 보관했다가 닫습니다.
+        """
+        logger.warning(f"HTTP 클라이언트 풀 교체: {upstream} (이벤트 루프 변경, 기존 연결 종료)")
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        else:
+            self._replaced.append((upstream, client))
+
+    def _create(self, upstream: str) -> httpx.AsyncClient:
+        config = self.pools[upstream]
+        stats = self._stats.setdefault(upstream, PoolStats())
+
+        async def on_request(request: httpx.Request) -> None:
+            stats.requests += 1
+            request.extensions["trace"] = _PoolTracer(upstream, stats)
+
+        limits = httpx.Limits(
+            max_connections=config.max_connections or settings.HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=config.max_keepalive_connections or settings.HTTP_CLIENT_MAX_KEEPALIVE,
+            keepalive_expiry=config.keepalive_expiry or settings.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+        )
+        logger.info(f"HTTP 클라이언트 풀 생성: {upstream} (max_connections={limits.max_connections})")
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+            limits=limits,
+            http2=_http2_enabled(),
+            headers=config.headers,
+            follow_redirects=config.follow_redirects,
+            event_hooks={"request": [on_request]},
+        )
+
+    def stats(self) -> dict[str, dict]:
+        """업스트림별 풀 통계 (재사용 비율 포함)"""
+        return {upstream: stats.as_dict() for upstream, stats in self._stats.items()}
+
+    async def close_all(self) -> None:
+        """모든 공유 클라이언트 종료 (애플리케이션/워커 종료 시 호출)"""
+        clients, self._clients = self._clients, {}
+        replaced, self._replaced = self._replaced, []
+        current = [(upstream, client) for upstream, (_, client) in clients.items()]
+        for upstream, client in current + replaced:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"HTTP 클라이언트 종료 실패 ({upstream}): {e}")
+
+    def reset(self) -> None:
+        """닫지 않고 레지스트리만 비움 (테스트용)"""
+        self._clients.clear()
+        self._replaced.clear()
+        self._stats.clear()
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+_http2_warned = False
+
+
+def _http2_enabled() -> bool:
+    """HTTP_CLIENT_HTTP2 설정 + h2 설치 여부 확인"""
+    global _http2_warned
+    if not settings.HTTP_CLIENT_HTTP2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        if not _http2_warned:
+            logger.warning("HTTP_CLIENT_HTTP2가 설정되었지만 h2 패키지가 없어 HTTP/1.1을 사용합니다.")
+            _http2_warned = True
+        return False
+    return True
+
+
+# 싱글톤 인스턴스
+http_clients = HttpClientRegistry()
+
+
+def get_http_client(upstream: str) -> httpx.AsyncClient:
+    """업스트림 공유 클라이언트 조회"""
+    return http_clients.get(upstream)
+
+
+async def close_http_clients() -> None:
+    """공유 클라이언트 일괄 종료"""
+    await http_clients.close_all()
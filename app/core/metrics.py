@@ -42,6 +42,21 @@ DB_QUERY_DURATION_SECONDS = Histogram(
 
 DB_CONNECTIONS_ACTIVE = Gauge("db_connections_active", "활성 데이터베이스 연결 수")
 
+# 커넥션 풀별 메트릭 (pool: primary, replica)
+DB_POOL_CONNECTIONS_IN_USE = Gauge("db_pool_connections_in_use", "사용 중인 DB 연결 수", ["pool"])
+
+DB_POOL_CHECKOUTS_TOTAL = Counter("db_pool_checkouts_total", "커넥션 풀 체크아웃 수", ["pool"])
+
+DB_POOL_CONNECTS_TOTAL = Counter("db_pool_connects_total", "새로 연 DB 연결 수", ["pool"])
+
+DB_READ_ROUTES_TOTAL = Counter(
+    "db_read_routes_total",
+    "읽기 세션 라우팅 수",
+    ["pool", "reason"],  # reason: replica, lagging, unavailable, disabled
+)
+
+DB_REPLICA_LAG_SECONDS = Gauge("db_replica_lag_seconds", "읽기 복제본 복제 지연 (초)")
+
 # ============================================
 # 크롤링 메트릭
 # ============================================
@@ -113,6 +128,24 @@ CACHE_MISSES_TOTAL = Counter("cache_misses_total", "캐시 미스 수", ["cache_
 
 CACHE_SIZE_BYTES = Gauge("cache_size_bytes", "캐시 크기 (bytes)", ["cache_type"])
 
+# ============================================
+# 외부 HTTP 클라이언트 풀 메트릭
+# ============================================
+HTTP_CLIENT_REQUESTS_TOTAL = Counter(
+    "http_client_requests_total",
+    "외부 API 요청 수",
+    ["upstream", "connection"],  # connection: new, reused
+)
+
+HTTP_CLIENT_CONNECTIONS_IN_USE = Gauge("http_client_connections_in_use", "사용 중인 외부 API 연결 수", ["upstream"])
+
+HTTP_CLIENT_POOL_WAIT_SECONDS = Histogram(
+    "http_client_pool_wait_seconds",
+    "커넥션 풀 대기 시간 (초)",
+    ["upstream"],
+    buckets=[0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0],
+)
+
 # ============================================
 # Celery 작업 메트릭
 # ============================================
@@ -0,0 +1,149 @@
+"""
+CPU 작업용 공유 프로세스 풀 (PDF/HWP 텍스트 추출)
+
+PyPDF2 페이지 추출, zlib 압축 해제, UTF-16 디코딩처럼 CPU를 오래 점유하는 작업을
+이벤트 루프 밖의 별도 프로세스에서 실행하여, 추출 중에도 같은 프로세스의 API 요청이
+지연되지 않도록 합니다. FastAPI 프로세스와 Taskiq 워커가 같은 방식으로 사용합니다.
+
+- 동시 실행 수 제한 (EXTRACTION_POOL_WORKERS개의 단일 워커 프로세스)
+- 문서별 타임아웃 (EXTRACTION_TIMEOUT): 초과 시 해당 워커 프로세스를 종료하고 교체
+- 워커 프로세스 메모리 상한 (EXTRACTION_MAX_MEMORY_MB, RLIMIT_AS / POSIX 전용)
+- 호출 측 취소(asyncio.CancelledError) 시에도 작업 중인 워커를 종료하여 CPU 점유 중단
+- EXTRACTION_POOL_WORKERS=0 이면 프로세스 풀 없이 워커 스레드에서 실행 (테스트/개발용)
+
+사용법:
+    from app.core.process_pool import run_in_process
+
+    text = await run_in_process(file_service.extract_text, content, filename)
+"""
+
+import asyncio
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, TypeVar
+
+from app.core.config import settings
+from app.core.logging import logger
+
+T = TypeVar("T")
+
+
+def _limit_memory(max_bytes: int) -> None:
+    """워커 프로세스 초기화: 주소 공간 상한 설정 (초과 할당은 MemoryError)"""
+    if max_bytes <= 0:
+        return
+    try:
+        import resource
+    except ImportError:  # Windows
+        return
+    resource.setrlimit(resource.RLIMIT_AS, (max_bytes, max_bytes))
+
+
+class ProcessPool:
+    """
+    단일 워커 ProcessPoolExecutor 묶음으로 구성한 프로세스 풀
+
+    ProcessPoolExecutor는 실행 중인 작업만 골라 중단할 수 없으므로, 워커 1개짜리
+    executor를 작업 단위로 빌려 쓰고 타임아웃/취소 시 그 executor만 종료합니다.
+    나머지 작업은 영향을 받지 않습니다.
+    """
+
+    def __init__(self, workers: int | None = None, timeout: float | None = None, max_memory_mb: int | None = None):
+        self._workers = workers
+        self._timeout = timeout
+        self._max_memory_mb = max_memory_mb
+        self._idle: list[ProcessPoolExecutor] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._slots: asyncio.Semaphore | None = None
+
+    @property
+    def workers(self) -> int:
+        return max(0, self._workers if self._workers is not None else settings.EXTRACTION_POOL_WORKERS)
+
+    @property
+    def timeout(self) -> float:
+        return self._timeout if self._timeout is not None else settings.EXTRACTION_TIMEOUT
+
+    @property
+    def max_memory_bytes(self) -> int:
+        max_memory_mb = self._max_memory_mb if self._max_memory_mb is not None else settings.EXTRACTION_MAX_MEMORY_MB
+        return max(0, max_memory_mb) * 1024 * 1024
+
+    async def run(self, func: Callable[..., T], *args: Any, timeout: float | None = None) -> T:
+        """
+        func(*args)를 워커 프로세스에서 실행
+
+        Raises:
+            TimeoutError: 문서별 제한 시간 초과 (워커 프로세스는 종료 후 교체)
+            MemoryError: 워커 프로세스 메모리 상한 초과
+            RuntimeError: 워커 프로세스 비정상 종료
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        if self.workers == 0:
+            return await asyncio.wait_for(asyncio.to_thread(func, *args), timeout or None)
+
+        async with self._slot():
+            executor = self._idle.pop() if self._idle else self._new_executor()
+            future = executor.submit(func, *args)
+            try:
+                result = await asyncio.wait_for(asyncio.wrap_future(future), timeout or None)
+            except (TimeoutError, asyncio.CancelledError):
+                self._terminate(executor)
+                raise
+            except BrokenProcessPool as e:
+                self._terminate(executor)
+                raise RuntimeError(f"추출 워커 프로세스 비정상 종료: {e}") from e
+            except BaseException:
+                self._idle.append(executor)
+                raise
+            self._idle.append(executor)
+            return result
+
+    def _slot(self) -> asyncio.Semaphore:
+        """이벤트 루프별 동시 실행 슬롯 (루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.workers)
+        return self._slots
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # 실행 중인 이벤트 루프/스레드 상태를 복제하지 않도록 spawn 사용
+        return ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_limit_memory,
+            initargs=(self.max_memory_bytes,),
+        )
+
+    @staticmethod
+    def _terminate(executor: ProcessPoolExecutor) -> None:
+        """실행 중인 작업째로 워커 프로세스 종료"""
+        # 3.14 이전에는 공개 API(terminate_workers)가 없어 내부 프로세스 목록을 사용
+        for process in list((executor._processes or {}).values()):
+            if process.is_alive():
+                process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.warning("추출 워커 프로세스 종료 (타임아웃/취소)")
+
+    def shutdown(self) -> None:
+        """유휴 워커 프로세스 정리 (애플리케이션/워커 종료 시 호출)"""
+        executors, self._idle = self._idle, []
+        for executor in executors:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+# 싱글톤 인스턴스
+process_pool = ProcessPool()
+
+
+async def run_in_process(func: Callable[..., T], *args: Any, timeout: float | None = None) -> T:
+    """공유 프로세스 풀에서 func(*args) 실행"""
+    return await process_pool.run(func, *args, timeout=timeout)
+
+
+def shutdown_process_pool() -> None:
+    """공유 프로세스 풀 종료"""
+    process_pool.shutdown()
@@ -1,14 +1,36 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import JSON, Boolean, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    event,
+    inspect,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TimestampMixin
+from app.utils.hard_match import bid_region_code
+from app.utils.license_taxonomy import license_taxonomy
+from app.utils.search_text import build_search_bigrams, build_search_text
 
 if TYPE_CHECKING:
     pass
 
+# PostgreSQL에서는 JSONB (포함 연산자 @> / <@ 및 GIN 인덱스 사용)
+JSONList = JSON().with_variant(JSONB(), "postgresql")
+# PostgreSQL에서는 text[] (포함 연산자 @> 및 GIN 인덱스 사용, 재확인 없이 인덱스 키와 정확히 일치)
+TextList = JSON().with_variant(ARRAY(Text), "postgresql")
+
 
 class BidAnnouncement(Base, TimestampMixin):
     """
@@ -38,11 +60,19 @@ class BidAnnouncement(Base, TimestampMixin):
     is_notified: Mapped[bool] = mapped_column(Boolean, default=False)  # Slack 알림 여부
     crawled_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)  # 크롤링 시간
     attachment_content: Mapped[str | None] = mapped_column(Text)  # OCR/Parsed content from HWP/PDF
+    # 정규화한 "제목\n본문\n첨부파일 앞부분" (저장/수정 시 갱신, 키워드·면허 매칭 대상)
+    search_text: Mapped[str | None] = mapped_column(Text)
+    # search_text의 2글자 조각 (2글자 검색어용 GIN 인덱스 키, search_text와 함께 갱신)
+    search_bigrams: Mapped[list[str] | None] = mapped_column(TextList)
 
     # Phase 3: Hard Match용 제약 조건
     region_code: Mapped[str | None] = mapped_column(String, index=True)  # 공사 현장 지역 코드 (서울: 11 등)
     min_performance: Mapped[float | None] = mapped_column(Float, default=0.0)  # 최소 실적 요건(금액)
-    license_requirements: Mapped[list[str] | None] = mapped_column(JSON, default=list)  # 필요 면허 목록
+    license_requirements: Mapped[list[str] | None] = mapped_column(JSONList, default=list)  # 필요 면허 목록
+    # Hard Match 비교 키 (저장/수정 시 app.utils.hard_match 규칙으로 갱신, SQL 매칭 대상)
+    match_region_code: Mapped[str | None] = mapped_column(String(2), index=True)  # None: 지역 제한 없음
+    # 요구 면허 비트마스크 (app.utils.license_taxonomy, 면허 조건: license_mask & 미보유 비트 = 0)
+    license_mask: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
 
     # Phase 2 추가 필드 (Kanban 상태 관리)
     status: Mapped[str] = mapped_column(String, default="new", index=True)  # new, reviewing, bidding, completed
@@ -63,6 +93,60 @@ class BidAnnouncement(Base, TimestampMixin):
         return f"<BidAnnouncement(id={self.id}, title='{self.title}')>"
 
 
+_SEARCH_TEXT_SOURCES = ("title", "content", "attachment_content")
+_MATCH_KEY_SOURCES = (*_SEARCH_TEXT_SOURCES, "agency", "region_code", "license_requirements")
+
+
+def _build_search_columns(target: BidAnnouncement) -> None:
+    target.search_text = build_search_text(target.title, target.content, target.attachment_content)
+    target.search_bigrams = build_search_bigrams(target.search_text)
+
+
+def _set_match_keys(target: BidAnnouncement) -> None:
+    target.match_region_code = bid_region_code(target.region_code, target.agency, target.title)
+    target.license_mask = license_taxonomy.required_mask(target.license_requirements, target.search_text)
+
+
+@event.listens_for(BidAnnouncement, "before_insert")
+def _set_search_text(mapper, connection, target: BidAnnouncement) -> None:
+    """ORM 저장 시 검색 텍스트 / Hard Match 비교 키 생성 (일괄 INSERT는 BidRepository.bulk_insert_new에서 생성)"""
+    _build_search_columns(target)
+    _set_match_keys(target)
+
+
+@event.listens_for(BidAnnouncement, "before_update")
+def _refresh_search_text(mapper, connection, target: BidAnnouncement) -> None:
+    """제목/본문/첨부파일 내용이 바뀐 경우에만 검색 텍스트 갱신 (기관명/지역/면허 요건 포함 시 비교 키도 갱신)"""
+    state = inspect(target)
+    if any(state.attrs[name].history.has_changes() for name in _SEARCH_TEXT_SOURCES):
+        _build_search_columns(target)
+    if any(state.attrs[name].history.has_changes() for name in _MATCH_KEY_SOURCES):
+        _set_match_keys(target)
+
+
+class BidMatch(Base, TimestampMixin):
+    """
+    공고-사용자 Hard Match 결과 (매칭 피드 GET /bids/matched)
+
+    신규 공고 수집 시 MatchPercolator가 매칭되는 프로필을 찾아 채우고,
+    프로필 수정 시 해당 사용자 행만 다시 계산합니다.
+    """
+
+    __tablename__ = "bid_matches"
+    # 재매칭/신규 공고 매칭의 INSERT ... ON CONFLICT (user_id, bid_id) 대상
+    __table_args__ = (UniqueConstraint("user_id", "bid_id", name="uq_bid_matches_user_bid"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    bid_id: Mapped[int] = mapped_column(Integer, ForeignKey("bid_announcements.id", ondelete="CASCADE"), nullable=False)
+    posted_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)  # 공고 게시일 (피드 정렬 / 커서)
+    hard_score: Mapped[float] = mapped_column(Float, default=1.0)  # Hard Match 점수 (저장된 행은 모두 통과: 1.0)
+    soft_score: Mapped[int] = mapped_column(Integer, default=0)  # Soft Match 점수 0~100 (키워드/지역/중요도)
+
+    def __repr__(self):
+        return f"<BidMatch(user_id={self.user_id}, bid_id={self.bid_id}, soft_score={self.soft_score})>"
+
+
 class User(Base, TimestampMixin):
     """
     User Model (사용자)
@@ -161,6 +245,11 @@ class UserProfile(Base, TimestampMixin):
     is_email_enabled: Mapped[bool] = mapped_column(Boolean, default=False)  # 이메일 알림 사용 여부
     is_slack_enabled: Mapped[bool] = mapped_column(Boolean, default=False)  # Slack 알림 사용 여부
 
+    # 매칭 피드(bid_matches) 마지막 재계산 시각 (None: 지역/면허/실적이 바뀌어 재계산 필요)
+    matched_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # 보유 면허 비트마스크 (app.utils.license_taxonomy, 면허 추가/삭제 시 갱신, 표시는 licenses의 면허명)
+    license_mask: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+
     # Relationship
     user: Mapped["User"] = relationship("User", back_populates="full_profile")
     licenses: Mapped[list["UserLicense"]] = relationship(
@@ -180,6 +269,15 @@ class UserProfile(Base, TimestampMixin):
         return f"<UserProfile(id={self.id}, company_name='{self.company_name}')>"
 
 
+@event.listens_for(UserProfile, "before_insert")
+@event.listens_for(UserProfile, "before_update")
+def _set_license_mask(mapper, connection, target: UserProfile) -> None:
+    """licenses 컬렉션으로 면허를 추가/삭제한 경우 보유 면허 비트마스크 갱신 (ProfileService는 직접 갱신)"""
+    state = inspect(target)
+    if state.attrs.licenses.history.has_changes():
+        target.license_mask = license_taxonomy.mask(lic.license_name for lic in target.licenses)
+
+
 class UserLicense(Base, TimestampMixin):
     """
     User License Model (보유 면허 정보)
@@ -320,6 +418,9 @@ class CrawlerLog(Base, TimestampMixin):
     # 검색 조건
     search_params: Mapped[dict | None] = mapped_column(JSON)  # 검색 파라미터
 
+    # 단계별 소요 시간 / 처리량 (목록 수집, 첨부파일 페이지/다운로드/파싱)
+    stage_stats: Mapped[dict | None] = mapped_column(JSON)
+
     def __repr__(self):
         return f"<CrawlerLog(id={self.id}, source='{self.source}', status='{self.status}')>"
 
@@ -331,6 +432,43 @@ class CrawlerLog(Base, TimestampMixin):
         return None
 
 
+class UploadJob(Base, TimestampMixin):
+    """
+    파일 업로드 공고 생성 작업
+    POST /bids/upload로 받은 파일의 텍스트 추출 → 공고 생성 → AI 분석 진행 상태 추적
+    """
+
+    __tablename__ = "upload_jobs"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)  # uuid4 hex (상태 조회 URL에 사용)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    status: Mapped[str] = mapped_column(String, default="queued", index=True)  # queued, processing, completed, failed
+
+    # 업로드 파일
+    filename: Mapped[str] = mapped_column(String, nullable=False)
+    spool_path: Mapped[str | None] = mapped_column(String)  # 처리 전 임시 파일 경로 (처리 후 삭제)
+    file_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    sha256: Mapped[str] = mapped_column(String(64), index=True, nullable=False)
+
+    # 생성할 공고 정보
+    title: Mapped[str] = mapped_column(String, nullable=False)
+    agency: Mapped[str | None] = mapped_column(String)
+    url: Mapped[str] = mapped_column(String, nullable=False)
+
+    # 처리 결과
+    bid_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("bid_announcements.id", ondelete="SET NULL"), nullable=True
+    )
+    error: Mapped[str | None] = mapped_column(Text)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime)
+
+    def __repr__(self):
+        return f"<UploadJob(id='{self.id}', filename='{self.filename}', status='{self.status}')>"
+
+
 class ExcludeKeyword(Base, TimestampMixin):
     """
     제외 키워드 모델
@@ -1,9 +1,99 @@
-from sqlalchemy import select
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Select,
+    Text,
+    case,
+    cast,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import array as postgresql_array
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import CompileError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import BidAnnouncement
+from app.core.config import settings
+from app.db.models import BidAnnouncement, BidMatch
 from app.db.repositories.base_repository import BaseRepository
 from app.schemas.bid import BidCreate, BidUpdate
+from app.utils.hard_match import bid_region_code
+from app.utils.license_taxonomy import license_taxonomy
+from app.utils.search_text import (
+    SECTION_SEPARATOR,
+    build_search_bigrams,
+    build_search_text,
+    normalize_text,
+    search_terms,
+)
+
+# INSERT ... ON CONFLICT DO NOTHING RETURNING 을 지원하는 방언
+_ON_CONFLICT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+# 이 길이의 검색 단어는 trigram이 없어 search_bigrams GIN 인덱스로 찾음 (PostgreSQL)
+# 1글자 단어는 대부분의 공고에 있어 인덱스 이득이 없으므로 LIKE 순차 탐색
+BIGRAM_TERM_LENGTH = 2
+
+# 한 문장당 행 수 (바인드 파라미터 한도: PostgreSQL 32767, SQLite 32766)
+BULK_INSERT_CHUNK_SIZE = 500
+
+# 플래너 추정 건수 캐시: 필터가 반영된 SQL → (추정 시각, 건수). 같은 목록 조건의 페이지 요청마다 EXPLAIN하지 않음
+COUNT_ESTIMATE_CACHE_SIZE = 1024
+_count_estimates: dict[str, tuple[float, int]] = {}
+
+# 목록 정렬 → 정렬 키 컬럼 (모두 내림차순, 마지막 id로 동률 해소 / keyset 커서의 키)
+# 인덱스: ix_bid_announcements_posted_id, ix_bid_announcements_importance_id
+BID_SORTS = {
+    "latest": (BidAnnouncement.posted_at, BidAnnouncement.id),
+    "importance": (BidAnnouncement.importance_score, BidAnnouncement.id),
+}
+
+
+def bid_sort_key(bid: BidAnnouncement, sort: str) -> tuple[Any, ...]:
+    """공고의 정렬 키 (다음 페이지 커서에 담을 값)"""
+    return tuple(getattr(bid, column.key) for column in BID_SORTS[sort])
+
+
+def bid_sort_types(sort: str) -> tuple[type, ...]:
+    """정렬 키 각 값의 Python 타입 (커서 해석용)"""
+    return tuple(column.type.python_type for column in BID_SORTS[sort])
+
+
+def _paginate(query: Select, columns: tuple, skip: int, limit: int, after: tuple | None) -> Select:
+    """
+    내림차순 정렬 + 페이지
+
+    after(직전 페이지 마지막 행의 정렬 키)가 있으면 (키) < (after) 조건으로 인덱스에서 바로 이어 읽고,
+    없으면 기존 OFFSET을 사용합니다.
+    """
+    if after is not None:
+        bounds = [literal(value, column.type) for value, column in zip(after, columns, strict=True)]
+        query = query.where(tuple_(*columns) < tuple_(*bounds))
+    elif skip:
+        query = query.offset(skip)
+    return query.order_by(*(column.desc() for column in columns)).limit(limit)
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class BidPage(Generic[T]):
+    """목록 한 페이지 + 조건에 맞는 전체 건수"""
+
+    items: list[T]
+    total: int
+    total_exact: bool  # False면 플래너 추정치
 
 
 class BidRepository(BaseRepository[BidAnnouncement, BidCreate, BidUpdate]):
@@ -15,26 +105,272 @@ class BidRepository(BaseRepository[BidAnnouncement, BidCreate, BidUpdate]):
         result = await self.session.execute(query)
         return result.scalars().first()
 
+    async def bulk_insert_new(self, rows: list[dict]) -> dict[str, int]:
+        """
+        공고 일괄 저장 (url 중복은 건너뜀)
+
+        PostgreSQL / SQLite는 `INSERT ... ON CONFLICT (url) DO NOTHING RETURNING id, url`
+        한 문장으로 저장하므로 동시에 실행된 크롤링과 url이 겹쳐도 실패하지 않습니다.
+        그 외 방언은 기존 url 조회 후 신규 행만 추가합니다.
+        커밋은 호출자가 담당합니다.
+
+        Returns:
+            실제로 삽입된 공고의 {url: id}
+        """
+        rows = self._normalize_rows(rows)
+        if not rows:
+            return {}
+
+        insert = _ON_CONFLICT_INSERTS.get(self.session.bind.dialect.name)
+        if insert is None:
+            return await self._insert_missing(rows)
+
+        inserted: dict[str, int] = {}
+        for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+            stmt = (
+                insert(BidAnnouncement)
+                .values(rows[start : start + BULK_INSERT_CHUNK_SIZE])
+                .on_conflict_do_nothing(index_elements=["url"])
+                .returning(BidAnnouncement.id, BidAnnouncement.url)
+            )
+            result = await self.session.execute(stmt)
+            inserted.update({url: bid_id for bid_id, url in result.all()})
+        return inserted
+
+    async def _insert_missing(self, rows: list[dict]) -> dict[str, int]:
+        """ON CONFLICT 미지원 방언용: 기존 url 일괄 조회 후 신규 행만 추가"""
+        result = await self.session.execute(
+            select(BidAnnouncement.url).where(BidAnnouncement.url.in_([row["url"] for row in rows]))
+        )
+        existing_urls = set(result.scalars().all())
+
+        new_bids = [BidAnnouncement(**row) for row in rows if row["url"] not in existing_urls]
+        for bid in new_bids:
+            self.session.add(bid)
+        await self.session.flush()
+        return {bid.url: bid.id for bid in new_bids}
+
+    @staticmethod
+    def _normalize_rows(rows: list[dict]) -> list[dict]:
+        """
+        모델 컬럼만 남기고 url 기준으로 중복 제거, 검색 텍스트(search_text) / Hard Match 비교 키 생성
+
+        다중 VALUES 문은 모든 행의 키가 같아야 하므로 일부 행에만 있는 컬럼
+        (예: attachment_content)은 나머지 행에 None으로 채웁니다.
+        """
+        columns = BidAnnouncement.__table__.columns.keys()
+        unique_rows = {}
+        for row in rows:
+            if row.get("url") and row["url"] not in unique_rows:
+                unique_row = {k: v for k, v in row.items() if k in columns}
+                unique_row["search_text"] = build_search_text(
+                    row.get("title"), row.get("content"), row.get("attachment_content")
+                )
+                unique_row["search_bigrams"] = build_search_bigrams(unique_row["search_text"])
+                unique_row["match_region_code"] = bid_region_code(
+                    row.get("region_code"), row.get("agency"), row.get("title")
+                )
+                unique_row["license_mask"] = license_taxonomy.required_mask(
+                    row.get("license_requirements"), unique_row["search_text"]
+                )
+                unique_rows[row["url"]] = unique_row
+
+        keys = {k for row in unique_rows.values() for k in row}
+        return [{k: row.get(k) for k in keys} for row in unique_rows.values()]
+
     async def get_multi_with_filters(
         self,
         skip: int = 0,
         limit: int = 100,
         keyword: str | None = None,
         agency: str | None = None,
+        sort: str = "latest",
+        after: tuple | None = None,
     ) -> list[BidAnnouncement]:
+        """
+        공고 목록 (sort 정렬 키 내림차순)
+
+        Args:
+            after: 직전 페이지 마지막 공고의 정렬 키 (bid_sort_key). 지정하면 skip 대신 keyset 조회
+        """
+        query = _paginate(self._filter_query(keyword, agency), BID_SORTS[sort], skip, limit, after)
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def get_page_with_filters(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        keyword: str | None = None,
+        agency: str | None = None,
+        sort: str = "latest",
+        after: tuple | None = None,
+        position: int = 0,
+    ) -> BidPage[BidAnnouncement]:
+        """get_multi_with_filters + 조건에 맞는 전체 건수 (position: 커서 이전까지 반환한 건수)"""
+        query = self._filter_query(keyword, agency)
+        rows, total, exact = await self._fetch_page(query, BID_SORTS[sort], skip, limit, after, position)
+        return BidPage([row[0] for row in rows], total, exact)
+
+    async def search(
+        self,
+        keyword: str,
+        skip: int = 0,
+        limit: int = 100,
+        agency: str | None = None,
+        sort: str | None = None,
+        after: tuple | None = None,
+    ) -> list[tuple[BidAnnouncement, float]]:
+        """
+        키워드 검색 (관련도순)
+
+        정규화한 검색 단어가 모두 search_text에 포함된 공고를 찾습니다.
+        PostgreSQL은 pg_trgm GIN 인덱스(ix_bid_announcements_search_text_trgm)로 LIKE '%단어%' 조건을
+        인덱스 탐색하고, 그 외 방언(SQLite 테스트)은 같은 SQL을 순차 탐색합니다.
+        trigram이 없는 2글자 단어('소방', '전기')는 LIKE 대신 저장된 2글자 조각 배열의
+        GIN 인덱스(ix_bid_announcements_search_bigrams)로 search_bigrams @> 조건을 찾습니다.
+
+        관련도: 단어마다 제목에 있으면 2점, 본문/첨부에만 있으면 1점, 여러 단어가 입력 순서대로
+        이어 나오면 1점 추가 → 최대 점수로 나눠 0~1. 같은 점수는 게시일 최신순.
+
+        Args:
+            sort: None이면 관련도순, 아니면 BID_SORTS 정렬
+            after: 직전 페이지 마지막 결과의 정렬 키 (관련도순이면 (관련도, posted_at, id))
+
+        Returns:
+            [(공고, 관련도)]
+        """
+        built = self._search_query(keyword, agency, sort)
+        if built is None:
+            return []
+        query, columns = built
+        result = await self.session.execute(_paginate(query, columns, skip, limit, after))
+        return [(bid, float(rank)) for bid, rank in result.all()]
+
+    async def search_page(
+        self,
+        keyword: str,
+        skip: int = 0,
+        limit: int = 100,
+        agency: str | None = None,
+        sort: str | None = None,
+        after: tuple | None = None,
+        position: int = 0,
+    ) -> BidPage[tuple[BidAnnouncement, float]]:
+        """search + 조건에 맞는 전체 건수 (position: 커서 이전까지 반환한 건수)"""
+        built = self._search_query(keyword, agency, sort)
+        if built is None:
+            return BidPage([], 0, True)
+        query, columns = built
+        rows, total, exact = await self._fetch_page(query, columns, skip, limit, after, position)
+        return BidPage([(bid, float(rank)) for bid, rank in rows], total, exact)
+
+    def _filter_query(self, keyword: str | None, agency: str | None) -> Select:
         query = select(BidAnnouncement)
 
         if keyword:
-            query = query.where(
-                (BidAnnouncement.title.ilike(f"%{keyword}%")) | (BidAnnouncement.content.ilike(f"%{keyword}%"))
-            )
+            query = query.where(BidAnnouncement.search_text.contains(normalize_text(keyword), autoescape=True))
 
         if agency:
             query = query.where(BidAnnouncement.agency.ilike(f"%{agency}%"))
 
-        query = query.offset(skip).limit(limit)
-        result = await self.session.execute(query)
-        return result.scalars().all()
+        return query
+
+    def _search_query(self, keyword: str, agency: str | None, sort: str | None) -> tuple[Select, tuple] | None:
+        """검색 쿼리 (공고, 관련도)와 정렬 키 컬럼. 검색 단어가 없으면 None"""
+        terms = search_terms(keyword)
+        if not terms:
+            return None
+
+        text = BidAnnouncement.search_text
+        is_postgresql = self.session.bind.dialect.name == "postgresql"
+        position = func.strpos if is_postgresql else func.instr
+        # 첫 구분자 위치 = 제목 끝 (본문이 없으면 구분자를 붙여 전체를 제목으로)
+        title_end = position(text + SECTION_SEPARATOR, SECTION_SEPARATOR)
+
+        score = sum(case((position(text, term) < title_end, 2), else_=1) for term in terms)
+        max_score = 2 * len(terms)
+        if len(terms) > 1:
+            score = score + case((text.contains(" ".join(terms), autoescape=True), 1), else_=0)
+            max_score += 1
+        rank = cast(score, Float) / max_score
+
+        query = select(BidAnnouncement, rank.label("rank"))
+        # 2글자 단어는 pg_trgm 인덱스가 전체 탐색이 되므로 bigram 배열 포함 조건으로 (공백 없는 단어라 LIKE와 동치)
+        short = [term for term in terms if len(term) == BIGRAM_TERM_LENGTH] if is_postgresql else []
+        query = query.where(*(text.contains(term, autoescape=True) for term in terms if term not in short))
+        if short:
+            query = query.where(BidAnnouncement.search_bigrams.op("@>")(cast(postgresql_array(short), ARRAY(Text))))
+        if agency:
+            query = query.where(BidAnnouncement.agency.ilike(f"%{agency}%"))
+
+        columns = (rank, BidAnnouncement.posted_at, BidAnnouncement.id) if sort is None else BID_SORTS[sort]
+        return query, columns
+
+    async def _fetch_page(
+        self, query: Select, columns: tuple, skip: int, limit: int, after: tuple | None, position: int
+    ) -> tuple[list[tuple], int, bool]:
+        """
+        한 페이지 + query 조건에 맞는 전체 건수
+
+        추정 건수가 BID_COUNT_EXACT_THRESHOLD 이하이면(추정할 수 없는 방언 포함) 같은 쿼리에
+        count(*) OVER ()를 붙여 정확한 건수를 함께 받습니다 (별도 count 쿼리 없음).
+        커서 조회의 윈도우 건수는 커서 이후 남은 건수이므로 position을 더합니다.
+        추정 건수가 더 크면 추정치를 그대로 사용해 대량 결과의 전체 스캔을 피합니다.
+
+        Returns:
+            (행 목록 (건수 컬럼 제외), 전체 건수, 정확한 건수 여부)
+        """
+        offset = position if after is not None else skip
+        estimate = await self.estimate_count(query)
+        if estimate is not None and estimate > settings.BID_COUNT_EXACT_THRESHOLD:
+            result = await self.session.execute(_paginate(query, columns, skip, limit, after))
+            rows = [tuple(row) for row in result.all()]
+            return rows, max(estimate, offset + len(rows)), False
+
+        counted = query.add_columns(func.count().over().label("total_count"))
+        result = await self.session.execute(_paginate(counted, columns, skip, limit, after))
+        rows = [tuple(row) for row in result.all()]
+        if rows:
+            total = rows[0][-1] + (offset if after is not None else 0)
+        elif after is not None or not skip:
+            total = offset
+        else:
+            # OFFSET이 끝을 넘은 빈 페이지는 윈도우 결과가 없으므로 따로 셈
+            total = await self.session.scalar(select(func.count()).select_from(query.subquery()))
+        return [row[:-1] for row in rows], total, True
+
+    async def estimate_count(self, query: Select) -> int | None:
+        """
+        query 결과 행 수의 플래너 추정치 (PostgreSQL EXPLAIN, 실행하지 않음)
+
+        통계 기반이므로 ANALYZE 주기만큼 오차가 있습니다. 그 외 방언은 None.
+        같은 조건(필터 값 포함 SQL)의 추정치는 BID_COUNT_ESTIMATE_TTL초 동안 재사용하여
+        페이지 요청마다 EXPLAIN 왕복을 하지 않습니다.
+        """
+        dialect = self.session.bind.dialect
+        if dialect.name != "postgresql":
+            return None
+        try:
+            sql = str(query.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+        except CompileError:
+            return None
+        now = time.monotonic()
+        cached = _count_estimates.get(sql)
+        if cached and now - cached[0] < settings.BID_COUNT_ESTIMATE_TTL:
+            return cached[1]
+
+        connection = await self.session.connection()
+        plan = (await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        estimate = int(plan[0]["Plan"]["Plan Rows"])
+
+        _count_estimates.pop(sql, None)
+        if len(_count_estimates) >= COUNT_ESTIMATE_CACHE_SIZE:
+            _count_estimates.pop(next(iter(_count_estimates)))  # 가장 오래전에 추정한 조건
+        _count_estimates[sql] = (now, estimate)
+        return estimate
 
     async def get_hard_matches(
         self,
@@ -43,57 +379,102 @@ class BidRepository(BaseRepository[BidAnnouncement, BidCreate, BidUpdate]):
         user_licenses: list[str] = [],
         skip: int = 0,
         limit: int = 100,
+        after: tuple | None = None,
     ) -> list[BidAnnouncement]:
         """
         Hard Match Engine: Zero-Error Filtering
-        - Region: Bid must be in user's region OR '전국' OR None
-        - Performance: Bid req <= User capacity
-        - Licenses: Bid requirements must be subset of User licenses
+        - Region: Bid must be in user's region OR '전국' OR None (match_region_code)
+        - Performance: Bid req (min_performance) <= User capacity
+        - Licenses: Bid requirements must be subset of User licenses (license_mask & 미보유 비트 = 0)
+        - Order: posted_at, id 내림차순 (after: 직전 페이지 마지막 공고의 "latest" 정렬 키)
         """
-        query = select(BidAnnouncement)
+        query = self._hard_match_query(region_code, user_licenses).where(
+            (BidAnnouncement.min_performance <= user_performance_amount) | (BidAnnouncement.min_performance.is_(None))
+        )
+        result = await self.session.execute(_paginate(query, BID_SORTS["latest"], skip, limit, after))
+        return list(result.scalars().all())
 
-        # 1. Region Filter
-        if region_code:
-            query = query.where(
-                (BidAnnouncement.region_code == region_code)
-                | (BidAnnouncement.region_code == "전국")
-                | (BidAnnouncement.region_code.is_(None))
-            )
+    def hard_match_query(self, region_code: str | None, max_performance: float, user_licenses: list[str]) -> Select:
+        """
+        HardMatchEngine과 같은 규칙의 지역 + 면허 + 실적 조건 (정렬/페이지 미적용)
 
-        # 2. Performance Filter (Bid req <= User cap)
-        # 0 or None means no limit
-        query = query.where(
-            (BidAnnouncement.min_performance <= user_performance_amount) | (BidAnnouncement.min_performance.is_(None))
+        - 지역: 공고 지역이 없거나(전국) 사용자 지역과 같음 (region_code가 None이면 제한 없음)
+        - 면허: 공고 요구 면허 비트가 모두 보유 면허 비트에 포함됨
+        - 실적: 추정가가 없거나(0 이하 포함) 추정가의 50% <= 최대 실적
+        """
+        price = BidAnnouncement.estimated_price
+        return self._hard_match_query(region_code, user_licenses).where(
+            or_(price.is_(None), price <= 0, price * 0.5 <= max_performance)
         )
 
-        # 3. License Filter (Postgres JSON containment)
-        # Bid reqs (A) must be contained in User licenses (B) => A <@ B
-        # Standard SQL fallback: We will filter in Python if JSONB is not guaranteed,
-        # but for now let's apply SQL filter if possible.
-        # Ideally: Bid.license_requirements.contained_by(user_licenses)
-        # Using Python filter for safety across DBs (and assuming list size is manageable)
+    async def get_hard_match_batch(self, query: Select, limit: int, after: tuple | None) -> list[BidAnnouncement]:
+        """hard_match_query 결과를 게시일 최신순으로 limit건씩 (after: 직전 묶음 마지막 공고의 "latest" 키)"""
+        result = await self.session.execute(_paginate(query, BID_SORTS["latest"], 0, limit, after))
+        return list(result.scalars().all())
 
-        # Optimization: Fetch candidates first, then filter licenses in Python
-        # This avoids complex JSON SQL dialect issues for now.
+    async def get_match_feed_page(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        after: tuple | None = None,
+        position: int = 0,
+    ) -> BidPage[tuple[BidAnnouncement, int]]:
+        """
+        사용자의 매칭 피드 (bid_matches, 게시일 최신순) + 전체 건수
 
-        result = await self.session.execute(query.order_by(BidAnnouncement.id.desc()).offset(skip).limit(limit))
-        candidates = result.scalars().all()
+        Returns:
+            BidPage[(공고, Soft Match 점수)]
+        """
+        query = (
+            select(BidAnnouncement, BidMatch.soft_score)
+            .join(BidMatch, BidMatch.bid_id == BidAnnouncement.id)
+            .where(BidMatch.user_id == user_id)
+        )
+        rows, total, exact = await self._fetch_page(
+            query, (BidMatch.posted_at, BidMatch.bid_id), skip, limit, after, position
+        )
+        return BidPage([tuple(row) for row in rows], total, exact)
 
-        if not user_licenses:
-            # If user has NO licenses, they can only do bids with NO requirements
-            return [bid for bid in candidates if not bid.license_requirements]
+    async def upsert_matches(self, rows: list[dict]) -> None:
+        """
+        bid_matches 일괄 저장 ((user_id, bid_id)가 이미 있으면 게시일/점수만 갱신)
 
-        # Filter: Bid reqs must be subset of User licenses
-        final_matches = []
-        user_license_set = set(user_licenses)
+        PostgreSQL / SQLite는 `INSERT ... ON CONFLICT (user_id, bid_id) DO UPDATE`로 저장하므로
+        같은 공고를 동시에 다시 매칭하거나 재매칭과 신규 공고 매칭이 겹쳐도 실패하지 않습니다.
+        커밋은 호출자가 담당합니다.
+        """
+        insert = _ON_CONFLICT_INSERTS.get(self.session.bind.dialect.name)
+        for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+            chunk = rows[start : start + BULK_INSERT_CHUNK_SIZE]
+            if insert is None:
+                await self.session.execute(BidMatch.__table__.insert(), chunk)
+                continue
+            stmt = insert(BidMatch).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id", "bid_id"],
+                set_={
+                    "posted_at": stmt.excluded.posted_at,
+                    "hard_score": stmt.excluded.hard_score,
+                    "soft_score": stmt.excluded.soft_score,
+                    "updated_at": func.now(),
+                },
+            )
+            await self.session.execute(stmt)
 
-        for bid in candidates:
-            bid_reqs = bid.license_requirements or []
-            # Check subset
-            if all(req in user_license_set for req in bid_reqs):
-                final_matches.append(bid)
+    def _hard_match_query(self, region_code: str | None, user_licenses: list[str]) -> Select:
+        """지역 + 면허 조건 (저장된 비교 키 match_region_code / license_mask 사용)"""
+        query = select(BidAnnouncement)
+        if region_code:
+            query = query.where(
+                or_(BidAnnouncement.match_region_code.is_(None), BidAnnouncement.match_region_code == region_code)
+            )
+        return query.where(self._licenses_covered(license_taxonomy.mask(user_licenses)))
 
-        return final_matches
+    @staticmethod
+    def _licenses_covered(owned_mask: int) -> ColumnElement[bool]:
+        """공고 요구 면허 비트가 모두 보유 비트에 포함 (license_mask & 미보유 비트 = 0, 요구 면허가 없으면 통과)"""
+        return BidAnnouncement.license_mask.bitwise_and(license_taxonomy.missing(owned_mask)) == 0
 
     async def update_processing_status(self, bid_id: int, processed: bool) -> BidAnnouncement | None:
         bid = await self.get(bid_id)
@@ -1,8 +1,39 @@
+"""
+DB 엔진 / 세션
+
+- primary: 모든 쓰기와 일반 조회 (get_db / DbSession)
+- replica: DATABASE_READ_URL이 있으면 읽기 전용 엔진을 따로 만들어, 쓰기와 풀을 나눠 쓰는 조회
+  (공고 목록, 통계, 엑셀 내보내기)가 get_read_db / ReadDbSession으로 사용
+- 복제 지연이 DB_REPLICA_MAX_LAG_SECONDS를 넘거나 복제본 확인에 실패하면 읽기도 primary 사용
+  (DB_REPLICA_CHECK_INTERVAL초마다 다시 확인)
+- 풀별 Prometheus 메트릭 (pool 라벨: primary / replica): 사용 중 연결 수, 체크아웃 수, 새 연결 수
+"""
+
+import asyncio
 import os
+import time
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
+from app.core.logging import logger
+from app.core.metrics import (
+    DB_POOL_CHECKOUTS_TOTAL,
+    DB_POOL_CONNECTIONS_IN_USE,
+    DB_POOL_CONNECTS_TOTAL,
+    DB_READ_ROUTES_TOTAL,
+    DB_REPLICA_LAG_SECONDS,
+)
+
+# 복제본 확인 쿼리 제한 시간 (초, 초과 시 이번 주기는 primary 사용)
+REPLICA_CHECK_TIMEOUT = 2.0
+
+# 복제본의 마지막 적용 트랜잭션 이후 경과 시간. 받은 WAL을 모두 적용했으면 0 (쓰기가 없는 동안 지연이 커지지 않도록)
+REPLICA_LAG_SQL = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
 
 engine = create_async_engine(
     settings.SQLALCHEMY_DATABASE_URI,
@@ -23,6 +54,134 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+read_engine = (
+    create_async_engine(
+        settings.DATABASE_READ_URL,
+        echo=settings.SQL_ECHO,
+        future=True,
+        pool_size=settings.DB_READ_POOL_SIZE,
+        max_overflow=settings.DB_READ_MAX_OVERFLOW,
+        pool_timeout=30,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+    )
+    if settings.DATABASE_READ_URL
+    else None
+)
+
+ReadSessionLocal = (
+    async_sessionmaker(
+        bind=read_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+    if read_engine
+    else None
+)
+
+
+def instrument_pool(async_engine: AsyncEngine, pool: str) -> None:
+    """커넥션 풀 이벤트 → Prometheus 메트릭"""
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _connect(dbapi_connection, connection_record) -> None:
+        DB_POOL_CONNECTS_TOTAL.labels(pool=pool).inc()
+
+    @event.listens_for(async_engine.sync_engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        DB_POOL_CHECKOUTS_TOTAL.labels(pool=pool).inc()
+        DB_POOL_CONNECTIONS_IN_USE.labels(pool=pool).inc()
+
+    @event.listens_for(async_engine.sync_engine, "checkin")
+    def _checkin(dbapi_connection, connection_record) -> None:
+        DB_POOL_CONNECTIONS_IN_USE.labels(pool=pool).dec()
+
+
+instrument_pool(engine, "primary")
+if read_engine:
+    instrument_pool(read_engine, "replica")
+
+
+async def replica_lag(session: AsyncSession) -> float:
+    """복제 지연 (초). PostgreSQL이 아니면 (테스트용 SQLite 등) 0"""
+    if session.bind.dialect.name != "postgresql":
+        return 0.0
+    return float(await session.scalar(REPLICA_LAG_SQL) or 0.0)
+
+
+class ReplicaRouter:
+    """
+    읽기 세션 라우팅
+
+    복제본 상태(지연 / 연결 가능 여부)는 check_interval초 동안 재사용하여 요청마다 확인 쿼리를 보내지 않습니다.
+    reason: replica(복제본 사용), lagging(지연 초과), unavailable(확인 실패), disabled(복제본 미설정)
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker,
+        replica: async_sessionmaker | None,
+        max_lag: float,
+        check_interval: float,
+    ):
+        self.primary = primary
+        self.replica = replica
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.reason = "replica" if replica else "disabled"
+        self.lag: float | None = None
+        self._checked_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def sessionmaker(self) -> async_sessionmaker:
+        """이번 읽기 요청에 쓸 세션 팩토리"""
+        if self.replica is not None and self._stale():
+            async with self._lock:
+                if self._stale():
+                    self.reason = await self._check()
+                    self._checked_at = time.monotonic()
+
+        use_replica = self.reason == "replica"
+        DB_READ_ROUTES_TOTAL.labels(pool="replica" if use_replica else "primary", reason=self.reason).inc()
+        return self.replica if use_replica else self.primary
+
+    def _stale(self) -> bool:
+        return self._checked_at is None or time.monotonic() - self._checked_at >= self.check_interval
+
+    async def _check(self) -> str:
+        try:
+            async with self.replica() as session:
+                lag = await asyncio.wait_for(replica_lag(session), timeout=REPLICA_CHECK_TIMEOUT)
+        except Exception as e:
+            if self.reason != "unavailable":
+                logger.warning(f"읽기 복제본 확인 실패, primary로 전환: {e}")
+            self.lag = None
+            return "unavailable"
+
+        self.lag = lag
+        DB_REPLICA_LAG_SECONDS.set(lag)
+        if lag > self.max_lag:
+            if self.reason != "lagging":
+                logger.warning(f"읽기 복제본 지연 {lag:.1f}초 > {self.max_lag}초, primary로 전환")
+            return "lagging"
+        if self.reason != "replica":
+            logger.info(f"읽기 복제본 사용 재개 (지연 {lag:.1f}초)")
+        return "replica"
+
+    def status(self) -> dict:
+        return {"reason": self.reason, "lag_seconds": self.lag}
+
+
+# 싱글톤 인스턴스
+replica_router = ReplicaRouter(
+    AsyncSessionLocal,
+    ReadSessionLocal,
+    max_lag=settings.DB_REPLICA_MAX_LAG_SECONDS,
+    check_interval=settings.DB_REPLICA_CHECK_INTERVAL,
+)
+
 
 async def get_db() -> AsyncSession:
     """
@@ -33,3 +192,15 @@ async def get_db() -> AsyncSession:
             yield session
         finally:
             await session.close()
+
+
+async def get_read_db() -> AsyncSession:
+    """
+    Dependency for getting read-only async session (replica, primary if lagging/unavailable/not configured)
+    """
+    maker = await replica_router.sessionmaker()
+    async with maker() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
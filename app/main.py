@@ -423,6 +423,12 @@ async def startup():
         await taskiq_startup()
         logger.info("taskiq_initialized")
 
+        # 업로드 스풀: Taskiq 워커와 같은 디렉터리를 보는지 확인 (다르면 시작 중단)
+        from app.services.upload_service import upload_service
+
+        await upload_service.verify_shared_spool("api")
+        logger.info("upload_spool_verified")
+
         logger.info("application_startup_complete")
     except Exception as e:
         logger.error("startup_failed", error=str(e))
@@ -440,6 +446,18 @@ async def shutdown():
     await taskiq_shutdown()
     logger.info("taskiq_stopped")
 
+    # 외부 API 공유 HTTP 클라이언트 풀 정리
+    from app.core.http_client import close_http_clients
+
+    await close_http_clients()
+    logger.info("http_clients_closed")
+
+    # PDF/HWP 추출 프로세스 풀 정리
+    from app.core.process_pool import shutdown_process_pool
+
+    shutdown_process_pool()
+    logger.info("process_pool_stopped")
+
 
 # Force reload for CORS update
 
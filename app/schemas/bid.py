@@ -68,6 +68,13 @@ class BidResponse(BidBase):
     # 담당자 정보 (relationship)
     assignee: UserBasicInfo | None = None
 
+    # 키워드 검색 시에만 (관련도 0~1, 적중 단어를 <mark>로 표시한 HTML 이스케이프 미리보기)
+    search_rank: float | None = None
+    snippet: str | None = None
+
+    # 매칭 피드(/bids/matched)에서만 (Soft Match 점수 0~100: 키워드/지역/중요도)
+    match_score: int | None = None
+
     model_config = {"from_attributes": True}
 
 
@@ -108,5 +115,26 @@ class BidListResponse(BaseModel):
 
     items: list[BidResponse]
     total: int
+    total_exact: bool = Field(default=True, description="False면 total은 추정치 (조건에 맞는 공고가 매우 많은 경우)")
     skip: int
     limit: int
+    next_cursor: str | None = Field(
+        default=None, description="다음 페이지 커서 (cursor 파라미터로 전달, 없으면 마지막 페이지)"
+    )
+
+
+class UploadJobResponse(BaseModel):
+    """파일 업로드 공고 생성 작업 상태"""
+
+    job_id: str = Field(..., validation_alias="id", description="작업 ID")
+    status: str = Field(..., description="작업 상태 (queued, processing, completed, failed)")
+    filename: str
+    file_size: int = Field(..., description="파일 크기 (bytes)")
+    sha256: str = Field(..., description="파일 SHA-256")
+    bid_id: int | None = Field(default=None, description="생성된 공고 ID (completed)")
+    error: str | None = Field(default=None, description="실패 사유 (failed)")
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    model_config = {"from_attributes": True, "populate_by_name": True}
@@ -0,0 +1,277 @@
+"""
+첨부파일 추출 텍스트 캐시 (내용 주소 기반)
+
+같은 첨부파일이 크롤링마다, 그리고 정정 공고마다 다시 다운로드/파싱되는 것을 막습니다.
+
+- 텍스트 캐시: 파일 바이트의 SHA-256 → 추출 텍스트
+  (URL이 달라도 내용이 같으면 재파싱하지 않음)
+- URL 검증자: 첨부 URL → (ETag, Last-Modified, SHA-256)
+  (다음 크롤링에서 조건부 GET을 보내 304 Not Modified면 다운로드 자체를 생략)
+- 저장소: 로컬 디스크 (ATTACHMENT_CACHE_MAX_MB 초과 시 오래 쓰이지 않은 항목부터 삭제)
+  + 선택적으로 Redis (ATTACHMENT_CACHE_REDIS, 여러 워커가 공유)
+- 메트릭: cache_hits_total / cache_misses_total / cache_size_bytes
+  (cache_type=attachment_disk, attachment_redis, attachment_not_modified / attachment)
+
+디스크 LRU 인덱스는 프로세스별로 유지되며, 재시작 시 파일 수정 시각(조회 시 갱신) 순서로 복원합니다.
+여러 프로세스가 같은 디렉터리를 쓰는 경우 크기 상한은 근사치입니다.
+
+사용법:
+    from app.services.attachment_cache import attachment_cache, content_hash
+
+    text = await attachment_cache.get_text(content_hash(content))
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.metrics import CACHE_SIZE_BYTES, record_cache_hit, record_cache_miss
+
+REDIS_KEY_PREFIX = "attachment"
+
+
+def content_hash(content: bytes) -> str:
+    """파일 바이트의 SHA-256 (텍스트 캐시 키)"""
+    return hashlib.sha256(content).hexdigest()
+
+
+@dataclass
+class AttachmentValidator:
+    """첨부 URL의 마지막 응답 검증자와 그 응답 내용의 해시"""
+
+    sha256: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """조건부 GET 요청 헤더 (If-None-Match / If-Modified-Since)"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class AttachmentTextCache:
+    """
+    디스크(LRU) + 선택적 Redis 2단 캐시
+
+    디스크 입출력은 워커 스레드에서 실행하며, Redis 오류는 캐시 미스로 처리합니다.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        max_bytes: int | None = None,
+        use_redis: bool | None = None,
+        enabled: bool | None = None,
+    ):
+        self._directory = Path(directory) if directory is not None else None
+        self._max_bytes = max_bytes
+        self._use_redis = use_redis
+        self._enabled = enabled
+        # 디스크 항목 (경로 → 크기), 오래 쓰이지 않은 순서
+        self._index: OrderedDict[Path, int] | None = None
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled if self._enabled is not None else settings.ATTACHMENT_CACHE_ENABLED
+
+    @property
+    def directory(self) -> Path:
+        if self._directory is not None:
+            return self._directory
+        if settings.ATTACHMENT_CACHE_DIR:
+            return Path(settings.ATTACHMENT_CACHE_DIR)
+        return Path(tempfile.gettempdir()) / "biz-retriever" / "attachment-cache"
+
+    @property
+    def max_bytes(self) -> int:
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return max(0, settings.ATTACHMENT_CACHE_MAX_MB) * 1024 * 1024
+
+    @property
+    def use_redis(self) -> bool:
+        return self._use_redis if self._use_redis is not None else settings.ATTACHMENT_CACHE_REDIS
+
+    # ------------------------------------------------------------------
+    # 텍스트 캐시 (SHA-256 → 추출 텍스트)
+    # ------------------------------------------------------------------
+
+    async def get_text(self, sha256: str) -> str | None:
+        """추출 텍스트 조회 (디스크 → Redis 순서, Redis 적중 시 디스크에도 저장)"""
+        if not self.enabled:
+            return None
+        path = self._text_path(sha256)
+        text = await asyncio.to_thread(self._read, path)
+        if text is not None:
+            record_cache_hit("attachment_disk")
+            return text
+
+        if self.use_redis:
+            text = await self._redis_get(f"{REDIS_KEY_PREFIX}:text:{sha256}")
+            if text is not None:
+                record_cache_hit("attachment_redis")
+                await asyncio.to_thread(self._write, path, text)
+                return text
+
+        record_cache_miss("attachment")
+        return None
+
+    async def put_text(self, sha256: str, text: str) -> None:
+        """추출 텍스트 저장"""
+        if not self.enabled:
+            return
+        await asyncio.to_thread(self._write, self._text_path(sha256), text)
+        if self.use_redis:
+            await self._redis_set(f"{REDIS_KEY_PREFIX}:text:{sha256}", text)
+
+    # ------------------------------------------------------------------
+    # URL 검증자 (URL → ETag / Last-Modified / SHA-256)
+    # ------------------------------------------------------------------
+
+    async def get_validator(self, url: str) -> AttachmentValidator | None:
+        """첨부 URL의 마지막 응답 검증자 조회"""
+        if not self.enabled:
+            return None
+        key = self._url_key(url)
+        data = await asyncio.to_thread(self._read, self._url_path(key))
+        if data is None and self.use_redis:
+            data = await self._redis_get(f"{REDIS_KEY_PREFIX}:url:{key}")
+        if data is None:
+            return None
+        try:
+            return AttachmentValidator(**json.loads(data))
+        except (TypeError, ValueError):
+            return None
+
+    async def put_validator(self, url: str, validator: AttachmentValidator) -> None:
+        """검증자 저장 (ETag / Last-Modified가 모두 없으면 조건부 요청이 불가능하므로 저장하지 않음)"""
+        if not self.enabled or not (validator.etag or validator.last_modified):
+            return
+        key = self._url_key(url)
+        data = json.dumps(asdict(validator))
+        await asyncio.to_thread(self._write, self._url_path(key), data)
+        if self.use_redis:
+            await self._redis_set(f"{REDIS_KEY_PREFIX}:url:{key}", data)
+
+    # ------------------------------------------------------------------
+    # 디스크 (LRU)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _url_key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def _text_path(self, sha256: str) -> Path:
+        return self.directory / "text" / sha256[:2] / f"{sha256}.txt"
+
+    def _url_path(self, key: str) -> Path:
+        return self.directory / "url" / key[:2] / f"{key}.json"
+
+    def _read(self, path: Path) -> str | None:
+        try:
+            data = path.read_text(encoding="utf-8")
+        except (FileNotFoundError, UnicodeDecodeError):
+            return None
+        except OSError as e:
+            logger.warning(f"첨부파일 캐시 읽기 실패: {path}: {e}")
+            return None
+        # 조회 시각을 수정 시각으로 기록하여 재시작 후에도 LRU 순서 유지
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        with self._lock:
+            index = self._load_index()
+            if path in index:
+                index.move_to_end(path)
+            else:
+                index[path] = len(data.encode("utf-8"))
+                self._total_bytes += index[path]
+        return data
+
+    def _write(self, path: Path, data: str) -> None:
+        encoded = data.encode("utf-8")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 같은 디렉터리를 쓰는 다른 프로세스가 쓰다 만 파일을 읽지 않도록 원자적 교체
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(encoded)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"첨부파일 캐시 쓰기 실패: {path}: {e}")
+            return
+        with self._lock:
+            index = self._load_index()
+            self._total_bytes += len(encoded) - index.pop(path, 0)
+            index[path] = len(encoded)
+            self._evict()
+            CACHE_SIZE_BYTES.labels(cache_type="attachment_disk").set(self._total_bytes)
+
+    def _load_index(self) -> OrderedDict[Path, int]:
+        """첫 사용 시 디스크의 기존 항목을 수정 시각 순서로 읽어 LRU 인덱스 구성 (lock 보유 상태에서 호출)"""
+        if self._index is not None:
+            return self._index
+        entries = []
+        for path in self.directory.glob("*/*/*"):
+            if path.suffix not in (".txt", ".json"):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+        entries.sort()
+        self._index = OrderedDict((path, size) for _, path, size in entries)
+        self._total_bytes = sum(self._index.values())
+        return self._index
+
+    def _evict(self) -> None:
+        """크기 상한 초과 시 오래 쓰이지 않은 항목부터 삭제 (lock 보유 상태에서 호출)"""
+        index = self._index
+        while index and self._total_bytes > self.max_bytes:
+            path, size = index.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"첨부파일 캐시 삭제 실패: {path}: {e}")
+
+    # ------------------------------------------------------------------
+    # Redis (선택)
+    # ------------------------------------------------------------------
+
+    async def _redis_get(self, key: str) -> str | None:
+        from app.core.cache import get_redis
+
+        try:
+            redis = await get_redis()
+            return await redis.get(key)
+        except Exception as e:
+            logger.warning(f"첨부파일 캐시 Redis GET 오류: {e}")
+            return None
+
+    async def _redis_set(self, key: str, value: str) -> None:
+        from app.core.cache import get_redis
+
+        try:
+            redis = await get_redis()
+            await redis.setex(key, settings.ATTACHMENT_CACHE_REDIS_TTL, value)
+        except Exception as e:
+            logger.warning(f"첨부파일 캐시 Redis SET 오류: {e}")
+
+
+# 싱글톤 인스턴스
+attachment_cache = AttachmentTextCache()
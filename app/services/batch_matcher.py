@@ -0,0 +1,297 @@
+"""
+배치 Hard / Soft Match 엔진 (NumPy)
+
+HardMatchEngine.evaluate / MatchingService.calculate_soft_match는 (공고, 프로필) 1쌍마다
+사유 문자열과 상세 dict를 만들고 로그를 남깁니다. 여기서는 공고 N건(또는 프로필 N개)을
+열 단위 배열로 바꿔 두고 프로필 1개(또는 공고 1건)와 한 번에 비교합니다.
+
+- 공고 열(BidColumns): 지역 코드(int16, 0 = 제한 없음), 추정가(float64), 요구 면허 비트마스크(int64),
+  중요도, 원본 region_code, 제목/본문 텍스트
+- 프로필 열(ProfileColumns): 지역 코드, 최대 실적, 보유 면허 비트마스크(int64), 키워드
+- 면허: (공고 마스크 & ~보유 마스크) == 0  (app.utils.license_taxonomy)
+- 키워드: 텍스트 N개를 구분 문자로 이어 붙인 문자열에서 str.find로 적중 행만 방문
+- 결과(BatchMatchResult): 단계별 통과 마스크, Hard Match 마스크, Soft Match 점수.
+  사유/상세는 explain(i)을 호출한 행만 기존 엔진으로 만듭니다.
+- 판정 규칙은 HardMatchEngine.evaluate / calculate_soft_match와 같습니다.
+
+사용법:
+    from app.services.batch_matcher import BidColumns, batch_matcher
+
+    columns = BidColumns.from_bids(bids)  # 여러 프로필에 재사용 가능
+    result = batch_matcher.match_bids(profile, columns)
+    for i in result.top(20):
+        bid, score, explanation = columns.bids[i], result.scores[i], result.explain(i)
+"""
+
+from bisect import bisect_right
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from app.db.models import BidAnnouncement, UserProfile
+from app.services.matching_service import hard_match_engine, matching_service
+from app.utils.hard_match import REGION_CODES, bid_license_mask, bid_match_region_code, profile_license_mask
+from app.utils.search_text import bid_search_text, normalize_text, split_title
+
+# 지역 코드가 아닌 사용자 지역값 (어떤 공고 지역과도 일치하지 않음)
+_UNKNOWN_REGION = -1
+
+
+def _region_number(code: str | None) -> int:
+    """지역 코드 → 정수 (None/빈 값: 0 = 제한 없음)"""
+    if not code:
+        return 0
+    return int(code) if code in REGION_CODES else _UNKNOWN_REGION
+
+
+def _user_region(profile: Any) -> str | None:
+    return getattr(profile, "region_code", None) or getattr(profile, "location_code", None)
+
+
+def _max_performance(profile: Any) -> float:
+    return max((perf.amount for perf in profile.performances or [] if perf.amount), default=0.0)
+
+
+def _keywords(profile: Any) -> list[str]:
+    """Soft Match 키워드 (정규화 후 빈 값 제외, 중복은 엔진과 같이 그대로 유지)"""
+    return [keyword for keyword in (normalize_text(k) for k in profile.keywords or []) if keyword]
+
+
+class TextColumn:
+    """텍스트 N개를 구분 문자로 이어 붙인 문자열 (행마다 `term in text`를 반복하지 않음)"""
+
+    # normalize_text가 제어 문자를 공백으로 바꾸므로 텍스트 안에는 나오지 않음
+    SEPARATOR = "\x00"
+
+    def __init__(self, texts: Sequence[str]):
+        self.size = len(texts)
+        self.blob = self.SEPARATOR.join(texts)
+        self._starts = []
+        start = 0
+        for text in texts:
+            self._starts.append(start)
+            start += len(text) + 1
+
+    def contains(self, term: str) -> np.ndarray:
+        """term을 포함하는 행 마스크 (행당 첫 적중만 찾고 다음 행으로 건너뜀)"""
+        rows = []
+        if term:
+            starts, find = self._starts, self.blob.find
+            pos = find(term)
+            while pos >= 0:
+                row = bisect_right(starts, pos) - 1
+                rows.append(row)
+                if row + 1 >= self.size:
+                    break
+                pos = find(term, starts[row + 1])
+
+        mask = np.zeros(self.size, dtype=bool)
+        mask[rows] = True
+        return mask
+
+
+@dataclass
+class BidColumns:
+    """공고 N건의 매칭 입력 열"""
+
+    bids: Sequence[BidAnnouncement]
+    region: np.ndarray
+    price: np.ndarray
+    licenses: np.ndarray
+    importance: np.ndarray
+    raw_region: np.ndarray
+    titles: TextColumn
+    bodies: TextColumn
+
+    @classmethod
+    def from_bids(cls, bids: Sequence[BidAnnouncement]) -> "BidColumns":
+        titles, bodies = [], []
+        for bid in bids:
+            title, body = split_title(bid_search_text(bid))
+            titles.append(title)
+            bodies.append(body)
+
+        return cls(
+            bids=bids,
+            region=np.fromiter(
+                (_region_number(bid_match_region_code(bid)) for bid in bids), dtype=np.int16, count=len(bids)
+            ),
+            price=np.fromiter((bid.estimated_price or 0.0 for bid in bids), dtype=np.float64, count=len(bids)),
+            licenses=np.fromiter((bid_license_mask(bid) for bid in bids), dtype=np.int64, count=len(bids)),
+            importance=np.fromiter((bid.importance_score or 1 for bid in bids), dtype=np.int64, count=len(bids)),
+            raw_region=np.array([bid.region_code for bid in bids], dtype=object),
+            titles=TextColumn(titles),
+            bodies=TextColumn(bodies),
+        )
+
+    def __len__(self) -> int:
+        return len(self.bids)
+
+
+@dataclass
+class ProfileColumns:
+    """프로필 N개의 매칭 입력 열"""
+
+    profiles: Sequence[UserProfile]
+    region: np.ndarray
+    location: np.ndarray
+    has_licenses: np.ndarray
+    licenses: np.ndarray
+    max_performance: np.ndarray
+    # 키워드: 중복 제거한 목록 + (소유 프로필 번호, 키워드 번호) 쌍
+    keywords: list[str]
+    keyword_owner: np.ndarray
+    keyword_index: np.ndarray
+
+    @classmethod
+    def from_profiles(cls, profiles: Sequence[UserProfile]) -> "ProfileColumns":
+        keyword_ids: dict[str, int] = {}
+        owners, indexes = [], []
+        for i, profile in enumerate(profiles):
+            for keyword in _keywords(profile):
+                owners.append(i)
+                indexes.append(keyword_ids.setdefault(keyword, len(keyword_ids)))
+
+        return cls(
+            profiles=profiles,
+            region=np.fromiter(
+                (_region_number(_user_region(p)) for p in profiles), dtype=np.int16, count=len(profiles)
+            ),
+            location=np.array([profile.location_code for profile in profiles], dtype=object),
+            has_licenses=np.fromiter((bool(profile.licenses) for profile in profiles), dtype=bool, count=len(profiles)),
+            licenses=np.fromiter(
+                (profile_license_mask(profile) for profile in profiles), dtype=np.int64, count=len(profiles)
+            ),
+            max_performance=np.fromiter(
+                (_max_performance(profile) for profile in profiles), dtype=np.float64, count=len(profiles)
+            ),
+            keywords=list(keyword_ids),
+            keyword_owner=np.asarray(owners, dtype=np.intp),
+            keyword_index=np.asarray(indexes, dtype=np.intp),
+        )
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+
+@dataclass
+class BatchMatchResult:
+    """배치 매칭 결과 (행 = 공고 또는 프로필)"""
+
+    region: np.ndarray
+    license: np.ndarray
+    performance: np.ndarray
+    scores: np.ndarray
+    _pair: Callable[[int], tuple[BidAnnouncement, UserProfile]] = field(repr=False)
+    mask: np.ndarray = field(init=False)
+
+    def __post_init__(self):
+        self.mask = self.region & self.license & self.performance
+
+    def __len__(self) -> int:
+        return len(self.mask)
+
+    @property
+    def hard_scores(self) -> np.ndarray:
+        """HardMatchEngine.get_matching_score와 같은 점수 (통과 1.0, 아니면 단계별 0.33/0.33/0.34)"""
+        partial = 0.33 * self.region + 0.33 * self.license + 0.34 * self.performance
+        return np.where(self.mask, 1.0, partial)
+
+    def top(self, limit: int | None = None) -> np.ndarray:
+        """Hard Match 통과 행 번호 (Soft Match 점수 내림차순, 같으면 행 순서)"""
+        matched = np.flatnonzero(self.mask)
+        order = np.argsort(-self.scores[matched], kind="stable")
+        return matched[order][:limit]
+
+    def explain(self, i: int) -> dict[str, Any]:
+        """행 i의 판정 사유 / 상세 / Soft Match 내역 (기존 엔진으로 생성)"""
+        bid, profile = self._pair(int(i))
+        is_match, reasons, details = hard_match_engine.evaluate(bid, profile)
+        soft = matching_service.calculate_soft_match(profile, bid)
+        return {
+            "is_match": is_match,
+            "reasons": reasons,
+            "details": details,
+            "soft_score": soft["score"],
+            "breakdown": soft["breakdown"],
+        }
+
+
+class BatchMatcher:
+    """프로필 1개 × 공고 N건 / 프로필 N개 × 공고 1건 일괄 매칭"""
+
+    def match_bids(self, profile: UserProfile, bids: BidColumns | Sequence[BidAnnouncement]) -> BatchMatchResult:
+        """프로필 1개 × 공고 N건"""
+        columns = bids if isinstance(bids, BidColumns) else BidColumns.from_bids(bids)
+        size = len(columns)
+
+        user_region = _region_number(_user_region(profile))
+        region = (columns.region == 0) | (columns.region == user_region) if user_region else np.ones(size, dtype=bool)
+
+        if profile.licenses:
+            license = (columns.licenses & np.int64(~profile_license_mask(profile))) == 0
+        else:
+            license = np.zeros(size, dtype=bool)
+
+        performance = self._performance(columns.price, _max_performance(profile))
+
+        scores = np.zeros(size, dtype=np.int64)
+        for keyword in _keywords(profile):
+            in_title = columns.titles.contains(keyword)
+            scores += np.where(in_title, 20, np.where(columns.bodies.contains(keyword), 5, 0))
+        if profile.location_code:
+            scores += 10 * (columns.raw_region == profile.location_code)
+        scores += columns.importance * 5
+
+        return BatchMatchResult(
+            region=region,
+            license=license,
+            performance=performance,
+            scores=np.clip(scores, 0, 100),
+            _pair=lambda i: (columns.bids[i], profile),
+        )
+
+    def match_profiles(
+        self, profiles: ProfileColumns | Sequence[UserProfile], bid: BidAnnouncement
+    ) -> BatchMatchResult:
+        """프로필 N개 × 공고 1건"""
+        columns = profiles if isinstance(profiles, ProfileColumns) else ProfileColumns.from_profiles(profiles)
+        size = len(columns)
+        bid_region_number = _region_number(bid_match_region_code(bid))
+        region = (
+            (columns.region == 0) | (columns.region == bid_region_number)
+            if bid_region_number
+            else np.ones(size, dtype=bool)
+        )
+
+        license = columns.has_licenses & ((np.int64(bid_license_mask(bid)) & ~columns.licenses) == 0)
+
+        performance = self._performance(np.float64(bid.estimated_price or 0.0), columns.max_performance)
+
+        title, body = split_title(bid_search_text(bid))
+        in_title = np.fromiter((keyword in title for keyword in columns.keywords), dtype=bool)
+        in_body = np.fromiter((keyword in body for keyword in columns.keywords), dtype=bool)
+        keyword_points = np.where(in_title, 20, np.where(in_body, 5, 0))[columns.keyword_index]
+        scores = np.bincount(columns.keyword_owner, weights=keyword_points, minlength=size).astype(np.int64)
+        if bid.region_code:
+            scores += 10 * (columns.location == bid.region_code)
+        scores += (bid.importance_score or 1) * 5
+
+        return BatchMatchResult(
+            region=region,
+            license=license,
+            performance=np.broadcast_to(performance, (size,)).copy(),
+            scores=np.clip(scores, 0, 100),
+            _pair=lambda i: (bid, columns.profiles[i]),
+        )
+
+    @staticmethod
+    def _performance(price: np.ndarray, max_performance: np.ndarray | float) -> np.ndarray:
+        """실적 검증: 추정가 정보 없음 또는 최대 실적 >= 추정가의 50% (실적 0 이하는 불통과)"""
+        return (price <= 0) | ((max_performance > 0) & (max_performance >= price * 0.5))
+
+
+# 싱글톤 인스턴스
+batch_matcher = BatchMatcher()
@@ -1,9 +1,29 @@
+from dataclasses import dataclass
+
 from app.core.logging import logger
 from app.db.models import BidAnnouncement
-from app.db.repositories.bid_repository import BidRepository
+from app.db.repositories.bid_repository import BidPage, BidRepository
 from app.schemas.bid import BidCreate, BidUpdate
-from app.services.match_service import hard_match_engine
+from app.services.match_percolator import match_percolator
 from app.services.subscription_service import subscription_service
+from app.utils.search_text import bid_search_text, make_snippet, search_terms
+
+
+@dataclass
+class BidSearchHit:
+    """키워드 검색 결과 1건"""
+
+    bid: BidAnnouncement
+    rank: float
+    snippet: str
+
+
+@dataclass
+class BidMatchHit:
+    """매칭 피드 결과 1건"""
+
+    bid: BidAnnouncement
+    soft_score: int
 
 
 class BidService:
@@ -40,8 +60,46 @@ class BidService:
         limit: int = 100,
         keyword: str | None = None,
         agency: str | None = None,
+        sort: str = "latest",
+        after: tuple | None = None,
     ) -> list[BidAnnouncement]:
-        return await repo.get_multi_with_filters(skip=skip, limit=limit, keyword=keyword, agency=agency)
+        return await repo.get_multi_with_filters(
+            skip=skip, limit=limit, keyword=keyword, agency=agency, sort=sort, after=after
+        )
+
+    async def get_bids_page(
+        self,
+        repo: BidRepository,
+        skip: int = 0,
+        limit: int = 100,
+        agency: str | None = None,
+        sort: str = "latest",
+        after: tuple | None = None,
+        position: int = 0,
+    ) -> BidPage[BidAnnouncement]:
+        """공고 목록 + 필터 조건에 맞는 전체 건수 (정확한 값 또는 플래너 추정치)"""
+        return await repo.get_page_with_filters(
+            skip=skip, limit=limit, agency=agency, sort=sort, after=after, position=position
+        )
+
+    async def search_bids(
+        self,
+        repo: BidRepository,
+        keyword: str,
+        skip: int = 0,
+        limit: int = 100,
+        agency: str | None = None,
+        sort: str | None = None,
+        after: tuple | None = None,
+        position: int = 0,
+    ) -> BidPage[BidSearchHit]:
+        """키워드 검색: 관련도순(sort 지정 시 해당 정렬) 공고 + 적중 단어를 <mark>로 표시한 본문 미리보기 + 전체 건수"""
+        terms = search_terms(keyword)
+        page = await repo.search_page(
+            keyword, skip=skip, limit=limit, agency=agency, sort=sort, after=after, position=position
+        )
+        hits = [BidSearchHit(bid, rank, make_snippet(bid_search_text(bid), terms)) for bid, rank in page.items]
+        return BidPage(hits, page.total, page.total_exact)
 
     async def update_bid_processing_status(
         self, repo: BidRepository, bid_id: int, processed: bool
@@ -52,15 +110,36 @@ class BidService:
         return await repo.update(db_bid, bid_in)
 
     async def get_matching_bids(
-        self, repo: BidRepository, profile, user=None, skip: int = 0, limit: int = 100
+        self,
+        repo: BidRepository,
+        profile,
+        user=None,
+        skip: int = 0,
+        limit: int = 100,
+        after: tuple | None = None,
     ) -> list[BidAnnouncement]:
+        page = await self.get_matching_page(repo, profile, user=user, skip=skip, limit=limit, after=after)
+        return [hit.bid for hit in page.items]
+
+    async def get_matching_page(
+        self,
+        repo: BidRepository,
+        profile,
+        user=None,
+        skip: int = 0,
+        limit: int = 100,
+        after: tuple | None = None,
+    ) -> BidPage[BidMatchHit]:
         """
-        Execute Hard Match Logic with Zero False Positives
+        Hard Match 피드 (Zero False Positives)
 
-        Uses HardMatchEngine for precise 3-stage validation:
-        1. Region matching
-        2. License verification
-        3. Performance capacity check
+        매칭은 공고 수집 시 MatchPercolator가 bid_matches에 미리 저장하므로 여기서는 읽기만 합니다
+        (지역 / 면허 / 실적 3단계 검증은 HardMatchEngine과 같은 규칙).
+        프로필 수정 시 재계산은 Taskiq 작업(rematch_profile_matches)이 맡습니다. 그 작업이 아직 끝나지 않은 경우
+        (matched_at 없음)에도 조회에서는 쓰지 않고 작업만 다시 등록한 뒤 저장된 매칭을 그대로 반환합니다.
+
+        after: 직전 페이지 마지막 공고의 "latest" 정렬 키. 지정하면 그 다음부터 읽고,
+        skip은 지금까지 반환한 건수(플랜 한도 검사 / 전체 건수 계산용)로만 사용합니다.
         """
         # 0. Check Plan Limits
         max_allowed = 100  # Default
@@ -75,26 +154,17 @@ class BidService:
 
             # If skip is beyond max_allowed, return empty (e.g. they can't paginate past 3)
             if skip >= max_allowed:
-                return []
-
-        # 1. Get all recent bids (last 30 days)
-        all_bids = await repo.get_multi_with_filters(skip=0, limit=1000)
-
-        # 2. Apply Hard Match filter using engine
-        matched_bids = []
-        for bid in all_bids:
-            is_match, reasons, details = hard_match_engine.evaluate(bid, profile)
-            if is_match:
-                matched_bids.append(bid)
-                logger.info(f"Hard Match: bid_id={bid.id}, title={bid.title[:30]}")
+                return BidPage([], skip, False)
 
-        # 3. Apply pagination
-        total_matched = len(matched_bids)
-        paginated = matched_bids[skip : skip + limit]
+        # 1. 재매칭 작업보다 조회가 먼저 온 경우: 작업만 다시 등록 (등록 실패 시 sweep_unmatched_profiles가 재등록)
+        if profile.matched_at is None:
+            await match_percolator.enqueue_rematch(profile.id)
 
-        logger.info(f"Hard Match Results: {len(paginated)}/{total_matched} bids matched (skip={skip}, limit={limit})")
+        # 2. bid_matches 인덱스 조회 (user_id, posted_at, bid_id)
+        page = await repo.get_match_feed_page(profile.user_id, skip=skip, limit=limit, after=after, position=skip)
 
-        return paginated
+        logger.info(f"Hard Match Results: {len(page.items)}/{page.total} bids matched (skip={skip}, limit={limit})")
+        return BidPage([BidMatchHit(bid, soft_score) for bid, soft_score in page.items], page.total, page.total_exact)
 
 
 bid_service = BidService()
@@ -8,6 +8,9 @@ from app.core.config import settings
 from app.core.logging import logger
 from app.db.models import BidAnnouncement
 
+# 프롬프트에 넣는 첨부파일 본문 최대 글자 수 (추출 시 max_chars 예산으로도 사용)
+ATTACHMENT_TEXT_BUDGET = 10_000
+
 
 class ConstraintService:
     """
@@ -33,7 +36,7 @@ class ConstraintService:
         # 1. 대상 텍스트 수집 (제목 + 본문 + 첨부파일 내용)
         full_text = f"제목: {bid.title}\n발주처: {bid.agency}\n본문: {bid.content}\n"
         if bid.attachment_content:
-            full_text += f"\n첨부파일 내용 (일부): {bid.attachment_content[:10000]}"  # 10k chars limit
+            full_text += f"\n첨부파일 내용 (일부): {bid.attachment_content[:ATTACHMENT_TEXT_BUDGET]}"
 
         # 2. Gemini 호출
         prompt = """
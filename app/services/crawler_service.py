@@ -3,24 +3,95 @@ G2B 크롤러 서비스
 나라장터(G2B) 공공데이터 API를 통해 입찰 공고를 수집하고 필터링합니다.
 """
 
+import asyncio
+import math
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
+from urllib.parse import urljoin, urlsplit
 
 import httpx
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.core.logging import logger
+from app.core.metrics import record_cache_hit
+from app.core.process_pool import run_in_process
+from app.services.attachment_cache import AttachmentValidator, attachment_cache, content_hash
+from app.services.keyword_matcher import KeywordMatcher, get_keyword_matcher
+from app.utils.search_text import build_search_text
+
+G2B_DATETIME_FORMAT = "%Y%m%d%H%M"  # bidNtceDt, inqryBgnDt/inqryEndDt 형식
+ATTACHMENT_TIMEOUT = 10.0  # 첨부파일 페이지/다운로드 요청 타임아웃 (초)
+ATTACHMENT_EXTENSIONS = (".hwp", ".hwpx", ".pdf")
+
+
+def _text_cache_key(sha256: str) -> str:
+    """첨부파일 텍스트 캐시 키 (추출 글자 수 예산이 바뀌면 이전 결과를 쓰지 않도록 예산 포함)"""
+    budget = settings.ATTACHMENT_TEXT_MAX_CHARS
+    return f"{sha256}-{budget}" if budget else sha256
+
+
+@dataclass
+class AttachmentScrapeStats:
+    """첨부파일 스크래핑 단계별 통계 (CrawlerLog.stage_stats에 기록)"""
+
+    notices: int = 0  # 스크래핑 대상 공고 수
+    attachments: int = 0  # 첨부 링크를 찾은 공고 수
+    downloaded: int = 0
+    parsed: int = 0
+    cache_hits: int = 0  # 같은 내용의 파일을 이미 추출해 둔 경우 (파싱 생략)
+    not_modified: int = 0  # 조건부 요청 304 응답 (다운로드 생략)
+    oversized: int = 0  # 크기 제한 초과로 중단
+    failed: int = 0
+    bytes_downloaded: int = 0
+    chars_extracted: int = 0
+    wall_seconds: float = 0.0
+    stage_seconds: dict[str, float] = field(default_factory=lambda: {"page": 0.0, "download": 0.0, "parse": 0.0})
+
+    def add_stage(self, stage: str, seconds: float) -> None:
+        self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+    def as_dict(self) -> dict:
+        """
+        단계별 누적 소요 시간(동시 실행 합계)과 전체 경과 시간 기준 처리량
+        """
+        wall = self.wall_seconds
+        return {
+            "notices": self.notices,
+            "attachments": self.attachments,
+            "downloaded": self.downloaded,
+            "parsed": self.parsed,
+            "cache_hits": self.cache_hits,
+            "not_modified": self.not_modified,
+            "oversized": self.oversized,
+            "failed": self.failed,
+            "bytes_downloaded": self.bytes_downloaded,
+            "chars_extracted": self.chars_extracted,
+            "wall_seconds": round(wall, 3),
+            "stage_seconds": {stage: round(seconds, 3) for stage, seconds in self.stage_seconds.items()},
+            "notices_per_sec": round(self.notices / wall, 2) if wall else 0.0,
+            "download_bytes_per_sec": round(self.bytes_downloaded / wall, 1) if wall else 0.0,
+        }
 
 
-class AsyncBytesFile:
-    """Mock UploadFile for Bytes"""
+@dataclass
+class Attachment:
+    """
+    첨부파일 다운로드 결과
 
-    def __init__(self, data: bytes, filename: str):
-        self.data = data
-        self.filename = filename
+    조건부 요청이 304 Not Modified이면 content 없이 캐시된 추출 텍스트(text)를 담습니다.
+    """
 
-    async def read(self):
-        return self.data
+    filename: str
+    url: str
+    content: bytes | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    text: str | None = None
 
 
 class G2BCrawlerService:
@@ -58,23 +129,83 @@ class G2BCrawlerService:
     def __init__(self):
         self.api_key = settings.G2B_API_KEY
         self.api_endpoint = settings.G2B_API_ENDPOINT
-        # Celery 환경에서 Event Loop 충돌 방지를 위해 인스턴스 레벨 client 제거
-        # self.client = httpx.AsyncClient(timeout=30.0)
+        self.page_size = settings.G2B_PAGE_SIZE
+        self.page_concurrency = max(1, settings.G2B_PAGE_CONCURRENCY)
+        self.attachment_concurrency = max(1, settings.ATTACHMENT_CONCURRENCY)
+        self.per_host_concurrency = max(1, settings.ATTACHMENT_PER_HOST_CONCURRENCY)
+        self.parse_concurrency = max(1, settings.ATTACHMENT_PARSE_CONCURRENCY)
+        self.max_attachment_bytes = settings.ATTACHMENT_MAX_BYTES
+        self.last_crawl_stats: dict = {}
+        self.next_watermark: dict | None = None
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        # HTTP 클라이언트는 인스턴스에 두지 않고 공유 레지스트리(이벤트 루프별)에서 조회
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type(httpx.RequestError),
-        reraise=True,
-    )
     async def fetch_new_announcements(
         self,
         from_date: datetime | None = None,
         exclude_keywords: list[str] | None = None,
         include_keywords: list[str] | None = None,
+        max_pages: int | None = None,
+        watermark: dict | None = None,
     ) -> list[dict]:
         """
         G2B API에서 새로운 입찰 공고를 가져옵니다.
+
+        totalCount 기준으로 전체 페이지를 수집하며, 필터링 통과 공고에 한해
+        첨부파일 텍스트를 추출합니다.
+
+        watermark가 주어지면 마지막으로 본 공고 이후(delta window)만 조회하고,
+        수집이 빠짐없이 끝난 경우에만 self.next_watermark를 갱신합니다.
+        """
+        self.last_crawl_stats = {}
+        self.next_watermark = None
+        try:
+            list_started = time.perf_counter()
+            filtered = [
+                item
+                async for item in self.stream_new_announcements(
+                    from_date=from_date,
+                    exclude_keywords=exclude_keywords,
+                    include_keywords=include_keywords,
+                    max_pages=max_pages,
+                    watermark=watermark,
+                )
+            ]
+            list_seconds = time.perf_counter() - list_started
+            list_stats = self.last_crawl_stats.setdefault("list", {})
+            list_stats["seconds"] = round(list_seconds, 3)
+            list_stats["items_per_sec"] = round(list_stats.get("parsed", 0) / list_seconds, 1) if list_seconds else 0.0
+
+            # Phase 1 Upgrade: Scrape Attachments for Filtered Items
+            # Only scrape if it passes the initial keyword filter to save resources
+            scrape_stats = await self.scrape_attachments(filtered)
+            self.last_crawl_stats["attachments"] = scrape_stats.as_dict()
+
+            for idx, item in enumerate(filtered):
+                logger.info(f"[DEBUG G2B] {idx+1}. {item['title']} ({item['agency']}) - {item['estimated_price']:,}원")
+
+            logger.info(f"필터링 후 알림 대상 개수: {len(filtered)}")
+
+            return filtered
+
+        except Exception as e:
+            # 수집이 중단되었으므로 워터마크를 전진시키지 않음 (다음 실행에서 같은 구간부터 재개)
+            self.next_watermark = None
+            logger.error(f"공고 수집 중 오류 발생: {e}", exc_info=True)
+            return []
+
+    async def stream_new_announcements(
+        self,
+        from_date: datetime | None = None,
+        exclude_keywords: list[str] | None = None,
+        include_keywords: list[str] | None = None,
+        max_pages: int | None = None,
+        watermark: dict | None = None,
+    ) -> AsyncIterator[dict]:
+        """
+        필터링을 통과한 공고를 페이지 도착 순서대로 스트리밍합니다.
+
+        마지막 페이지가 도착하기 전에 앞서 받은 페이지의 필터링/후처리를 시작할 수 있습니다.
         """
         if exclude_keywords is None:
             exclude_keywords = self.DEFAULT_EXCLUDE_KEYWORDS
@@ -83,73 +214,194 @@ class G2BCrawlerService:
         if include_keywords is None:
             include_keywords = self.INCLUDE_KEYWORDS_CONCESSION + self.INCLUDE_KEYWORDS_FLOWER
 
+        # 키워드 집합은 크롤링 1회 동안 고정이므로 오토마톤을 한 번만 컴파일
+        matcher = get_keyword_matcher(include_keywords, exclude_keywords)
+
+        total_pages = 0
+        total_parsed = 0
+        total_filtered = 0
+        async for announcements in self.iter_announcement_pages(
+            from_date=from_date, max_pages=max_pages, watermark=watermark
+        ):
+            total_pages += 1
+            total_parsed += len(announcements)
+            for announcement in announcements:
+                if self._should_notify(announcement, matcher=matcher):
+                    total_filtered += 1
+                    yield announcement
+
+        self.last_crawl_stats["list"] = {"pages": total_pages, "parsed": total_parsed, "filtered": total_filtered}
+        logger.info(f"파싱된 전체 공고 개수: {total_parsed}, 필터링 통과: {total_filtered}")
+
+    async def iter_announcement_pages(
+        self,
+        from_date: datetime | None = None,
+        max_pages: int | None = None,
+        watermark: dict | None = None,
+    ) -> AsyncIterator[list[dict]]:
+        """
+        G2B 입찰공고 목록을 페이지 단위로 수집합니다.
+
+        1페이지 응답의 totalCount로 전체 페이지 수를 계산한 뒤, 나머지 페이지를
+        page_concurrency 한도 내에서 동시에 요청하고 완료되는 순서대로 반환합니다.
+        개별 페이지는 네트워크 오류 시 재시도하며, 재시도 후에도 실패한 페이지는
+        건너뛰고 로그만 남깁니다.
+
+        증분 수집:
+            watermark({"bidNtceDt", "bidNtceNo"})가 있으면 from_date 대신 워터마크 시각부터
+            현재까지만 조회하고, (bidNtceDt, bidNtceNo)가 워터마크 이하인 공고는 버립니다.
+            모든 페이지를 정상 수신한 경우에만 self.next_watermark에 새 워터마크를 기록하며,
+            실패한 페이지가 있거나 max_pages 때문에 totalCount의 일부만 조회한 경우에는 None으로 두어
+            다음 실행이 같은 구간부터 다시 조회하게 합니다.
+
+        Args:
+            from_date: 조회 시작일
+            max_pages: 최대 페이지 수 (기본: settings.G2B_MAX_PAGES)
+            watermark: 이전 실행의 마지막 공고 (bidNtceDt, bidNtceNo)
+
+        Yields:
+            파싱된 공고 리스트 (페이지 단위)
+        """
+        if max_pages is None:
+            max_pages = settings.G2B_MAX_PAGES
+
         # API 요청 파라미터 구성
         params = {
             "serviceKey": self.api_key,
-            "numOfRows": 100,  # [DEBUG] 수집 범위를 100개로 확대
+            "numOfRows": self.page_size,
             "pageNo": 1,
             "inqryDiv": "1",  # 입찰공고
             "type": "json",
         }
 
-        if from_date:
+        watermark_key = self._watermark_key(watermark) if watermark else None
+        if watermark_key:
+            params["inqryBgnDt"] = watermark_key[0].strftime(G2B_DATETIME_FORMAT)
+            params["inqryEndDt"] = datetime.now().strftime(G2B_DATETIME_FORMAT)
+        elif from_date:
             params["inqryBgnDt"] = from_date.strftime("%Y%m%d")
 
-        try:
-            logger.info(f"G2B API 요청 시작: {self.api_endpoint}, params={params}")
+        logger.info(f"G2B API 요청 시작: {self.api_endpoint}, params={params}")
 
-            # G2B API 호출 (매 요청마다 새로운 클라이언트 생성)
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(self.api_endpoint, params=params)
-                logger.info(f"G2B API 응답 상태: {response.status_code}")
+        self.next_watermark = None
+        high_watermark = watermark_key
+        complete = False
 
-                response.raise_for_status()
-                data = response.json()
+        client = get_http_client("g2b")
+        data = await self._fetch_page(client, params, 1)
 
-            # Check for API Header Error
-            header = data.get("response", {}).get("header", {})
-            if header.get("resultCode") != "00":
-                logger.error(f"G2B API Business Error: {header}")
-                return []
+        # Check for API Header Error
+        header = data.get("response", {}).get("header", {})
+        if header.get("resultCode") != "00":
+            logger.error(f"G2B API Business Error: {header}")
+            return
 
-            # 데이터 파싱 및 필터링
-            announcements = self._parse_api_response(data)
-            logger.info(f"파싱된 전체 공고 개수: {len(announcements)}")
+        items, high_watermark = self._filter_after_watermark(data, watermark_key, high_watermark)
+        yield self._parse_items(items)
 
-            # 필터링 적용
-            filtered = [a for a in announcements if self._should_notify(a, exclude_keywords, include_keywords)]
+        total_pages = self._get_last_page(data)
+        last_page = min(total_pages, max_pages) if max_pages else total_pages
+        # 조회하지 않은 페이지의 공고가 워터마크보다 앞설 수 있으므로 잘린 실행은 워터마크를 전진시키지 않음
+        truncated = last_page < total_pages
+        if truncated:
+            logger.warning(f"G2B 페이지 {total_pages}개 중 {last_page}개만 조회 (max_pages): 워터마크를 유지합니다")
+        if last_page <= 1:
+            if not truncated:
+                self.next_watermark = self._watermark_dict(high_watermark)
+            return
 
-            # Phase 1 Upgrade: Scrape Attachments for Filtered Items
-            # Only scrape if it passes the initial keyword filter to save resources
+        logger.info(f"G2B 페이지네이션: 총 {last_page}페이지 (동시 요청 {self.page_concurrency})")
 
-            for item in filtered:
-                try:
-                    if item.get("url"):
-                        logger.info(f"첨부파일 스크래핑 시도: {item['title']}")
-                        # Scraping (Limit to 3 seconds connection, 10s read)
-                        # MVP: We use simple scraping.
-                        # Real G2B might require JS rendering or cookies, but public link often works.
-                        extracted_text = await self._scrape_attachments(item["url"])
-                        if extracted_text:
-                            item["attachment_content"] = extracted_text
-                            logger.info(f"첨부파일 텍스트 추출 완료 ({len(extracted_text)} chars)")
-
-                            # Re-evalute keywords with attachment content?
-                            # For Phase 1, we just store it.
-                            # Phase 3 might use it for Hard Match.
-                except Exception as e:
-                    logger.error(f"첨부파일 처리 중 오류: {e}")
+        semaphore = asyncio.Semaphore(self.page_concurrency)
 
-            for idx, item in enumerate(filtered):
-                logger.info(f"[DEBUG G2B] {idx+1}. {item['title']} ({item['agency']}) - {item['estimated_price']:,}원")
+        async def fetch(page_no: int) -> tuple[int, dict]:
+            async with semaphore:
+                return page_no, await self._fetch_page(client, params, page_no)
 
-            logger.info(f"필터링 후 알림 대상 개수: {len(filtered)}")
+        tasks = [asyncio.create_task(fetch(page_no)) for page_no in range(2, last_page + 1)]
+        failed_pages = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    page_no, page_data = await next_done
+                except Exception as e:
+                    failed_pages += 1
+                    logger.error(f"G2B 페이지 수집 실패 (재시도 초과): {e}")
+                    continue
+
+                header = page_data.get("response", {}).get("header", {})
+                if header.get("resultCode") != "00":
+                    failed_pages += 1
+                    logger.error(f"G2B API Business Error (page={page_no}): {header}")
+                    continue
+
+                items, high_watermark = self._filter_after_watermark(page_data, watermark_key, high_watermark)
+                yield self._parse_items(items)
+            complete = failed_pages == 0 and not truncated
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if complete:
+            self.next_watermark = self._watermark_dict(high_watermark)
+        elif failed_pages:
+            logger.warning(f"G2B 페이지 {failed_pages}개 수집 실패: 워터마크를 유지합니다 (다음 실행에서 재조회)")
+
+    def _filter_after_watermark(
+        self, data: dict, watermark_key: tuple | None, high_watermark: tuple | None
+    ) -> tuple[list[dict], tuple | None]:
+        """
+        워터마크 이후 공고만 남기고, 이번 페이지까지의 최고 워터마크를 함께 반환
+        """
+        items = data.get("response", {}).get("body", {}).get("items", []) or []
+        fresh = []
+        for item in items:
+            key = self._watermark_key(item)
+            if key is None:
+                fresh.append(item)
+                continue
+            if watermark_key and key <= watermark_key:
+                continue
+            fresh.append(item)
+            if high_watermark is None or key > high_watermark:
+                high_watermark = key
+        return fresh, high_watermark
+
+    def _watermark_key(self, item: dict) -> tuple[datetime, str] | None:
+        """(bidNtceDt, bidNtceNo) 정렬 키 (공고일시가 없으면 None)"""
+        posted_at = self._parse_datetime(item.get("bidNtceDt"))
+        if posted_at is None:
+            return None
+        return posted_at, str(item.get("bidNtceNo") or "")
 
-            return filtered
+    @staticmethod
+    def _watermark_dict(key: tuple[datetime, str] | None) -> dict | None:
+        if key is None:
+            return None
+        return {"bidNtceDt": key[0].strftime(G2B_DATETIME_FORMAT), "bidNtceNo": key[1]}
 
-        except Exception as e:
-            logger.error(f"공고 수집 중 오류 발생: {e}", exc_info=True)
-            return []
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=1, max=8),
+        retry=retry_if_exception_type(httpx.RequestError),
+        reraise=True,
+    )
+    async def _fetch_page(self, client: httpx.AsyncClient, params: dict, page_no: int) -> dict:
+        """단일 페이지 요청 (네트워크 오류 시 지수 백오프 재시도)"""
+        response = await client.get(self.api_endpoint, params={**params, "pageNo": page_no})
+        logger.debug(f"G2B API 응답 상태: {response.status_code} (page={page_no})")
+        response.raise_for_status()
+        return response.json()
+
+    def _get_last_page(self, data: dict) -> int:
+        """응답의 totalCount로 마지막 페이지 번호 계산"""
+        body = data.get("response", {}).get("body", {})
+        try:
+            total_count = int(body.get("totalCount") or 0)
+        except (TypeError, ValueError):
+            return 1
+        return max(1, math.ceil(total_count / self.page_size))
 
     @retry(
         stop=stop_after_attempt(3),
@@ -178,10 +430,10 @@ class G2BCrawlerService:
             url = settings.G2B_RESULT_API_ENDPOINT
             logger.info(f"G2B 개찰결과 API 요청: {url}, params={params}")
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
+            client = get_http_client("g2b")
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            data = response.json()
 
             header = data.get("response", {}).get("header", {})
             if header.get("resultCode") != "00":
@@ -214,91 +466,246 @@ class G2BCrawlerService:
             logger.error(f"G2B 개찰결과 API 호출 실패: {e}")
             return []
 
+    async def scrape_attachments(self, items: list[dict]) -> AttachmentScrapeStats:
+        """
+        공고 목록의 첨부파일을 동시에 다운로드/파싱하여 item["attachment_content"]에 저장
+
+        파이프라인:
+        1. 다운로드 단계: attachment_concurrency 한도 + 호스트별 per_host_concurrency 한도 내에서
+           공고 페이지 조회 → 첨부 링크 탐색 → 스트리밍 다운로드 (max_bytes 초과 시 중단)
+        2. 파싱 단계: parse_concurrency개의 워커가 큐에서 꺼내 추출 프로세스 풀(run_in_process)에서 텍스트 추출
+           (다운로드와 파싱이 겹쳐서 진행, 캐시 적중 시 파싱 생략)
+
+        Returns:
+            단계별 소요 시간 / 처리량 통계
+        """
+        targets = [item for item in items if item.get("url")]
+        stats = AttachmentScrapeStats(notices=len(targets))
+        if not targets:
+            return stats
+
+        started = time.perf_counter()
+        self._host_slots = {}
+        download_slots = asyncio.Semaphore(self.attachment_concurrency)
+        parse_queue: asyncio.Queue = asyncio.Queue(maxsize=self.parse_concurrency * 2)
+
+        async def download(item: dict) -> None:
+            async with download_slots:
+                try:
+                    attachment = await self._download_attachment(item["url"], stats)
+                except Exception as e:
+                    stats.failed += 1
+                    logger.warning(f"Failed to download attachment from {item['url']}: {e}")
+                    return
+                if attachment:
+                    await parse_queue.put((item, attachment))
+
+        async def parse_worker() -> None:
+            while (job := await parse_queue.get()) is not None:
+                item, attachment = job
+                try:
+                    extracted_text = await self._parse_attachment(attachment, stats)
+                except Exception as e:
+                    stats.failed += 1
+                    logger.warning(f"Failed to parse attachment {attachment.filename}: {e}")
+                    continue
+                if extracted_text:
+                    item["attachment_content"] = extracted_text
+                    logger.info(f"첨부파일 텍스트 추출 완료: {item.get('title')} ({len(extracted_text)} chars)")
+
+        parsers = [asyncio.create_task(parse_worker()) for _ in range(self.parse_concurrency)]
+        try:
+            await asyncio.gather(*(download(item) for item in targets))
+        finally:
+            for _ in parsers:
+                await parse_queue.put(None)
+            await asyncio.gather(*parsers, return_exceptions=True)
+
+        stats.wall_seconds = time.perf_counter() - started
+        logger.info(f"첨부파일 스크래핑 완료: {stats.as_dict()}")
+        return stats
+
     async def _scrape_attachments(self, url: str) -> str | None:
         """
-        URL에서 첨부파일(HWP, PDF)을 찾아 다운로드 및 텍스트 추출
+        URL에서 첨부파일(HWP, PDF)을 찾아 다운로드 및 텍스트 추출 (단건)
         """
         if not url:
             return None
 
         try:
-            from bs4 import BeautifulSoup
+            attachment = await self._download_attachment(url)
+            if not attachment:
+                return None
+            return await self._parse_attachment(attachment)
+        except Exception as e:
+            logger.warning(f"Failed to scrape attachment from {url}: {e}")
+            return None
 
-            async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-                # 1. Page Load
-                response = await client.get(url)
-                if response.status_code != 200:
-                    return None
+    async def _download_attachment(self, url: str, stats: AttachmentScrapeStats | None = None) -> Attachment | None:
+        """
+        공고 페이지에서 첨부 링크를 찾아 스트리밍 다운로드
 
-                soup = BeautifulSoup(response.text, "html.parser")
-
-                # 2. Find Attachment Links
-                # G2B patterns vary, but usually inside a specific div or table.
-                # We look for href ending with .hwp, .hwpx, .pdf
-                # Or specific G2B download function calls (tricky).
-                # Fallback: Look for any link with 'download' or 'file' in common structures.
-
-                # Simple Heuristic: Look for hrefs ending with extensions
-                target_exts = [".hwp", ".hwpx", ".pdf"]
-                target_link = None
-
-                for a in soup.find_all("a", href=True):
-                    href = a["href"]
-                    # G2B URLs might be relative or javascript:
-                    # Often "javascript:fn_download(...)" -> Hard to parse without headless browser.
-                    # But often external links or public data links correspond to direct downloads?
-                    # Actually G2B external link usually redirects to detailed info.
-                    # For Initial MVP, we try to find direct Http links.
-
-                    lower_href = href.lower()
-                    if any(lower_href.endswith(ext) for ext in target_exts):
-                        target_link = href
-                        if not target_link.startswith("http"):
-                            # Handle relative? G2B is complex.
-                            # Start with base url?
-                            # Use response.url.join(target_link)
-                            from urllib.parse import urljoin
-
-                            target_link = urljoin(str(response.url), target_link)
-                        break
-
-                # If no direct link found (likely JS), we skip for now (Phase 1 Limitation).
-                # "Supreme Command" -> MVP criteria.
-                # We log this limitation.
-                if not target_link:
-                    return None
+        이전에 받은 적 있는 첨부 URL이면 ETag/Last-Modified로 조건부 요청을 보내고,
+        304 응답이면 다운로드 없이 캐시된 추출 텍스트를 담아 반환합니다.
+        """
+        stats = stats or AttachmentScrapeStats()
+        client = get_http_client("g2b")
 
-                # 3. Download File (Limit size)
-                # Head request first?
-                head_resp = await client.head(target_link)
-                size = int(head_resp.headers.get("content-length", 0))
-                if size > 10 * 1024 * 1024:  # 10MB Limit
-                    logger.warning(f"File too large: {size} bytes")
-                    return None
+        # 1. Page Load
+        stage_started = time.perf_counter()
+        async with self._host_slot(url):
+            response = await client.get(url, timeout=ATTACHMENT_TIMEOUT, follow_redirects=True)
+        try:
+            if response.status_code != 200:
+                return None
+            # 2. Find Attachment Links
+            target_link = self._find_attachment_link(response.text, str(response.url))
+        finally:
+            stats.add_stage("page", time.perf_counter() - stage_started)
+
+        # If no direct link found (likely JS), we skip for now (Phase 1 Limitation).
+        if not target_link:
+            return None
+        stats.attachments += 1
 
-                file_resp = await client.get(target_link)
-                content = file_resp.content
+        # 3. Download File (스트리밍, 크기 제한, 이전 응답 검증자로 조건부 요청)
+        validator = await attachment_cache.get_validator(target_link)
+        stage_started = time.perf_counter()
+        try:
+            async with self._host_slot(target_link):
+                attachment = await self._stream_download(client, target_link, stats, validator)
+                if attachment is not None and attachment.content is None:
+                    attachment.text = await attachment_cache.get_text(_text_cache_key(validator.sha256))
+                    if attachment.text is None:
+                        # 검증자만 남고 텍스트는 캐시에서 삭제된 경우 → 조건 없이 다시 받음
+                        attachment = await self._stream_download(client, target_link, stats)
+        finally:
+            stats.add_stage("download", time.perf_counter() - stage_started)
+
+        if attachment is None:
+            return None
+        if attachment.content is None:
+            stats.not_modified += 1
+        else:
+            stats.downloaded += 1
+        return attachment
 
-                # 4. Parse
-                # Wrap content in AsyncFile-like object for file_service
-                filename = target_link.split("/")[-1]
-                if not any(filename.lower().endswith(ext) for ext in target_exts):
-                    # Try to guess from content-type or just default to .hwp if magic?
-                    pass
+    async def _stream_download(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        stats: AttachmentScrapeStats,
+        validator: AttachmentValidator | None = None,
+    ) -> Attachment | None:
+        """
+        max_bytes까지만 스트리밍으로 받고, 초과하면 즉시 연결을 끊고 None 반환
 
-                mock_file = AsyncBytesFile(content, filename)
-                from app.services.file_service import file_service
+        validator가 있으면 조건부 요청을 보내며, 304 응답이면 content 없는 Attachment를 반환합니다.
+        """
+        filename = url.split("/")[-1]
+        headers = validator.conditional_headers() if validator else None
+        async with client.stream(
+            "GET", url, headers=headers, timeout=ATTACHMENT_TIMEOUT, follow_redirects=True
+        ) as response:
+            if response.status_code == 304 and validator is not None:
+                record_cache_hit("attachment_not_modified")
+                return Attachment(filename, url, etag=validator.etag, last_modified=validator.last_modified)
+            if response.status_code != 200:
+                return None
+
+            declared = int(response.headers.get("content-length") or 0)
+            if declared > self.max_attachment_bytes:
+                stats.oversized += 1
+                logger.warning(f"File too large: {declared} bytes ({url})")
+                return None
+
+            buffer = bytearray()
+            async for chunk in response.aiter_bytes():
+                buffer.extend(chunk)
+                stats.bytes_downloaded += len(chunk)
+                if len(buffer) > self.max_attachment_bytes:
+                    stats.oversized += 1
+                    logger.warning(f"File too large: exceeded {self.max_attachment_bytes} bytes mid-stream ({url})")
+                    return None
+            return Attachment(
+                filename,
+                url,
+                content=bytes(buffer),
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+            )
+
+    async def _parse_attachment(self, attachment: Attachment, stats: AttachmentScrapeStats | None = None) -> str:
+        """
+        첨부파일 텍스트 추출 (이벤트 루프를 막지 않도록 추출 프로세스 풀에서 실행)
 
-                return await file_service.get_text_from_file(mock_file)
+        앞부분 ATTACHMENT_TEXT_MAX_CHARS자까지만 추출하며(남은 페이지/섹션은 읽지 않음),
+        304로 받은 텍스트나, 파일 SHA-256으로 캐시에 있는 텍스트는 파싱하지 않고 그대로 사용합니다.
+        """
+        from app.services.file_service import file_service
 
-        except Exception as e:
-            logger.warning(f"Failed to scrape attachment from {url}: {e}")
-            return None
+        stats = stats or AttachmentScrapeStats()
+        if attachment.text is not None:
+            stats.chars_extracted += len(attachment.text)
+            return attachment.text
+
+        stage_started = time.perf_counter()
+        try:
+            sha256 = await asyncio.to_thread(content_hash, attachment.content)
+            text = await attachment_cache.get_text(_text_cache_key(sha256))
+            if text is not None:
+                stats.cache_hits += 1
+            else:
+                text = await run_in_process(
+                    file_service.extract_text,
+                    attachment.content,
+                    attachment.filename,
+                    settings.ATTACHMENT_TEXT_MAX_CHARS or None,
+                )
+                stats.parsed += 1
+                await attachment_cache.put_text(_text_cache_key(sha256), text or "")
+        finally:
+            stats.add_stage("parse", time.perf_counter() - stage_started)
+
+        await attachment_cache.put_validator(
+            attachment.url,
+            AttachmentValidator(sha256=sha256, etag=attachment.etag, last_modified=attachment.last_modified),
+        )
+        stats.chars_extracted += len(text or "")
+        return text
+
+    def _find_attachment_link(self, html: str, base_url: str) -> str | None:
+        """
+        공고 페이지 HTML에서 첨부파일(.hwp, .hwpx, .pdf) 직접 링크 탐색
+
+        G2B는 "javascript:fn_download(...)" 형태가 많아 헤드리스 브라우저 없이는 파싱이 어렵고,
+        직접 HTTP 링크가 있는 경우만 처리합니다 (Phase 1 Limitation).
+        """
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html, "html.parser")
+        for a in soup.find_all("a", href=True):
+            href = a["href"]
+            if any(href.lower().endswith(ext) for ext in ATTACHMENT_EXTENSIONS):
+                # 상대 경로는 페이지 URL 기준으로 변환
+                return href if href.startswith("http") else urljoin(base_url, href)
+        return None
+
+    @asynccontextmanager
+    async def _host_slot(self, url: str) -> AsyncIterator[None]:
+        """호스트별 동시 요청 수 제한 (politeness)"""
+        host = urlsplit(url).netloc
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self.per_host_concurrency)
+        async with slot:
+            yield
 
     def _parse_api_response(self, data: dict) -> list[dict]:
-        announcements = []
-        items = data.get("response", {}).get("body", {}).get("items", [])
+        return self._parse_items(data.get("response", {}).get("body", {}).get("items", []))
 
+    def _parse_items(self, items: list[dict]) -> list[dict]:
+        announcements = []
         for item in items:
             # posted_at은 DB에서 Not Null이므로 필수값 처리
             posted_at = self._parse_datetime(item.get("bidNtceDt"))
@@ -324,7 +731,7 @@ class G2BCrawlerService:
         if not date_str:
             return None
         try:
-            return datetime.strptime(date_str, "%Y%m%d%H%M")
+            return datetime.strptime(date_str, G2B_DATETIME_FORMAT)
         except (ValueError, TypeError):
             return None
 
@@ -333,33 +740,31 @@ class G2BCrawlerService:
         announcement: dict,
         exclude_keywords: list[str] = None,
         include_keywords: list[str] = None,
+        matcher: KeywordMatcher | None = None,
     ) -> bool:
         """
         공고가 알림 대상인지 판단 (스마트 필터링)
-        """
-        if exclude_keywords is None:
-            exclude_keywords = self.DEFAULT_EXCLUDE_KEYWORDS
 
-        if include_keywords is None:
-            include_keywords = self.INCLUDE_KEYWORDS_CONCESSION + self.INCLUDE_KEYWORDS_FLOWER
+        포함/제외 키워드를 컴파일한 매처로 본문을 한 번만 훑습니다.
+        matcher를 넘기면 exclude_keywords / include_keywords는 무시됩니다.
+        """
+        if matcher is None:
+            if exclude_keywords is None:
+                exclude_keywords = self.DEFAULT_EXCLUDE_KEYWORDS
 
-        title = announcement["title"].lower()
-        content = announcement.get("content", "").lower()
-        full_text = f"{title} {content}"
+            if include_keywords is None:
+                include_keywords = self.INCLUDE_KEYWORDS_CONCESSION + self.INCLUDE_KEYWORDS_FLOWER
 
-        # 제외 키워드 체크
-        for keyword in exclude_keywords:
-            if keyword in full_text:
-                return False
+            matcher = get_keyword_matcher(include_keywords, exclude_keywords)
 
-        # 포함 키워드 체크
-        matched_keywords = []
+        result = matcher.match(build_search_text(announcement["title"], announcement.get("content")))
 
-        for keyword in include_keywords:
-            if keyword in full_text:
-                matched_keywords.append(keyword)
+        # 제외 키워드 체크
+        if result.excluded:
+            return False
 
         # 키워드 매칭 저장
+        matched_keywords = result.include
         announcement["keywords_matched"] = matched_keywords
 
         # 최소 1개 이상의 키워드 매칭 필요
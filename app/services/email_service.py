@@ -5,20 +5,47 @@ Phase 8: Email notification system for bid alerts
 
 import os
 
+import httpx
+
 try:
-    from sendgrid import SendGridAPIClient
     from sendgrid.helpers.mail import Content, Email, Mail, Personalization, To
 
     SENDGRID_AVAILABLE = True
 except ImportError:
     SENDGRID_AVAILABLE = False
-    SendGridAPIClient = None
     Mail = None
 
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.core.logging import logger
 
 
+class RetryableEmailError(Exception):
+    """재시도 가능한 이메일 발송 실패 (SendGrid 429 / 5xx, 네트워크 오류)"""
+
+
+class SendGridClient:
+    """
+    SendGrid v3 Mail Send API 비동기 클라이언트
+
+    SDK의 동기 HTTP 클라이언트 대신 공유 "sendgrid" 커넥션 풀로 발송하여
+    이벤트 루프를 막지 않고 keep-alive 연결을 재사용합니다.
+    """
+
+    MAIL_SEND_URL = "https://api.sendgrid.com/v3/mail/send"
+
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+
+    async def send(self, message: "Mail") -> httpx.Response:
+        client = get_http_client("sendgrid")
+        return await client.post(
+            self.MAIL_SEND_URL,
+            json=message.get(),
+            headers={"Authorization": f"Bearer {self.api_key}"},
+        )
+
+
 class EmailService:
     """
     SendGrid email service for sending notifications
@@ -38,7 +65,7 @@ class EmailService:
         self.from_name = os.getenv("SENDGRID_FROM_NAME", "Biz-Retriever")
 
         if self.api_key and self.api_key.startswith("SG."):
-            self.client = SendGridAPIClient(self.api_key)
+            self.client = SendGridClient(self.api_key)
             logger.info("EmailService: SendGrid API initialized")
         else:
             self.client = None
@@ -54,6 +81,7 @@ class EmailService:
         subject: str,
         html_content: str,
         plain_content: str | None = None,
+        raise_retryable: bool = False,
     ) -> bool:
         """
         Send a single email
@@ -63,9 +91,13 @@ class EmailService:
             subject: Email subject
             html_content: HTML email body
             plain_content: Plain text fallback (optional)
+            raise_retryable: 일시 오류(429 / 5xx / 네트워크)는 False 대신 RetryableEmailError 발생
 
         Returns:
-            bool: True if sent successfully, False otherwise
+            bool: True if sent successfully, False otherwise (4xx 등 재시도해도 실패할 오류)
+
+        Raises:
+            RetryableEmailError: raise_retryable이고 일시 오류인 경우
         """
         if not self.is_configured():
             logger.error("SendGrid not configured. Cannot send email.")
@@ -86,19 +118,26 @@ class EmailService:
                     Content("text/html", html_content),
                 ]
 
-            response = self.client.send(message)
-
-            if response.status_code in [200, 202]:
-                logger.info(f"Email sent successfully to {to_email}: {subject}")
-                return True
-            else:
-                logger.error(f"Failed to send email. Status: {response.status_code}, Body: {response.body}")
-                return False
+            response = await self.client.send(message)
 
+        except httpx.RequestError as e:
+            logger.error(f"Error sending email to {to_email}: {str(e)}")
+            if raise_retryable:
+                raise RetryableEmailError(f"SendGrid request failed: {e}") from e
+            return False
         except Exception as e:
             logger.error(f"Error sending email to {to_email}: {str(e)}", exc_info=True)
             return False
 
+        if response.status_code in [200, 202]:
+            logger.info(f"Email sent successfully to {to_email}: {subject}")
+            return True
+
+        logger.error(f"Failed to send email. Status: {response.status_code}, Body: {response.text}")
+        if raise_retryable and (response.status_code == 429 or response.status_code >= 500):
+            raise RetryableEmailError(f"SendGrid error ({response.status_code})")
+        return False
+
     async def send_bulk_email(
         self,
         recipients: list[str],
@@ -293,7 +332,9 @@ class EmailService:
 
         return html_content, plain_text
 
-    async def send_bid_alert(self, to_email: str, user_name: str, bid_data: dict) -> bool:
+    async def send_bid_alert(
+        self, to_email: str, user_name: str, bid_data: dict, raise_retryable: bool = False
+    ) -> bool:
         """
         Send bid alert email to user
 
@@ -301,6 +342,7 @@ class EmailService:
             to_email: User email address
             user_name: User name for personalization
             bid_data: Dictionary containing bid information
+            raise_retryable: send_email 참고
 
         Returns:
             bool: True if sent successfully
@@ -318,7 +360,102 @@ class EmailService:
 
         subject = f"🔔 새로운 맞춤 공고: {bid_data.get('title', '공고')}"
 
-        return await self.send_email(to_email, subject, html_content, plain_content)
+        return await self.send_email(to_email, subject, html_content, plain_content, raise_retryable=raise_retryable)
+
+    async def send_bid_digest(
+        self, to_email: str, user_name: str, bids: list[dict], raise_retryable: bool = False
+    ) -> bool:
+        """
+        Send matched bids as a single email
+
+        Args:
+            to_email: User email address
+            user_name: User name for personalization
+            bids: List of bid data dictionaries (same keys as send_bid_alert)
+            raise_retryable: send_email 참고
+
+        Returns:
+            bool: True if sent successfully
+        """
+        if len(bids) == 1:
+            return await self.send_bid_alert(to_email, user_name, bids[0], raise_retryable=raise_retryable)
+
+        html_content, plain_content = self.render_bid_digest_email(user_name=user_name, bids=bids)
+        subject = f"🔔 새로운 맞춤 공고 {len(bids)}건"
+
+        return await self.send_email(to_email, subject, html_content, plain_content, raise_retryable=raise_retryable)
+
+    def render_bid_digest_email(self, user_name: str, bids: list[dict]) -> tuple[str, str]:
+        """
+        Render multi-bid digest email template
+
+        Returns:
+            tuple: (html_content, plain_content)
+        """
+        plain_text = f"안녕하세요 {user_name}님,\n\n새로운 맞춤 공고 {len(bids)}건이 등록되었습니다!\n"
+        rows = []
+        for bid in bids:
+            keywords = ", ".join(bid.get("keywords_matched") or [])
+            plain_text += (
+                f"\n📋 {bid.get('title', '제목 없음')}\n"
+                f"🏢 {bid.get('agency', '기관 미정')} | 📅 {bid.get('deadline', '미정')} | "
+                f"💰 {bid.get('estimated_price', '미정')}\n"
+                f"🏷️ {keywords}\n"
+                f"🔗 {bid.get('url', settings.FRONTEND_URL)}\n"
+            )
+            rows.append(
+                f"""
+                    <tr>
+                        <td style="padding: 15px 30px; border-bottom: 1px solid #eeeeee;">
+                            <a href="{bid.get('url', settings.FRONTEND_URL)}" style="font-size: 16px; color: #333333; font-weight: 600; text-decoration: none;">📋 {bid.get('title', '제목 없음')}</a>
+                            <p style="margin: 8px 0 0; font-size: 13px; color: #666666;">🏢 {bid.get('agency', '기관 미정')} · 📅 {bid.get('deadline', '미정')} · 💰 {bid.get('estimated_price', '미정')}</p>
+                            <p style="margin: 4px 0 0; font-size: 12px; color: #667eea;">🏷️ {keywords}</p>
+                        </td>
+                    </tr>"""
+            )
+        plain_text += "\n감사합니다.\nBiz-Retriever 팀"
+
+        html_content = f"""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>새로운 맞춤 공고 알림</title>
+</head>
+<body style="margin: 0; padding: 0; font-family: 'Malgun Gothic', '맑은 고딕', Arial, sans-serif; background-color: #f5f5f5;">
+    <table role="presentation" cellspacing="0" cellpadding="0" border="0" width="100%" style="background-color: #f5f5f5;">
+        <tr>
+            <td style="padding: 40px 20px;">
+                <table role="presentation" cellspacing="0" cellpadding="0" border="0" width="100%" style="max-width: 600px; margin: 0 auto; background-color: #ffffff; border-radius: 8px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
+                    <tr>
+                        <td style="padding: 30px 30px 20px; text-align: center; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 8px 8px 0 0;">
+                            <h1 style="margin: 0; color: #ffffff; font-size: 24px; font-weight: 600;">🐕 Biz-Retriever</h1>
+                            <p style="margin: 10px 0 0; color: #ffffff; font-size: 14px;">새로운 맞춤 공고 {len(bids)}건</p>
+                        </td>
+                    </tr>
+                    <tr>
+                        <td style="padding: 30px 30px 10px;">
+                            <p style="margin: 0; font-size: 16px; color: #333333;">안녕하세요 <strong>{user_name}</strong>님,</p>
+                        </td>
+                    </tr>{"".join(rows)}
+                    <tr>
+                        <td style="padding: 20px 30px; background-color: #f8f9fa; border-radius: 0 0 8px 8px; text-align: center;">
+                            <p style="margin: 0; font-size: 12px; color: #999999;">
+                                이 메일은 Biz-Retriever에서 자동으로 발송되었습니다.<br>
+                                알림 설정을 변경하려면 <a href="{settings.FRONTEND_URL}/profile.html" style="color: #667eea; text-decoration: none;">프로필 페이지</a>에서 관리하세요.
+                            </p>
+                        </td>
+                    </tr>
+                </table>
+            </td>
+        </tr>
+    </table>
+</body>
+</html>
+"""
+
+        return html_content, plain_text
 
     async def send_subscription_notification(
         self,
@@ -1,93 +1,59 @@
-import io
-
-import PyPDF2
 from fastapi import UploadFile
 
 from app.core.logging import logger
+from app.core.process_pool import run_in_process
+from app.services.hwp_parser import HwpFormatError, iter_hwp_paragraphs
+from app.services.hwpx_parser import HwpxFormatError, iter_hwpx_paragraphs
+from app.services.pdf_parser import iter_pdf_pages
 
 
 class FileService:
-    async def parse_pdf(self, file: UploadFile) -> str:
+    async def parse_pdf(self, file: UploadFile, max_chars: int | None = None) -> str:
         """
         Extract text from PDF file.
+
+        추출은 공유 프로세스 풀에서 실행합니다 (이벤트 루프 차단 방지).
         """
         try:
             content = await file.read()
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text
+            return await run_in_process(self.extract_pdf_text, content, max_chars)
         except Exception as e:
             logger.error(f"PDF 파싱 에러: {e}", exc_info=True)
             return f"Error extracting text from PDF: {str(e)}"
 
-    async def parse_hwp(self, file: UploadFile) -> str:
+    async def parse_hwp(self, file: UploadFile, max_chars: int | None = None) -> str:
         """
         Extract text from HWP file using olefile.
+
+        추출은 공유 프로세스 풀에서 실행합니다 (이벤트 루프 차단 방지).
         """
         try:
-            import zlib
-
-            import olefile
-
             content = await file.read()
-            # olefile requires a file-like object or path. BytesIO works.
-            f = io.BytesIO(content)
-
-            if not olefile.isOleFile(f):
-                return "Not a valid HWP file (OLE format check failed)."
-
-            ole = olefile.OleFileIO(f)
-            text = ""
-
-            # HWP 5.0 structure: BodyText/SectionX
-            dirs = ole.listdir()
-            body_sections = [d for d in dirs if d[0] == "BodyText"]
-
-            for section in body_sections:
-                stream = ole.openstream(section)
-                data = stream.read()
-
-                # Decompress zlib stream
-                # HWP BodyText is zlib compressed
-                try:
-                    decompressed = zlib.decompress(data, -15)  # -15 for raw stream
-                except zlib.error:
-                    try:
-                        decompressed = zlib.decompress(data)
-                    except zlib.error:
-                        continue  # Skip if decompression fails
-
-                # Extract generic text (simple extraction of UTF-16LE strings)
-                # This is a heuristic approach for HWP 5.0 text extraction without heavy parsers
-                # Proper parsing requires structuring the HWP record format,
-                # but for MVP, we extract valid unicode sequences.
-
-                # HWP text is usually UTF-16LE
-                try:
-                    # Decoding strategy: HWP uses 16-bit characters.
-                    # We simply try to decode as utf-16le and filter meaningful chars
-                    decoded = decompressed.decode("utf-16le", errors="ignore")
-
-                    # Clean up control characters and noise
-                    # Filter for Hangul, English, Numbers, standard punctuation
-                    # This is rough; for production we need a better parser lib if accuracy is key.
-                    # But Python based libhwp alternatives are scarce or heavy.
-                    # olefile extraction is metadata-level or stream-level.
-                    # Raw stream contains formatting tags. We just want text for Search/RAG.
-
-                    text += decoded + "\n"
-                except Exception:
-                    pass
-
-            return text if text else "Exracted text is empty (HWP parsing limitation)."
-
+            text = await run_in_process(self.extract_hwp_text, content, max_chars)
         except ImportError:
             return "olefile is not installed."
+        except HwpFormatError as e:
+            return str(e)
         except Exception as e:
             logger.error(f"HWP 파싱 에러: {e}", exc_info=True)
             return f"Error extracting text from HWP: {str(e)}"
+        return text if text else "Exracted text is empty (HWP parsing limitation)."
+
+    async def parse_hwpx(self, file: UploadFile, max_chars: int | None = None) -> str:
+        """
+        Extract text from HWPX (zip/XML) file.
+
+        추출은 공유 프로세스 풀에서 실행합니다 (이벤트 루프 차단 방지).
+        """
+        try:
+            content = await file.read()
+            text = await run_in_process(self.extract_hwpx_text, content, max_chars)
+        except HwpxFormatError as e:
+            return str(e)
+        except Exception as e:
+            logger.error(f"HWPX 파싱 에러: {e}", exc_info=True)
+            return f"Error extracting text from HWPX: {str(e)}"
+        return text if text else "Extracted text is empty (HWPX has no body text)."
 
     async def get_text_from_file(self, file: UploadFile) -> str:
         filename = file.filename.lower()
@@ -95,8 +61,67 @@ class FileService:
             return await self.parse_pdf(file)
         elif filename.endswith(".hwp"):
             return await self.parse_hwp(file)
+        elif filename.endswith(".hwpx"):
+            return await self.parse_hwpx(file)
         else:
             return "Unsupported file format. Please upload PDF or HWP."
 
+    def extract_text(self, content: bytes, filename: str, max_chars: int | None = None) -> str:
+        """
+        파일 바이트에서 텍스트 추출 (동기)
+
+        이벤트 루프를 막지 않도록 추출 프로세스 풀(run_in_process)에서 호출하는 용도이며,
+        파싱 실패 시 예외를 그대로 전파합니다. 본문이 없으면 빈 문자열을 반환합니다.
+
+        Args:
+            max_chars: 추출할 최대 글자 수 (None이면 전체)
+
+        Raises:
+            HwpFormatError / HwpxFormatError: 손상되었거나 암호화된 HWP / HWPX
+            ValueError: 지원하지 않는 파일 형식
+        """
+        name = filename.lower()
+        if name.endswith(".pdf"):
+            return self.extract_pdf_text(content, max_chars)
+        elif name.endswith(".hwp"):
+            return self.extract_hwp_text(content, max_chars)
+        elif name.endswith(".hwpx"):
+            return self.extract_hwpx_text(content, max_chars)
+        else:
+            raise ValueError("Unsupported file format. Please upload PDF or HWP.")
+
+    def extract_pdf_text(self, content: bytes, max_chars: int | None = None, max_pages: int | None = None) -> str:
+        """
+        PDF 바이트에서 페이지별 텍스트 추출
+
+        페이지를 앞에서부터 필요한 만큼만 추출하며, max_chars / max_pages에 도달하면
+        남은 페이지는 읽지 않습니다. 같은 파일을 다시 요청하면 추출한 페이지를 재사용합니다.
+        """
+        return "\n".join(iter_pdf_pages(content, max_chars=max_chars, max_pages=max_pages))
+
+    def extract_hwp_text(self, content: bytes, max_chars: int | None = None) -> str:
+        """
+        HWP 5.0 (OLE) 바이트에서 본문 문단 텍스트 추출
+
+        BodyText 레코드 중 문단 텍스트(HWPTAG_PARA_TEXT)만 문단 단위로 읽으며,
+        max_chars에 도달하면 남은 레코드는 읽지 않습니다.
+
+        Raises:
+            HwpFormatError: OLE 형식이 아니거나 암호화된 문서
+        """
+        return "\n".join(iter_hwp_paragraphs(content, max_chars=max_chars))
+
+    def extract_hwpx_text(self, content: bytes, max_chars: int | None = None) -> str:
+        """
+        HWPX (zip/XML) 바이트에서 본문 문단 텍스트 추출
+
+        섹션 XML을 청크 단위로 압축 해제하며 증분 파싱하고, max_chars에 도달하면
+        남은 섹션은 읽지 않습니다.
+
+        Raises:
+            HwpxFormatError: zip 형식이 아니거나 본문 섹션이 없는 문서
+        """
+        return "\n".join(iter_hwpx_paragraphs(content, max_chars=max_chars))
+
 
 file_service = FileService()
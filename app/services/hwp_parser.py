@@ -0,0 +1,232 @@
+"""
+HWP 5.0 본문 텍스트 파서 (레코드 단위 스트리밍)
+
+BodyText/Section* 스트림을 한 번에 풀어서 통째로 UTF-16LE 디코딩하면 서식/컨트롤 레코드까지
+텍스트에 섞이고, 큰 문서는 압축 해제 결과 전체를 메모리에 올리게 됩니다.
+이 파서는 스트림을 청크 단위로 압축 해제하면서 레코드 헤더를 따라가고,
+문단 텍스트 레코드(HWPTAG_PARA_TEXT)만 골라 문단 단위로 반환합니다.
+
+- 제너레이터: 문단을 하나씩 yield (필요한 만큼만 읽고 중단 가능)
+- max_chars: 누적 글자 수 예산 (예산에 도달하면 남은 섹션은 읽지 않음)
+- 표/글상자 안의 문단도 같은 레코드로 저장되므로 함께 추출
+
+레코드 헤더 (4바이트, little-endian):
+    tag_id = bits 0-9, level = bits 10-19, size = bits 20-31 (0xFFF이면 다음 4바이트가 실제 크기)
+
+사용법:
+    from app.services.hwp_parser import iter_hwp_paragraphs
+
+    for paragraph in iter_hwp_paragraphs(content, max_chars=10_000):
+        ...
+"""
+
+import io
+import re
+import sys
+import zlib
+from collections.abc import Iterator
+from typing import BinaryIO
+
+from app.core.logging import logger
+
+HWPTAG_BEGIN = 0x010
+HWPTAG_PARA_TEXT = HWPTAG_BEGIN + 51
+
+FILE_HEADER_SIGNATURE = b"HWP Document File"
+FILE_HEADER_COMPRESSED = 0x01
+FILE_HEADER_ENCRYPTED = 0x02
+
+READ_CHUNK_SIZE = 64 * 1024  # 압축 스트림 읽기 단위
+MAX_INFLATE_CHUNK = 256 * 1024  # 압축 해제 1회 최대 출력 (압축률이 높은 스트림의 메모리 급증 방지)
+
+# 문자 컨트롤 (1 WCHAR): 텍스트로 치환하거나 버림
+_CHAR_CONTROLS = {0, 10, 13, 24, 25, 26, 27, 28, 29, 30, 31}
+# 인라인/확장 컨트롤은 코드 + 파라미터로 8 WCHAR를 차지 (탭만 텍스트로 남김)
+_CONTROL_WCHARS = 8
+_CONTROL_TEXT = {9: "\t", 10: "\n", 24: "-", 30: " ", 31: " "}
+# 코드값 0-31인 WCHAR 후보 위치 (겹치는 위치도 찾도록 lookahead, 짝수 오프셋만 사용)
+_CONTROL_PATTERN = re.compile(rb"(?=[\x00-\x1f]\x00)")
+
+
+class HwpFormatError(ValueError):
+    """HWP 5.0 문서로 읽을 수 없는 경우 (OLE 아님, 암호화 등)"""
+
+
+def iter_hwp_paragraphs(content: bytes, max_chars: int | None = None) -> Iterator[str]:
+    """
+    HWP 5.0 문서의 본문 문단을 순서대로 반환
+
+    Args:
+        content: HWP 파일 바이트
+        max_chars: 반환할 최대 글자 수 (문단 구분자 제외, None이면 제한 없음)
+
+    Yields:
+        빈 문단을 제외한 문단 텍스트 (예산 경계에 걸친 문단은 잘라서 반환)
+
+    Raises:
+        HwpFormatError: OLE 형식이 아니거나 암호화된 문서
+    """
+    import olefile
+
+    f = io.BytesIO(content)
+    if not olefile.isOleFile(f):
+        raise HwpFormatError("Not a valid HWP file (OLE format check failed).")
+
+    ole = olefile.OleFileIO(f)
+    try:
+        compressed = _is_compressed(ole)
+        paragraphs = (
+            paragraph
+            for section in _body_sections(ole)
+            for paragraph in _iter_section_paragraphs(ole.openstream(section), compressed)
+        )
+        yield from limit_chars(paragraphs, max_chars)
+    finally:
+        ole.close()
+
+
+def limit_chars(paragraphs: Iterator[str], max_chars: int | None) -> Iterator[str]:
+    """
+    문단 이터레이터에 글자 수 예산 적용 (HWP/HWPX 파서 공통)
+
+    누적 글자 수가 max_chars에 도달하면 마지막 문단을 잘라 반환하고 원본 이터레이터를 닫아
+    남은 스트림은 읽지 않습니다.
+    """
+    if max_chars is None:
+        yield from paragraphs
+        return
+    remaining = max_chars
+    try:
+        for paragraph in paragraphs:
+            if len(paragraph) >= remaining:
+                if remaining:
+                    yield paragraph[:remaining]
+                return
+            remaining -= len(paragraph)
+            yield paragraph
+    finally:
+        close = getattr(paragraphs, "close", None)
+        if close is not None:
+            close()
+
+
+def _is_compressed(ole) -> bool:
+    """FileHeader 속성 비트로 압축 여부 확인 (FileHeader가 없으면 HWP 기본값인 압축으로 간주)"""
+    if not ole.exists("FileHeader"):
+        return True
+    header = ole.openstream("FileHeader").read(40)
+    if not header.startswith(FILE_HEADER_SIGNATURE) or len(header) < 40:
+        return True
+    flags = int.from_bytes(header[36:40], "little")
+    if flags & FILE_HEADER_ENCRYPTED:
+        raise HwpFormatError("Encrypted HWP documents are not supported.")
+    return bool(flags & FILE_HEADER_COMPRESSED)
+
+
+def _body_sections(ole) -> list[list[str]]:
+    """BodyText/Section0, Section1, ... (번호 순서)"""
+
+    def section_no(entry: list[str]) -> int:
+        try:
+            return int(entry[1].removeprefix("Section"))
+        except ValueError:
+            return sys.maxsize
+
+    sections = [d for d in ole.listdir() if len(d) == 2 and d[0] == "BodyText"]
+    return sorted(sections, key=section_no)
+
+
+def _iter_section_paragraphs(stream: BinaryIO, compressed: bool) -> Iterator[str]:
+    """섹션 스트림 하나의 PARA_TEXT 레코드를 문단 텍스트로 변환"""
+    try:
+        for tag_id, payload in _iter_records(_iter_stream_chunks(stream, compressed)):
+            if tag_id != HWPTAG_PARA_TEXT:
+                continue
+            paragraph = decode_para_text(payload).strip()
+            if paragraph:
+                yield paragraph
+    except zlib.error as e:
+        logger.warning(f"HWP 섹션 압축 해제 실패 (건너뜀): {e}")
+
+
+def _iter_stream_chunks(stream: BinaryIO, compressed: bool) -> Iterator[bytes]:
+    """섹션 스트림을 READ_CHUNK_SIZE씩 읽어 (필요 시 압축 해제하여) 반환"""
+    if not compressed:
+        while chunk := stream.read(READ_CHUNK_SIZE):
+            yield chunk
+        return
+
+    # HWP 본문은 raw deflate, 일부 생성기는 zlib 헤더 포함 → 첫 청크에서 판별
+    decompressor = None
+    while chunk := stream.read(READ_CHUNK_SIZE):
+        if decompressor is None:
+            decompressor = zlib.decompressobj(-15)
+            try:
+                first = decompressor.decompress(chunk, MAX_INFLATE_CHUNK)
+            except zlib.error:
+                decompressor = zlib.decompressobj()
+                first = decompressor.decompress(chunk, MAX_INFLATE_CHUNK)
+            if first:
+                yield first
+            data = decompressor.unconsumed_tail
+        else:
+            data = chunk
+        while data:
+            out = decompressor.decompress(data, MAX_INFLATE_CHUNK)
+            if out:
+                yield out
+            data = decompressor.unconsumed_tail
+        if decompressor.eof:
+            break
+    if decompressor is not None and (tail := decompressor.flush()):
+        yield tail
+
+
+def _iter_records(chunks: Iterator[bytes]) -> Iterator[tuple[int, bytes]]:
+    """바이트 청크 스트림에서 (tag_id, payload) 레코드를 순서대로 추출"""
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        pos = 0
+        available = len(buffer)
+        while available - pos >= 4:
+            header = int.from_bytes(buffer[pos : pos + 4], "little")
+            tag_id = header & 0x3FF
+            size = header >> 20
+            start = pos + 4
+            if size == 0xFFF:
+                if available - pos < 8:
+                    break
+                size = int.from_bytes(buffer[pos + 4 : pos + 8], "little")
+                start = pos + 8
+            if available - start < size:
+                break
+            # PARA_TEXT 외 레코드는 payload를 복사하지 않음
+            yield tag_id, bytes(buffer[start : start + size]) if tag_id == HWPTAG_PARA_TEXT else b""
+            pos = start + size
+        del buffer[:pos]
+
+
+def decode_para_text(payload: bytes) -> str:
+    """
+    PARA_TEXT 레코드 payload(UTF-16LE WCHAR 배열)를 텍스트로 변환
+
+    문자 컨트롤(줄바꿈, 묶음 빈칸 등)은 대응 문자로 치환하고, 인라인/확장 컨트롤
+    (표, 그림, 각주, 필드 등 8 WCHAR)은 탭을 제외하고 모두 버립니다.
+    """
+    end = len(payload) // 2 * 2
+    parts: list[str] = []
+    start = 0
+    for match in _CONTROL_PATTERN.finditer(payload, 0, end):
+        pos = match.start()
+        # WCHAR 경계가 아니거나 직전 컨트롤의 파라미터 영역이면 무시
+        if pos % 2 or pos < start:
+            continue
+        code = payload[pos]
+        if start < pos:
+            parts.append(payload[start:pos].decode("utf-16le", errors="ignore"))
+        parts.append(_CONTROL_TEXT.get(code, ""))
+        start = pos + 2 * (1 if code in _CHAR_CONTROLS else _CONTROL_WCHARS)
+    if start < end:
+        parts.append(payload[start:end].decode("utf-16le", errors="ignore"))
+    return "".join(parts)
@@ -0,0 +1,161 @@
+"""
+HWPX (OWPML, zip 컨테이너) 본문 텍스트 파서 (스트리밍)
+
+HWPX는 zip 아카이브 안에 섹션별 XML(Contents/section0.xml, ...)을 담는 형식입니다.
+아카이브나 섹션 XML을 통째로 풀지 않고, 섹션 멤버를 청크 단위로 압축 해제하면서
+증분 XML 파서(XMLPullParser)에 넘겨 문단(<hp:p>)이 끝날 때마다 텍스트를 반환합니다.
+
+- 제너레이터: 문단을 하나씩 yield (HWP 파서와 같은 인터페이스)
+- max_chars: 누적 글자 수 예산 (예산에 도달하면 남은 섹션은 압축 해제하지 않음)
+- 섹션 순서는 content.hpf의 spine을 따르고, 없으면 section 번호 순서
+- 표/글상자 안의 문단(hp:subList)도 각각 하나의 문단으로 반환
+
+사용법:
+    from app.services.hwpx_parser import iter_hwpx_paragraphs
+
+    for paragraph in iter_hwpx_paragraphs(content, max_chars=10_000):
+        ...
+"""
+
+import io
+import re
+import zipfile
+from collections.abc import Iterator
+from typing import BinaryIO
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser, fromstring
+
+from app.core.logging import logger
+from app.services.hwp_parser import limit_chars
+
+READ_CHUNK_SIZE = 64 * 1024  # 섹션 XML 압축 해제/파싱 단위
+
+MANIFEST_PATH = "Contents/content.hpf"
+_SECTION_PATTERN = re.compile(r"^Contents/section(\d+)\.xml$", re.IGNORECASE)
+
+# <hp:t> 안의 인라인 요소 중 텍스트로 남기는 것 (나머지는 버리고 tail만 사용)
+_INLINE_TEXT = {"tab": "\t", "lineBreak": "\n", "fwSpace": " ", "nbSpace": " ", "hyphen": "-"}
+
+
+class HwpxFormatError(ValueError):
+    """HWPX 문서로 읽을 수 없는 경우 (zip 아님, 섹션 없음, 암호화 등)"""
+
+
+def iter_hwpx_paragraphs(source: bytes | BinaryIO, max_chars: int | None = None) -> Iterator[str]:
+    """
+    HWPX 문서의 본문 문단을 순서대로 반환
+
+    Args:
+        source: HWPX 파일 바이트 또는 seek 가능한 바이너리 파일 객체
+        max_chars: 반환할 최대 글자 수 (문단 구분자 제외, None이면 제한 없음)
+
+    Yields:
+        빈 문단을 제외한 문단 텍스트 (예산 경계에 걸친 문단은 잘라서 반환)
+
+    Raises:
+        HwpxFormatError: zip 형식이 아니거나 본문 섹션이 없는 문서, 암호화된 문서
+    """
+    f = io.BytesIO(source) if isinstance(source, bytes | bytearray) else source
+    try:
+        archive = zipfile.ZipFile(f)
+    except zipfile.BadZipFile as e:
+        raise HwpxFormatError("Not a valid HWPX file (zip format check failed).") from e
+
+    with archive:
+        sections = _body_sections(archive)
+        if not sections:
+            raise HwpxFormatError("Not a valid HWPX file (no body sections).")
+        if _is_encrypted(archive):
+            raise HwpxFormatError("Encrypted HWPX documents are not supported.")
+        paragraphs = (paragraph for section in sections for paragraph in _iter_section_paragraphs(archive, section))
+        yield from limit_chars(paragraphs, max_chars)
+
+
+def _local(tag: str) -> str:
+    """네임스페이스를 제외한 태그 이름 (OWPML 2011/2016 네임스페이스 공통 처리)"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _body_sections(archive: zipfile.ZipFile) -> list[str]:
+    """본문 섹션 멤버 경로 (content.hpf spine 순서, 없으면 section 번호 순서)"""
+    names = set(archive.namelist())
+    if MANIFEST_PATH in names:
+        try:
+            sections = _spine_sections(archive.read(MANIFEST_PATH))
+        except ParseError as e:
+            logger.warning(f"HWPX content.hpf 파싱 실패 (파일 이름 순서 사용): {e}")
+        else:
+            sections = [name for name in sections if name in names]
+            if sections:
+                return sections
+
+    numbered = [(int(m.group(1)), name) for name in names if (m := _SECTION_PATTERN.match(name))]
+    return [name for _, name in sorted(numbered)]
+
+
+def _spine_sections(manifest: bytes) -> list[str]:
+    """content.hpf의 manifest/spine에서 섹션 XML 경로를 읽기 순서대로 추출"""
+    root = fromstring(manifest)
+    hrefs = {
+        item.get("id"): item.get("href", "") for item in root.iter() if _local(item.tag) == "item" and item.get("id")
+    }
+    sections = []
+    for itemref in root.iter():
+        if _local(itemref.tag) != "itemref":
+            continue
+        href = hrefs.get(itemref.get("idref"), "")
+        if _SECTION_PATTERN.match(href):
+            sections.append(href)
+    return sections
+
+
+def _is_encrypted(archive: zipfile.ZipFile) -> bool:
+    """META-INF/manifest.xml에 암호화 정보가 있거나 zip 멤버 자체가 암호화된 경우"""
+    if any(info.flag_bits & 0x1 for info in archive.infolist()):
+        return True
+    try:
+        manifest = archive.read("META-INF/manifest.xml")
+    except KeyError:
+        return False
+    return b"encryption-data" in manifest
+
+
+def _iter_section_paragraphs(archive: zipfile.ZipFile, name: str) -> Iterator[str]:
+    """섹션 XML 하나를 청크 단위로 파싱하여 문단 텍스트 반환"""
+    parser = XMLPullParser(events=("start", "end"))
+    # 중첩 문단(표 셀 등)마다 텍스트 조각을 따로 모음
+    stack: list[list[str]] = []
+    try:
+        with archive.open(name) as member:
+            while chunk := member.read(READ_CHUNK_SIZE):
+                parser.feed(chunk)
+                yield from _drain(parser, stack)
+        parser.close()
+        yield from _drain(parser, stack)
+    except (ParseError, zipfile.BadZipFile, zipfile.LargeZipFile, EOFError) as e:
+        logger.warning(f"HWPX 섹션 파싱 실패 (건너뜀): {name}: {e}")
+
+
+def _drain(parser: XMLPullParser, stack: list[list[str]]) -> Iterator[str]:
+    for event, elem in parser.read_events():
+        tag = _local(elem.tag)
+        if tag == "p":
+            if event == "start":
+                stack.append([])
+                continue
+            parts = stack.pop() if stack else []
+            # 파싱이 끝난 문단의 하위 요소는 버려 메모리 사용량을 섹션 크기와 무관하게 유지
+            elem.clear()
+            paragraph = "".join(parts).strip()
+            if paragraph:
+                yield paragraph
+        elif tag == "t" and event == "end" and stack:
+            stack[-1].append(_run_text(elem))
+
+
+def _run_text(elem: Element) -> str:
+    """<hp:t> 요소의 텍스트 (탭/줄바꿈 등 인라인 요소는 대응 문자로 치환)"""
+    parts = [elem.text or ""]
+    for child in elem:
+        parts.append(_INLINE_TEXT.get(_local(child.tag), ""))
+        parts.append(child.tail or "")
+    return "".join(parts)
@@ -0,0 +1,140 @@
+"""
+다중 키워드 매처 (Aho–Corasick 오토마톤)
+
+포함/제외 키워드 전체를 하나의 오토마톤으로 컴파일하여, 공고 본문을 한 번만 훑으면서
+모든 키워드 적중을 찾습니다. 키워드 수(UserKeyword 행 수)가 늘어나도 본문 1건당 비용은
+본문 길이에 비례하며, 키워드 목록마다 `keyword in text`를 반복하지 않습니다.
+
+- 대소문자 무시 (키워드는 검색 텍스트와 같은 규칙으로 정규화, 본문은 소문자로 변환)
+- 키워드 집합(버전)별로 컴파일 결과를 캐시 (get_keyword_matcher)
+
+사용법:
+    from app.services.keyword_matcher import get_keyword_matcher
+
+    matcher = get_keyword_matcher(include_keywords, exclude_keywords)
+    result = matcher.match(bid.search_text)
+    if not result.excluded and result.include:
+        ...
+"""
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from app.utils.search_text import normalize_text
+
+
+class KeywordAutomaton:
+    """
+    Aho–Corasick 오토마톤
+
+    상태 0이 루트이며, 각 상태는 전이(dict), 실패 링크, 출력(해당 상태에서 끝나는
+    원본 키워드 목록, 실패 링크를 따라 병합됨)을 가집니다.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[tuple[str, ...]] = [()]
+        self.size = 0
+
+        for keyword in dict.fromkeys(keywords):
+            if normalize_text(keyword):
+                self._add(keyword)
+        self._build_failure_links()
+
+    def _add(self, keyword: str) -> None:
+        state = 0
+        for ch in normalize_text(keyword):
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] += (keyword,)
+        self.size += 1
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def find(self, text: str) -> set[str]:
+        """본문에 등장하는 키워드(원본 문자열) 집합"""
+        hits: set[str] = set()
+        for _, keywords in self.iter_matches(text):
+            hits.update(keywords)
+        return hits
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, tuple[str, ...]]]:
+        """적중 위치 순으로 (끝 위치(다음 글자 인덱스), 그 위치에서 끝나는 키워드들)"""
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for end, ch in enumerate(text.lower(), 1):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                yield end, output[state]
+
+
+@dataclass
+class KeywordMatch:
+    """매칭 결과 (키워드는 입력 목록 순서 유지)"""
+
+    include: list[str] = field(default_factory=list)
+    exclude: list[str] = field(default_factory=list)
+
+    @property
+    def excluded(self) -> bool:
+        return bool(self.exclude)
+
+
+class KeywordMatcher:
+    """포함/제외 키워드를 하나의 오토마톤으로 묶은 매처"""
+
+    def __init__(self, include_keywords: Iterable[str], exclude_keywords: Iterable[str] = ()):
+        self.include_keywords = list(dict.fromkeys(k for k in include_keywords if k))
+        self.exclude_keywords = list(dict.fromkeys(k for k in exclude_keywords if k))
+        self._include_rank = {k: i for i, k in enumerate(self.include_keywords)}
+        self._exclude_rank = {k: i for i, k in enumerate(self.exclude_keywords)}
+        self._automaton = KeywordAutomaton(self.include_keywords + self.exclude_keywords)
+
+    def find(self, text: str) -> set[str]:
+        """적중한 전체 키워드 (포함 + 제외)"""
+        return self._automaton.find(text)
+
+    def match(self, text: str) -> KeywordMatch:
+        hits = self._automaton.find(text)
+        if not hits:
+            return KeywordMatch()
+        include = sorted((k for k in hits if k in self._include_rank), key=self._include_rank.__getitem__)
+        exclude = sorted((k for k in hits if k in self._exclude_rank), key=self._exclude_rank.__getitem__)
+        return KeywordMatch(include=include, exclude=exclude)
+
+
+@lru_cache(maxsize=32)
+def _compile(include_keywords: tuple[str, ...], exclude_keywords: tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(include_keywords, exclude_keywords)
+
+
+def get_keyword_matcher(include_keywords: Iterable[str], exclude_keywords: Iterable[str] = ()) -> KeywordMatcher:
+    """
+    키워드 집합별로 컴파일된 매처 조회
+
+    같은 키워드 목록(= 같은 키워드 버전)이면 이전에 컴파일한 오토마톤을 재사용하고,
+    키워드가 추가/삭제되면 새로 컴파일합니다.
+    """
+    return _compile(tuple(include_keywords), tuple(exclude_keywords))
@@ -0,0 +1,271 @@
+"""
+매칭 피드 Percolator (공고 → 매칭 프로필)
+
+사용자 프로필의 Hard Match 조건(지역 / 보유 면허 / 최대 실적)을 역색인으로 컴파일해 두고,
+신규 공고 1건마다 전체 프로필을 순회하지 않고 매칭 프로필을 찾아 bid_matches에 저장합니다.
+GET /bids/matched는 bid_matches를 (user_id, posted_at, bid_id) 인덱스로 읽기만 합니다.
+
+- 지역: 지역 코드 → 프로필, 지역 제한 없는 프로필은 별도 집합
+- 면허: 면허 비트(app.utils.license_taxonomy) → 그 면허를 보유한 프로필
+- 실적: 최대 실적 오름차순 배열 (이분 탐색으로 "추정가의 50% 이상" 구간)
+- 공고의 조건 중 가장 좁은 후보 집합만 펼친 뒤 나머지 조건으로 거릅니다.
+- 판정 규칙은 HardMatchEngine / BidRepository.hard_match_query(재매칭의 SQL 조건)와 같습니다.
+
+프로필 수정(ProfileService)은 matched_at을 비우고 Taskiq 작업(rematch_profile_matches)을 등록해
+그 사용자만 최근 MATCH_REMATCH_DAYS일 공고를 SQL Hard Match로 다시 계산합니다 (rematch_profile).
+피드 조회는 쓰지 않습니다: 작업보다 조회가 먼저 오면 작업만 다시 등록하고 저장된 매칭을 그대로 보여 주며,
+등록에 실패했거나 작업이 사라져 matched_at이 비어 남은 프로필은 sweep_unmatched_profiles 작업이 다시 등록합니다.
+
+색인은 프로세스 단위로 캐시하며, 프로필/면허/실적 테이블 버전(행 수 + 최종 수정 시각)이
+바뀐 경우에만 다시 만듭니다.
+
+사용법:
+    from app.services.match_percolator import match_percolator
+
+    await match_percolator.percolate_bids(session, [bid.id for bid in new_bids])
+    await match_percolator.rematch_profile(session, profile)
+"""
+
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.db.models import BidAnnouncement, BidMatch, UserLicense, UserPerformance, UserProfile
+from app.db.repositories.bid_repository import BidRepository
+from app.services.batch_matcher import batch_matcher
+from app.services.matching_service import matching_service
+from app.utils.hard_match import profile_license_mask
+
+# 재매칭 공고 조회 단위
+MATCH_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class ProfileConstraints:
+    """프로필 1건의 Hard Match 조건 (Soft Match 계산에 필요한 키워드 포함)"""
+
+    user_id: int
+    location_code: str | None
+    license_mask: int
+    max_performance: float
+    keywords: tuple[str, ...] = ()
+    # 보유 면허 행 존재 여부 (분류 사전에 없는 면허만 있으면 license_mask는 0)
+    has_licenses: bool = True
+
+    @classmethod
+    def from_profile(cls, profile: UserProfile) -> "ProfileConstraints":
+        return cls(
+            user_id=profile.user_id,
+            location_code=profile.location_code or None,
+            license_mask=profile_license_mask(profile),
+            max_performance=max((perf.amount for perf in profile.performances or [] if perf.amount), default=0.0),
+            keywords=tuple(profile.keywords or ()),
+            has_licenses=bool(profile.licenses),
+        )
+
+    def accepts(self, bid: BidAnnouncement) -> bool:
+        """Hard Match 3단계 통과 여부 (bid의 저장된 비교 키 사용)"""
+        if not self.has_licenses:
+            return False
+        if self.location_code and bid.match_region_code and bid.match_region_code != self.location_code:
+            return False
+        if bid.license_mask & ~self.license_mask:
+            return False
+        price = bid.estimated_price
+        return not price or price <= 0 or self.max_performance >= price * 0.5
+
+
+def _bits(mask: int) -> list[int]:
+    """비트마스크에 켜진 비트 (UNKNOWN_BIT 포함: 어떤 프로필도 갖지 않으므로 후보가 비어 매칭 없음)"""
+    bits = []
+    while mask:
+        low = mask & -mask
+        bits.append(low)
+        mask ^= low
+    return bits
+
+
+class ProfileMatchIndex:
+    """Hard Match 조건 역색인 (공고 → 매칭 프로필)"""
+
+    def __init__(self, profiles: Iterable[ProfileConstraints], version: tuple | None = None):
+        self.version = version
+        # 보유 면허가 없으면 어떤 공고도 매칭되지 않음 (HardMatchEngine과 동일)
+        self.profiles = {profile.user_id: profile for profile in profiles if profile.has_licenses}
+
+        by_region: dict[str, set[int]] = defaultdict(set)
+        by_license: dict[int, set[int]] = defaultdict(set)
+        unrestricted = set()
+        for profile in self.profiles.values():
+            if profile.location_code:
+                by_region[profile.location_code].add(profile.user_id)
+            else:
+                unrestricted.add(profile.user_id)
+            for bit in _bits(profile.license_mask):
+                by_license[bit].add(profile.user_id)
+
+        self.by_region = dict(by_region)
+        self.by_license = dict(by_license)
+        self.unrestricted = unrestricted
+        ordered = sorted(self.profiles.values(), key=lambda profile: profile.max_performance)
+        self._performance_keys = [profile.max_performance for profile in ordered]
+        self._performance_ids = [profile.user_id for profile in ordered]
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    def match(self, bid: BidAnnouncement) -> list[ProfileConstraints]:
+        """공고와 Hard Match 되는 프로필 (user_id 순)"""
+        candidates = [self._performance_candidates(bid)]
+        if bid.match_region_code:
+            candidates.append(self.by_region.get(bid.match_region_code, set()) | self.unrestricted)
+        candidates.extend(self.by_license.get(bit, set()) for bit in _bits(bid.license_mask))
+
+        narrowest = min(candidates, key=len)
+        matched = (self.profiles[user_id] for user_id in narrowest)
+        return sorted((profile for profile in matched if profile.accepts(bid)), key=lambda profile: profile.user_id)
+
+    def _performance_candidates(self, bid: BidAnnouncement) -> set[int] | list[int]:
+        price = bid.estimated_price
+        if not price or price <= 0:
+            return self._performance_ids
+        return self._performance_ids[bisect_left(self._performance_keys, price * 0.5) :]
+
+
+class MatchPercolator:
+    """bid_matches 갱신 (신규 공고 → 매칭 프로필, 프로필 수정 → 해당 사용자 재매칭)"""
+
+    def __init__(self):
+        self._index: ProfileMatchIndex | None = None
+
+    async def get_index(self, session: AsyncSession) -> ProfileMatchIndex:
+        version = await self._current_version(session)
+        if self._index is None or self._index.version != version:
+            self._index = await self._build(session, version)
+        return self._index
+
+    def invalidate(self) -> None:
+        self._index = None
+
+    @staticmethod
+    async def enqueue_rematch(profile_id: int) -> None:
+        """
+        재매칭 작업 등록 (Taskiq rematch_profile_matches)
+
+        등록에 실패해도 matched_at이 비어 있으므로 sweep_unmatched_profiles 작업이 다시 등록합니다.
+        """
+        try:
+            # lazy import to avoid circular dependency
+            from app.worker.taskiq_tasks import rematch_profile_matches
+
+            await rematch_profile_matches.kiq(profile_id)
+        except Exception as e:
+            logger.warning(f"매칭 피드 재계산 작업 등록 실패: profile={profile_id}: {e}")
+
+    async def percolate_bids(self, session: AsyncSession, bid_ids: list[int]) -> int:
+        """
+        공고별 매칭 프로필을 bid_matches에 저장 (이미 있던 해당 공고 행은 교체)
+
+        AI 분석 등으로 공고의 지역/면허 요건이 바뀐 뒤 다시 호출해도 됩니다.
+
+        Returns:
+            저장한 매칭 행 수
+        """
+        if not bid_ids:
+            return 0
+        index = await self.get_index(session)
+        result = await session.execute(select(BidAnnouncement).where(BidAnnouncement.id.in_(bid_ids)))
+        bids = result.scalars().all()
+
+        rows = [
+            self._row(profile.user_id, bid, matching_service.calculate_soft_match(profile, bid)["score"])
+            for bid in bids
+            for profile in index.match(bid)
+        ]
+        await session.execute(delete(BidMatch).where(BidMatch.bid_id.in_(bid_ids)))
+        await BidRepository(session).upsert_matches(rows)
+        await session.commit()
+
+        logger.info(f"매칭 피드 갱신: 공고 {len(bids)}건, 매칭 {len(rows)}건 (프로필 {len(index)}개)")
+        return len(rows)
+
+    async def rematch_profile(self, session: AsyncSession, profile: UserProfile) -> int:
+        """
+        사용자 1명의 bid_matches를 최근 MATCH_REMATCH_DAYS일 공고 기준으로 다시 계산
+
+        Returns:
+            저장한 매칭 행 수
+        """
+        constraints = ProfileConstraints.from_profile(profile)
+        await session.execute(delete(BidMatch).where(BidMatch.user_id == profile.user_id))
+
+        saved = 0
+        licenses = [lic.license_name for lic in profile.licenses or []]
+        if licenses:
+            repo = BidRepository(session)
+            query = repo.hard_match_query(constraints.location_code, constraints.max_performance, licenses).where(
+                BidAnnouncement.posted_at >= datetime.utcnow() - timedelta(days=settings.MATCH_REMATCH_DAYS)
+            )
+            after = None
+            while True:
+                bids = await repo.get_hard_match_batch(query, MATCH_BATCH_SIZE, after)
+                # 배치 단위 Soft Match 점수 (SQL에서 Hard Match를 이미 통과한 공고)
+                scores = batch_matcher.match_bids(profile, bids).scores.tolist()
+                await repo.upsert_matches(
+                    [self._row(profile.user_id, bid, score) for bid, score in zip(bids, scores, strict=True)]
+                )
+                saved += len(bids)
+                if len(bids) < MATCH_BATCH_SIZE:
+                    break
+                after = (bids[-1].posted_at, bids[-1].id)
+
+        profile.matched_at = datetime.utcnow()
+        await session.commit()
+        logger.info(f"매칭 피드 재계산: user={profile.user_id}, 매칭 {saved}건")
+        return saved
+
+    @staticmethod
+    def _row(user_id: int, bid: BidAnnouncement, soft_score: int) -> dict:
+        return {
+            "user_id": user_id,
+            "bid_id": bid.id,
+            "posted_at": bid.posted_at,
+            "hard_score": 1.0,
+            "soft_score": soft_score,
+        }
+
+    @staticmethod
+    async def _current_version(session: AsyncSession) -> tuple:
+        stmt = select(
+            select(func.count(UserProfile.id)).scalar_subquery(),
+            select(func.max(UserProfile.updated_at)).scalar_subquery(),
+            select(func.count(UserLicense.id)).scalar_subquery(),
+            select(func.max(UserLicense.updated_at)).scalar_subquery(),
+            select(func.count(UserPerformance.id)).scalar_subquery(),
+            select(func.max(UserPerformance.updated_at)).scalar_subquery(),
+        )
+        result = await session.execute(stmt)
+        return tuple(result.one())
+
+    @staticmethod
+    async def _build(session: AsyncSession, version: tuple) -> ProfileMatchIndex:
+        started = time.perf_counter()
+        # 같은 세션에 이미 올라온 프로필도 면허/실적 컬렉션을 다시 읽음
+        result = await session.execute(select(UserProfile).execution_options(populate_existing=True))
+        index = ProfileMatchIndex(
+            (ProfileConstraints.from_profile(profile) for profile in result.scalars().all()), version=version
+        )
+        logger.info(f"매칭 프로필 색인 생성: 프로필 {len(index)}개 ({time.perf_counter() - started:.2f}초)")
+        return index
+
+
+# 싱글톤 인스턴스
+match_percolator = MatchPercolator()
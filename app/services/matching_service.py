@@ -13,6 +13,16 @@ from typing import Any
 from app.core.config import settings
 from app.core.logging import logger
 from app.db.models import BidAnnouncement, UserProfile
+from app.utils.hard_match import (
+    LICENSE_KEYWORDS,
+    REGION_CODES,
+    bid_license_mask,
+    bid_match_region_code,
+    extract_license_keywords,
+    profile_license_mask,
+)
+from app.utils.license_taxonomy import license_taxonomy
+from app.utils.search_text import bid_search_text, normalize_text, split_title
 
 # ============================================
 # Hard Match Engine (Zero False Positive)
@@ -31,34 +41,8 @@ class HardMatchEngine:
     3. 실적 요구사항 검증
     """
 
-    REGION_CODES = {
-        "11": "서울특별시",
-        "26": "부산광역시",
-        "27": "대구광역시",
-        "28": "인천광역시",
-        "29": "광주광역시",
-        "30": "대전광역시",
-        "31": "울산광역시",
-        "36": "세종특별자치시",
-        "41": "경기도",
-        "42": "강원도",
-        "43": "충청북도",
-        "44": "충청남도",
-        "45": "전라북도",
-        "46": "전라남도",
-        "47": "경상북도",
-        "48": "경상남도",
-        "50": "제주특별자치도",
-    }
-
-    LICENSE_KEYWORDS = {
-        "조경": ["조경공사업", "조경", "조경시설"],
-        "건축": ["건축공사업", "건축", "종합건설업"],
-        "토목": ["토목공사업", "토목건축공사업", "종합건설업"],
-        "전기": ["전기공사업", "전기"],
-        "통신": ["정보통신공사업", "통신"],
-        "소방": ["소방시설공사업", "소방"],
-    }
+    REGION_CODES = REGION_CODES
+    LICENSE_KEYWORDS = LICENSE_KEYWORDS
 
     def __init__(self):
         self.logger = logger
@@ -143,18 +127,16 @@ class HardMatchEngine:
         if not profile.licenses or len(profile.licenses) == 0:
             return False, "보유 면허 없음"
 
-        required_licenses = self._extract_license_requirements(bid)
-        if not required_licenses:
+        required = bid_license_mask(bid)
+        if not required:
             return True, "면허 요구사항 없음"
 
-        user_licenses = [lic.license_name for lic in profile.licenses]
+        # 공고 요구 면허 비트가 모두 보유 면허 비트에 포함되어야 통과 (SQL 쿼리의 license_mask 조건과 같은 규칙)
+        missing = required & ~profile_license_mask(profile)
+        if not missing:
+            return True, f"면허 일치: {', '.join(lic.license_name for lic in profile.licenses)}"
 
-        for required in required_licenses:
-            for user_license in user_licenses:
-                if required.lower() in user_license.lower() or user_license.lower() in required.lower():
-                    return True, f"면허 일치: {user_license}"
-
-        return False, f"필요 면허 미보유: {', '.join(required_licenses)}"
+        return False, f"필요 면허 미보유: {', '.join(self._license_names(missing, bid))}"
 
     def _check_performance(self, bid: BidAnnouncement, profile: UserProfile) -> tuple[bool, str]:
         """실적 요구사항 검증 (입찰 금액의 50% 이상 실적 보유 필요)"""
@@ -182,25 +164,8 @@ class HardMatchEngine:
             )
 
     def _extract_region_from_bid(self, bid: BidAnnouncement) -> str | None:
-        """입찰 공고에서 지역 코드 추출"""
-        # 공고에 region_code가 직접 있으면 사용
-        if bid.region_code and bid.region_code != "00":
-            return bid.region_code
-
-        # 기관명/제목에서 지역 추출
-        text = f"{bid.agency or ''} {bid.title or ''}".lower()
-        for code, name in self.REGION_CODES.items():
-            short_name = (
-                name.replace("특별시", "")
-                .replace("광역시", "")
-                .replace("특별자치시", "")
-                .replace("특별자치도", "")
-                .replace("도", "")
-                .lower()
-            )
-            if short_name in text:
-                return code
-        return None
+        """입찰 공고 지역 코드 (공고 저장 시 계산한 match_region_code, None: 지역 제한 없음)"""
+        return bid_match_region_code(bid)
 
     def _extract_license_requirements(self, bid: BidAnnouncement) -> list[str]:
         """입찰 공고에서 필요한 면허 추출"""
@@ -208,14 +173,15 @@ class HardMatchEngine:
         if bid.license_requirements:
             return bid.license_requirements
 
-        text = f"{bid.title or ''} {bid.content or ''}".lower()
-        required = []
-        for category, keywords in self.LICENSE_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword.lower() in text:
-                    required.append(keyword)
-                    break
-        return list(set(required))
+        return extract_license_keywords(bid_search_text(bid))
+
+    @staticmethod
+    def _license_names(mask: int, bid: BidAnnouncement) -> list[str]:
+        """면허 비트 → 표시 이름 (분류에 없는 요구 면허는 공고의 원래 이름)"""
+        names = license_taxonomy.names(mask)
+        if mask & license_taxonomy.UNKNOWN_BIT:
+            names += license_taxonomy.unknown_names(bid.license_requirements)
+        return names
 
     def _get_max_performance(self, profile: UserProfile) -> float:
         """사용자의 최대 실적 금액 반환"""
@@ -280,16 +246,11 @@ class MatchingService:
             elif user_profile.location_code != bid.region_code:
                 reasons.append(f"지역 불일치 (공고: {bid.region_code}, 사용자: {user_profile.location_code})")
 
-        # 2. 면허 제한 확인
-        if bid.license_requirements:
-            user_licenses = {l.license_name for l in user_profile.licenses}
-            has_valid_license = False
-            for req_license in bid.license_requirements:
-                if any(req_license in ul for ul in user_licenses):
-                    has_valid_license = True
-                    break
-            if not has_valid_license:
-                reasons.append(f"필요 면허 미보유 (요구: {', '.join(bid.license_requirements)})")
+        # 2. 면허 제한 확인 (HardMatchEngine과 같은 면허 비트마스크 규칙)
+        required_mask = bid_license_mask(bid)
+        if required_mask & ~profile_license_mask(user_profile):
+            required = bid.license_requirements or license_taxonomy.names(required_mask)
+            reasons.append(f"필요 면허 미보유 (요구: {', '.join(required)})")
 
         # 3. 실적 제한 확인
         if bid.min_performance and bid.min_performance > 0:
@@ -317,15 +278,16 @@ class MatchingService:
         matched_in_title = []
         matched_in_content = []
 
-        bid_title = bid.title.lower() if bid.title else ""
-        bid_content = bid.content.lower() if bid.content else ""
+        bid_title, bid_body = split_title(bid_search_text(bid))
 
         for k in user_keywords:
-            k_lower = k.lower()
-            if k_lower in bid_title:
+            k_normalized = normalize_text(k)
+            if not k_normalized:
+                continue
+            if k_normalized in bid_title:
                 keyword_score += 20
                 matched_in_title.append(k)
-            elif k_lower in bid_content:
+            elif k_normalized in bid_body:
                 keyword_score += 5
                 matched_in_content.append(k)
 
@@ -1,13 +1,96 @@
+import asyncio
 import logging
+import time
+from dataclasses import dataclass, field
 
 import httpx
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.core.logging import logger as app_logger
+from app.core.metrics import NOTIFICATION_DURATION_SECONDS, record_notification_sent
 from app.db.models import BidAnnouncement, User, UserProfile
-from app.services.email_service import email_service
+from app.services.email_service import RetryableEmailError, email_service
 
 logger = logging.getLogger(__name__)
 
+# Slack 메시지 1건에 담을 최대 공고 수 (나머지는 "외 N건"으로 표시)
+SLACK_DIGEST_MAX_ITEMS = 20
+
+
+class RetryableDeliveryError(Exception):
+    """재시도 가능한 발송 실패 (Slack 429 / 5xx)"""
+
+
+@dataclass
+class BidDigest:
+    """사용자 1명에게 묶어서 보낼 매칭 공고 목록"""
+
+    user: User
+    matches: list[tuple[BidAnnouncement, list[str]]] = field(default_factory=list)
+
+
+class SlackRateLimiter:
+    """
+    웹훅 URL별 최소 전송 간격 보장
+
+    Slack incoming webhook은 웹훅당 초당 1건 수준으로 제한되므로, 같은 웹훅으로 가는
+    메시지는 min_interval 간격으로 전송 시점을 예약합니다. 429 응답의 Retry-After는
+    defer()로 반영합니다.
+    """
+
+    def __init__(self, min_interval: float | None = None):
+        self.min_interval = settings.SLACK_WEBHOOK_MIN_INTERVAL if min_interval is None else min_interval
+        self._next_at: dict[str, float] = {}
+
+    async def acquire(self, webhook_url: str) -> None:
+        now = time.monotonic()
+        slot = max(now, self._next_at.get(webhook_url, 0.0))
+        self._next_at[webhook_url] = slot + self.min_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def defer(self, webhook_url: str, seconds: float) -> None:
+        self._next_at[webhook_url] = max(self._next_at.get(webhook_url, 0.0), time.monotonic() + seconds)
+
+
+slack_rate_limiter = SlackRateLimiter()
+
+
+@retry(
+    stop=stop_after_attempt(4),
+    wait=wait_exponential(multiplier=0.5, min=0.5, max=8),
+    retry=retry_if_exception_type((httpx.RequestError, RetryableDeliveryError)),
+    reraise=True,
+)
+async def _post_slack_with_retry(webhook_url: str, message: str) -> bool:
+    """웹훅 전송 (429 / 5xx / 네트워크 오류는 지수 백오프 재시도)"""
+    await slack_rate_limiter.acquire(webhook_url)
+    response = await get_http_client("slack").post(webhook_url, json={"text": message})
+    if response.status_code == 200:
+        return True
+    if response.status_code == 429:
+        slack_rate_limiter.defer(webhook_url, float(response.headers.get("Retry-After", 1)))
+        raise RetryableDeliveryError("Slack rate limited (429)")
+    if response.status_code >= 500:
+        raise RetryableDeliveryError(f"Slack server error ({response.status_code})")
+    logger.error(f"Slack Notification Failed: {response.status_code} {response.text}")
+    return False
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=1, max=8),
+    retry=retry_if_exception_type(RetryableEmailError),
+    reraise=True,
+)
+async def _send_email_with_retry(to_email: str, user_name: str, bids: list[dict]) -> bool:
+    """이메일 전송 (429 / 5xx / 네트워크 오류만 지수 백오프 재시도, 4xx 실패 / SendGrid 미설정은 재시도하지 않음)"""
+    if not email_service.is_configured():
+        return False
+    return await email_service.send_bid_digest(to_email=to_email, user_name=user_name, bids=bids, raise_retryable=True)
+
 
 class NotificationService:
     @staticmethod
@@ -19,13 +102,13 @@ class NotificationService:
             return False
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(webhook_url, json={"text": message})
-                if response.status_code == 200:
-                    return True
-                else:
-                    logger.error(f"Slack Notification Failed: {response.text}")
-                    return False
+            client = get_http_client("slack")
+            response = await client.post(webhook_url, json={"text": message})
+            if response.status_code == 200:
+                return True
+            else:
+                logger.error(f"Slack Notification Failed: {response.text}")
+                return False
         except Exception as e:
             logger.error(f"Slack Notification Error: {e}")
             return False
@@ -57,15 +140,7 @@ class NotificationService:
         if profile.is_email_enabled and user.email:
             try:
                 # Format bid data for email template
-                bid_data = {
-                    "title": bid.title,
-                    "agency": bid.agency,
-                    "deadline": (bid.deadline.strftime("%Y-%m-%d %H:%M") if bid.deadline else "미정"),
-                    "estimated_price": (f"{bid.estimated_price:,.0f}원" if bid.estimated_price else "미정"),
-                    "url": bid.url,
-                    "ai_summary": bid.ai_summary,
-                    "keywords_matched": matched_keywords,
-                }
+                bid_data = cls._bid_email_data(bid, matched_keywords)
 
                 # Get user name from profile or email
                 user_name = profile.company_name or user.email.split("@")[0]
@@ -82,3 +157,77 @@ class NotificationService:
 
             except Exception as e:
                 app_logger.error(f"Error sending email notification: {str(e)}", exc_info=True)
+
+    @staticmethod
+    def _bid_email_data(bid: BidAnnouncement, matched_keywords: list[str]) -> dict:
+        return {
+            "title": bid.title,
+            "agency": bid.agency,
+            "deadline": (bid.deadline.strftime("%Y-%m-%d %H:%M") if bid.deadline else "미정"),
+            "estimated_price": (f"{bid.estimated_price:,.0f}원" if bid.estimated_price else "미정"),
+            "url": bid.url,
+            "ai_summary": bid.ai_summary,
+            "keywords_matched": matched_keywords,
+        }
+
+    @staticmethod
+    def format_slack_digest(matches: list[tuple[BidAnnouncement, list[str]]]) -> str:
+        """매칭 공고 목록을 Slack 메시지 1건으로 묶음"""
+        lines = [f"🔔 *키워드 매칭 알림* ({len(matches)}건)"]
+        for bid, keywords in matches[:SLACK_DIGEST_MAX_ITEMS]:
+            price = f"{bid.estimated_price:,.0f}원" if bid.estimated_price else "미정"
+            lines.append(
+                f"• <{bid.url}|{bid.title}>\n"
+                f"    키워드: `{', '.join(keywords)}` | 마감: {bid.deadline or '미정'} | 추정가: {price}"
+            )
+        if len(matches) > SLACK_DIGEST_MAX_ITEMS:
+            lines.append(f"외 {len(matches) - SLACK_DIGEST_MAX_ITEMS}건")
+        return "\n".join(lines)
+
+    @classmethod
+    async def deliver_digests(cls, digests: list[BidDigest]) -> dict[str, int]:
+        """
+        사용자별 묶음 알림을 채널별로 동시에 발송
+
+        - 크롤링 1회분의 매칭 공고를 사용자당 Slack 1건 / 이메일 1건으로 묶어 전송
+        - 채널별 동시 발송 수 제한 (NOTIFICATION_SLACK_CONCURRENCY / NOTIFICATION_EMAIL_CONCURRENCY)
+        - Slack 웹훅 전송 간격 / 429 Retry-After 준수, 일시 오류는 지수 백오프 재시도
+        - 발송 소요 시간은 NOTIFICATION_DURATION_SECONDS{channel}에 기록
+
+        Returns:
+            {"slack": 성공 수, "email": 성공 수, "failed": 실패 수}
+        """
+        semaphores = {
+            "slack": asyncio.Semaphore(max(1, settings.NOTIFICATION_SLACK_CONCURRENCY)),
+            "email": asyncio.Semaphore(max(1, settings.NOTIFICATION_EMAIL_CONCURRENCY)),
+        }
+        counts = {"slack": 0, "email": 0, "failed": 0}
+
+        async def deliver(channel: str, send, *args) -> None:
+            async with semaphores[channel]:
+                started = time.perf_counter()
+                try:
+                    success = await send(*args)
+                except Exception as e:
+                    app_logger.error(f"{channel} 알림 발송 실패: {e}")
+                    success = False
+                finally:
+                    NOTIFICATION_DURATION_SECONDS.labels(channel=channel).observe(time.perf_counter() - started)
+            record_notification_sent(channel, "bid_match", success)
+            counts[channel if success else "failed"] += 1
+
+        jobs = []
+        for digest in digests:
+            profile: UserProfile | None = digest.user.full_profile
+            if not profile or not digest.matches:
+                continue
+            if profile.is_slack_enabled and profile.slack_webhook_url:
+                message = cls.format_slack_digest(digest.matches)
+                jobs.append(deliver("slack", _post_slack_with_retry, profile.slack_webhook_url, message))
+            if profile.is_email_enabled and digest.user.email:
+                user_name = profile.company_name or digest.user.email.split("@")[0]
+                bids = [cls._bid_email_data(bid, keywords) for bid, keywords in digest.matches]
+                jobs.append(deliver("email", _send_email_with_retry, digest.user.email, user_name, bids))
+
+        await asyncio.gather(*jobs)
+        return counts
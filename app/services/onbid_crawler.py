@@ -3,13 +3,19 @@
 캠코(한국자산관리공사) 온비드 사이트에서 임대/매각 공고 수집
 """
 
+import asyncio
 import re
+import time
 from datetime import datetime, timedelta
 
 import httpx
 from bs4 import BeautifulSoup
 
+from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.core.logging import logger
+from app.services.keyword_matcher import get_keyword_matcher
+from app.utils.search_text import build_search_text
 
 
 class OnbidCrawlerService:
@@ -62,47 +68,66 @@ class OnbidCrawlerService:
     ]
 
     def __init__(self):
-        self.client = httpx.AsyncClient(
-            timeout=30.0,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-            },
-        )
-
-    async def fetch_rental_announcements(self, from_date: datetime | None = None, max_pages: int = 5) -> list[dict]:
+        # 직접 주입된 클라이언트 (없으면 공유 "onbid" 풀 사용)
+        self._client: httpx.AsyncClient | None = None
+        self.page_concurrency = max(1, settings.ONBID_PAGE_CONCURRENCY)
+        self.detail_concurrency = max(1, settings.ONBID_DETAIL_CONCURRENCY)
+        # 직전 수집의 단계별 통계 (CrawlerLog.stage_stats에 기록)
+        self.last_crawl_stats: dict = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Onbid 요청용 HTTP 클라이언트 (브라우저 헤더가 설정된 공유 풀)"""
+        return self._client or get_http_client("onbid")
+
+    @client.setter
+    def client(self, value: httpx.AsyncClient | None):
+        self._client = value
+
+    async def fetch_rental_announcements(
+        self, from_date: datetime | None = None, max_pages: int | None = None, enrich_details: bool = True
+    ) -> list[dict]:
         """
         온비드에서 임대 공고를 수집합니다.
 
+        1. 목록 단계: page_concurrency 한도 내에서 페이지를 앞서 요청하며, 빈 페이지가 나오면
+           그 뒤 페이지 요청은 취소하고 결과도 버립니다 (마지막 비어 있지 않은 페이지까지 수집).
+        2. 상세 단계: 필터를 통과한 공고만 상세 페이지를 조회하여 content를 본문으로 채웁니다
+           (enrich_details).
+
+        단계별 통계는 self.last_crawl_stats에 기록합니다.
+
         Args:
             from_date: 검색 시작 날짜 (기본: 7일 전)
-            max_pages: 최대 검색 페이지 수
+            max_pages: 최대 검색 페이지 수 (기본: settings.ONBID_MAX_PAGES)
+            enrich_details: 상세 페이지 본문 보강 여부
 
         Returns:
             필터링된 임대 공고 리스트
         """
         if from_date is None:
             from_date = datetime.now() - timedelta(days=7)
+        if max_pages is None:
+            max_pages = settings.ONBID_MAX_PAGES
 
-        all_announcements = []
+        self.last_crawl_stats = {}
 
         try:
-            for page in range(1, max_pages + 1):
-                logger.info(f"온비드 임대 공고 크롤링: 페이지 {page}/{max_pages}")
-
-                announcements = await self._fetch_page(page, from_date)
-
-                if not announcements:
-                    logger.info(f"페이지 {page}: 더 이상 공고 없음")
-                    break
-
-                # 필터링 적용
-                filtered = [a for a in announcements if self._should_include(a)]
-                # filtered = announcements
-                all_announcements.extend(filtered)
+            pages = await self._fetch_pages(from_date, max_pages)
+
+            fetched = [announcement for page in pages for announcement in page]
+            all_announcements = [a for a in fetched if self._should_include(a)]
+            self.last_crawl_stats["list"] = {
+                "pages": len(pages),
+                "parsed": len(fetched),
+                "filtered": len(all_announcements),
+            }
+            logger.info(
+                f"온비드 목록 수집: {len(pages)}페이지, {len(fetched)}건 수집, {len(all_announcements)}건 필터링 통과"
+            )
 
-                logger.info(f"페이지 {page}: {len(announcements)}건 수집, {len(filtered)}건 필터링 통과")
+            if enrich_details and all_announcements:
+                all_announcements = await self.enrich_details(all_announcements)
 
             # 중요도 점수 계산
             for announcement in all_announcements:
@@ -113,8 +138,96 @@ class OnbidCrawlerService:
 
         except Exception as e:
             logger.error(f"온비드 크롤링 실패: {e}", exc_info=True)
+            self.last_crawl_stats["error"] = str(e)
             return []
 
+    async def _fetch_pages(self, from_date: datetime, max_pages: int) -> list[list[dict]]:
+        """
+        목록 페이지를 동시에 요청하여 첫 빈 페이지 이전까지의 결과를 페이지 순서대로 반환
+
+        항상 최대 page_concurrency개의 페이지를 앞서 요청해 두고, 빈 페이지를 받으면
+        마지막 페이지를 그 앞 페이지로 줄인 뒤 이후 페이지 요청을 취소합니다.
+        """
+        last_page = max_pages
+        next_page = 1
+        results: dict[int, list[dict]] = {}
+        in_flight: dict[asyncio.Task, int] = {}
+        cancelled: list[asyncio.Task] = []
+
+        try:
+            while in_flight or next_page <= last_page:
+                while next_page <= last_page and len(in_flight) < self.page_concurrency:
+                    logger.info(f"온비드 임대 공고 크롤링: 페이지 {next_page}/{max_pages}")
+                    in_flight[asyncio.create_task(self._fetch_page(next_page, from_date))] = next_page
+                    next_page += 1
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    page = in_flight.pop(task)
+                    announcements = task.result()
+                    if announcements:
+                        results[page] = announcements
+                    elif page <= last_page:
+                        logger.info(f"페이지 {page}: 더 이상 공고 없음")
+                        last_page = page - 1
+
+                # 빈 페이지 이후 요청은 취소
+                for task, page in list(in_flight.items()):
+                    if page > last_page:
+                        task.cancel()
+                        cancelled.append(in_flight.pop(task))
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, *cancelled, return_exceptions=True)
+
+        return [results[page] for page in sorted(results) if page <= last_page]
+
+    async def enrich_details(self, announcements: list[dict]) -> list[dict]:
+        """
+        상세 페이지 본문으로 공고 content를 보강합니다 (detail_concurrency개의 워커 풀).
+
+        상세 조회에 실패한 공고는 목록 정보(content=제목)를 그대로 유지하며,
+        본문에서 제외 키워드가 발견된 공고는 결과에서 뺍니다.
+
+        Args:
+            announcements: 필터를 통과한 공고 리스트
+
+        Returns:
+            보강된 공고 리스트 (입력 순서 유지)
+        """
+        started = time.perf_counter()
+        queue: asyncio.Queue = asyncio.Queue()
+        for announcement in announcements:
+            queue.put_nowait(announcement)
+
+        stats = {"requested": len(announcements), "enriched": 0, "failed": 0, "excluded": 0}
+        excluded: set[int] = set()
+
+        async def worker() -> None:
+            while not queue.empty():
+                announcement = queue.get_nowait()
+                detail = await self.fetch_announcement_detail(announcement["url"]) if announcement.get("url") else None
+                if not detail or not detail.get("content"):
+                    stats["failed"] += 1
+                    continue
+
+                announcement["content"] = detail["content"]
+                stats["enriched"] += 1
+                # 본문 기준으로 키워드 재매칭 (제외 키워드가 본문에만 있는 경우 제외)
+                if not self._should_include(announcement):
+                    stats["excluded"] += 1
+                    excluded.add(id(announcement))
+
+        workers = min(self.detail_concurrency, len(announcements))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+        stats["wall_seconds"] = round(time.perf_counter() - started, 3)
+        self.last_crawl_stats["detail"] = stats
+        logger.info(f"온비드 상세 페이지 보강 완료: {stats}")
+
+        return [a for a in announcements if id(a) not in excluded]
+
     async def _fetch_page(self, page: int, from_date: datetime) -> list[dict]:
         """
         특정 페이지의 공고 목록을 가져옵니다.
@@ -263,21 +376,15 @@ class OnbidCrawlerService:
         Returns:
             True if 수집 대상
         """
-        title = announcement.get("title", "").lower()
-        content = announcement.get("content", "").lower()
-        full_text = f"{title} {content}"
+        text = build_search_text(announcement.get("title"), announcement.get("content"))
+        result = get_keyword_matcher(self.RENTAL_KEYWORDS, self.EXCLUDE_KEYWORDS).match(text)
 
         # 제외 키워드 체크
-        for keyword in self.EXCLUDE_KEYWORDS:
-            if keyword in full_text:
-                return False
+        if result.excluded:
+            return False
 
         # 포함 키워드 체크
-        matched_keywords = []
-        for keyword in self.RENTAL_KEYWORDS:
-            if keyword in full_text:
-                matched_keywords.append(keyword)
-
+        matched_keywords = result.include
         announcement["keywords_matched"] = matched_keywords
 
         # 최소 1개 이상의 키워드 매칭 필요
@@ -356,8 +463,10 @@ class OnbidCrawlerService:
             return None
 
     async def close(self):
-        """HTTP 클라이언트 종료"""
-        await self.client.aclose()
+        """직접 주입된 HTTP 클라이언트 종료 (공유 풀은 애플리케이션 종료 시 정리)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
 
 # 싱글톤 인스턴스
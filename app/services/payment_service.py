@@ -29,6 +29,7 @@ from app.core.exceptions import (
     PaymentError,
     PaymentNotConfiguredError,
 )
+from app.core.http_client import get_http_client
 from app.core.logging import logger
 
 
@@ -203,22 +204,22 @@ class PaymentService:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, headers=headers, json=payload, timeout=15.0)
-
-                if response.status_code == 200:
-                    result = response.json()
-                    logger.info(f"Payment confirmed: order_id={order_id}, amount={amount}원")
-                    return result
-
-                error_data = response.json()
-                error_code = error_data.get("code", "UNKNOWN")
-                error_msg = error_data.get("message", "알 수 없는 오류")
-                logger.error(f"Payment confirmation failed: code={error_code}, message={error_msg}")
-                raise PaymentConfirmationError(
-                    detail=f"결제 승인 실패: {error_msg}",
-                    extra={"toss_error_code": error_code},
-                )
+            client = get_http_client("tosspayments")
+            response = await client.post(url, headers=headers, json=payload, timeout=15.0)
+
+            if response.status_code == 200:
+                result = response.json()
+                logger.info(f"Payment confirmed: order_id={order_id}, amount={amount}원")
+                return result
+
+            error_data = response.json()
+            error_code = error_data.get("code", "UNKNOWN")
+            error_msg = error_data.get("message", "알 수 없는 오류")
+            logger.error(f"Payment confirmation failed: code={error_code}, message={error_msg}")
+            raise PaymentConfirmationError(
+                detail=f"결제 승인 실패: {error_msg}",
+                extra={"toss_error_code": error_code},
+            )
 
         except httpx.TimeoutException:
             logger.error(f"Payment confirmation timeout: order_id={order_id}")
@@ -264,18 +265,18 @@ class PaymentService:
             payload["cancelAmount"] = cancel_amount
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, headers=headers, json=payload, timeout=15.0)
+            client = get_http_client("tosspayments")
+            response = await client.post(url, headers=headers, json=payload, timeout=15.0)
 
-                if response.status_code == 200:
-                    result = response.json()
-                    logger.info(f"Payment cancelled: payment_key={payment_key}")
-                    return result
+            if response.status_code == 200:
+                result = response.json()
+                logger.info(f"Payment cancelled: payment_key={payment_key}")
+                return result
 
-                error_data = response.json()
-                error_msg = error_data.get("message", "알 수 없는 오류")
-                logger.error(f"Payment cancellation failed: {error_data}")
-                raise PaymentError(detail=f"결제 취소 실패: {error_msg}")
+            error_data = response.json()
+            error_msg = error_data.get("message", "알 수 없는 오류")
+            logger.error(f"Payment cancellation failed: {error_data}")
+            raise PaymentError(detail=f"결제 취소 실패: {error_msg}")
 
         except (PaymentError, httpx.TimeoutException):
             raise
@@ -291,14 +292,14 @@ class PaymentService:
         headers = {"Authorization": self.auth_header}
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers, timeout=10.0)
+            client = get_http_client("tosspayments")
+            response = await client.get(url, headers=headers, timeout=10.0)
 
-                if response.status_code == 200:
-                    return response.json()
+            if response.status_code == 200:
+                return response.json()
 
-                error_data = response.json()
-                raise PaymentError(detail=f"결제 정보 조회 실패: {error_data.get('message', 'Unknown')}")
+            error_data = response.json()
+            raise PaymentError(detail=f"결제 정보 조회 실패: {error_data.get('message', 'Unknown')}")
 
         except PaymentError:
             raise
@@ -372,16 +373,16 @@ class PaymentService:
             "customerKey": customer_key,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, json=payload, timeout=15.0)
+        client = get_http_client("tosspayments")
+        response = await client.post(url, headers=headers, json=payload, timeout=15.0)
 
-            if response.status_code == 200:
-                result = response.json()
-                logger.info(f"Billing key issued: customer_key={customer_key}")
-                return result
+        if response.status_code == 200:
+            result = response.json()
+            logger.info(f"Billing key issued: customer_key={customer_key}")
+            return result
 
-            error_data = response.json()
-            raise PaymentError(detail=f"빌링키 발급 실패: {error_data.get('message', 'Unknown')}")
+        error_data = response.json()
+        raise PaymentError(detail=f"빌링키 발급 실패: {error_data.get('message', 'Unknown')}")
 
     @retry(
         stop=stop_after_attempt(3),
@@ -429,16 +430,16 @@ class PaymentService:
             "customerName": customer_name,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, json=payload, timeout=15.0)
+        client = get_http_client("tosspayments")
+        response = await client.post(url, headers=headers, json=payload, timeout=15.0)
 
-            if response.status_code == 200:
-                result = response.json()
-                logger.info(f"Billing charged: billing_key={billing_key[:8]}..., " f"amount={amount}원")
-                return result
+        if response.status_code == 200:
+            result = response.json()
+            logger.info(f"Billing charged: billing_key={billing_key[:8]}..., " f"amount={amount}원")
+            return result
 
-            error_data = response.json()
-            raise PaymentConfirmationError(detail=f"자동 결제 실패: {error_data.get('message', 'Unknown')}")
+        error_data = response.json()
+        raise PaymentConfirmationError(detail=f"자동 결제 실패: {error_data.get('message', 'Unknown')}")
 
 
 # Singleton instance
@@ -0,0 +1,53 @@
+"""
+PDF 본문 텍스트 파서 (페이지 단위 지연 추출)
+
+PyPDF2로 모든 페이지를 추출해 문자열을 계속 이어 붙이면, 앞부분 몇 천 자만 쓰는 경우에도
+200페이지 문서 전체를 파싱하게 됩니다. 이 파서는 페이지를 필요할 때 하나씩 추출합니다.
+
+- 제너레이터: 페이지 텍스트를 하나씩 yield (HWP/HWPX 파서와 같은 인터페이스)
+- max_chars / max_pages: 글자 수 / 페이지 수 예산 (도달하면 남은 페이지는 추출하지 않음)
+- 문서를 캐시하지 않음: 추출은 프로세스 풀 워커에서 실행되어 같은 파일의 재요청이 같은 워커로
+  간다는 보장이 없으므로, 같은 파일을 다시 읽으면 처음부터 추출합니다
+  (추출 결과 재사용은 첨부파일 텍스트 캐시 attachment_cache가 담당)
+
+사용법:
+    from app.services.pdf_parser import iter_pdf_pages
+
+    for page in iter_pdf_pages(content, max_chars=10_000):
+        ...
+"""
+
+import io
+from collections.abc import Iterator
+
+import PyPDF2
+
+from app.services.hwp_parser import limit_chars
+
+
+def _iter_pages(reader: PyPDF2.PdfReader, max_pages: int | None) -> Iterator[str]:
+    """페이지 텍스트를 앞에서부터 필요한 만큼만 추출 (빈 페이지 제외)"""
+    count = len(reader.pages) if max_pages is None else min(max_pages, len(reader.pages))
+    for index in range(count):
+        text = reader.pages[index].extract_text() or ""
+        if text.strip():
+            yield text
+
+
+def iter_pdf_pages(content: bytes, max_chars: int | None = None, max_pages: int | None = None) -> Iterator[str]:
+    """
+    PDF 문서의 페이지 텍스트를 순서대로 반환
+
+    Args:
+        content: PDF 파일 바이트
+        max_chars: 반환할 최대 글자 수 (페이지 구분자 제외, None이면 제한 없음)
+        max_pages: 읽을 최대 페이지 수 (None이면 제한 없음)
+
+    Yields:
+        빈 페이지를 제외한 페이지 텍스트 (예산 경계에 걸친 페이지는 잘라서 반환)
+
+    Raises:
+        PyPDF2.errors.PdfReadError: PDF로 읽을 수 없는 파일
+    """
+    reader = PyPDF2.PdfReader(io.BytesIO(content))
+    yield from limit_chars(_iter_pages(reader, max_pages), max_chars)
@@ -2,12 +2,18 @@ import asyncio
 import json
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.logging import logger
 from app.db.models import UserLicense, UserPerformance, UserProfile
+from app.services.match_percolator import match_percolator
+from app.utils.license_taxonomy import license_taxonomy
+from app.utils.region_gazetteer import region_gazetteer
+
+# 바뀌면 매칭 피드(bid_matches)를 다시 계산해야 하는 프로필 항목 (Hard Match 지역 / Soft Match 키워드)
+MATCH_PROFILE_FIELDS = ("location_code", "keywords")
 
 
 class ProfileService:
@@ -44,15 +50,21 @@ class ProfileService:
         """사용자 프로필 생성 또는 수정"""
         profile = await self.get_profile(session, user_id)
 
+        rematch = False
         if profile:
             for key, value in profile_data.items():
                 if hasattr(profile, key):
                     setattr(profile, key, value)
+            rematch = any(key in profile_data for key in MATCH_PROFILE_FIELDS)
+            if rematch:
+                profile.matched_at = None
         else:
             profile = UserProfile(user_id=user_id, **profile_data)
             session.add(profile)
 
         await session.commit()
+        if rematch:
+            await self._enqueue_rematch(profile.id)
         await session.refresh(profile)
         return profile
 
@@ -70,7 +82,7 @@ class ProfileService:
         - representative: 대표자 성명
         - address: 사업장 소재지 (전체 주소)
         - company_type: 기업 구분 (예: 법인사업자, 개인사업자, 중소기업 등)
-        - location_code: 주소의 시/도 코드 (서울: 11, 부산: 26, 대구: 27, 인천: 28, 광주: 29, 대전: 30, 울산: 31, 세종: 36, 경기: 41, 강원: 42, 충북: 43, 충남: 44, 전북: 45, 전남: 46, 경북: 47, 경남: 48, 제주: 49)
+        - location_code: 주소의 시/도 코드 (서울: 11, 부산: 26, 대구: 27, 인천: 28, 광주: 29, 대전: 30, 울산: 31, 세종: 36, 경기: 41, 강원: 42, 충북: 43, 충남: 44, 전북: 45, 전남: 46, 경북: 47, 경남: 48, 제주: 50)
 
         JSON 결과만 출력하세요.
         """
@@ -105,30 +117,8 @@ class ProfileService:
             raise Exception(f"AI 분석 중 오류가 발생했습니다: {str(e)}")
 
     def match_location_code(self, address: str) -> str:
-        """주소 기반 지역 코드 매칭 (Fallback용)"""
-        location_map = {
-            "서울": "11",
-            "부산": "26",
-            "대구": "27",
-            "인천": "28",
-            "광주": "29",
-            "대전": "30",
-            "울산": "31",
-            "세종": "36",
-            "경기": "41",
-            "강원": "42",
-            "충북": "43",
-            "충남": "44",
-            "전북": "45",
-            "전남": "46",
-            "경북": "47",
-            "경남": "48",
-            "제주": "49",
-        }
-        for city, code in location_map.items():
-            if city in address:
-                return code
-        return "99"  # 기타/미분류
+        """주소 기반 지역 코드 매칭 (Fallback용, 공고와 같은 지역 사전 사용)"""
+        return region_gazetteer.resolve(address) or "99"  # 99: 기타/미분류
 
     async def get_or_create_profile(self, session: AsyncSession, user_id: int) -> UserProfile:
         """사용자 프로필 조회 또는 생성"""
@@ -146,7 +136,9 @@ class ProfileService:
         """사용자 면허 추가"""
         license = UserLicense(profile_id=profile_id, **license_data)
         session.add(license)
+        await self._refresh_license_mask(session, profile_id)
         await session.commit()
+        await self._enqueue_rematch(profile_id)
         await session.refresh(license)
         return license
 
@@ -158,7 +150,9 @@ class ProfileService:
 
         if license:
             await session.delete(license)
+            await self._refresh_license_mask(session, profile_id)
             await session.commit()
+            await self._enqueue_rematch(profile_id)
             return True
         return False
 
@@ -170,7 +164,9 @@ class ProfileService:
         """사용자 실적 추가"""
         performance = UserPerformance(profile_id=profile_id, **performance_data)
         session.add(performance)
+        await self._mark_rematch(session, profile_id)
         await session.commit()
+        await self._enqueue_rematch(profile_id)
         await session.refresh(performance)
         return performance
 
@@ -185,9 +181,32 @@ class ProfileService:
 
         if performance:
             await session.delete(performance)
+            await self._mark_rematch(session, profile_id)
             await session.commit()
+            await self._enqueue_rematch(profile_id)
             return True
         return False
 
+    @staticmethod
+    async def _mark_rematch(session: AsyncSession, profile_id: int) -> None:
+        """면허/실적이 바뀐 프로필은 재매칭 대상으로 표시 (커밋 후 _enqueue_rematch)"""
+        await session.execute(update(UserProfile).where(UserProfile.id == profile_id).values(matched_at=None))
+
+    @staticmethod
+    async def _enqueue_rematch(profile_id: int) -> None:
+        """매칭 피드 재계산 작업 등록 (Taskiq rematch_profile_matches)"""
+        await match_percolator.enqueue_rematch(profile_id)
+
+    @staticmethod
+    async def _refresh_license_mask(session: AsyncSession, profile_id: int) -> None:
+        """보유 면허 비트마스크(UserProfile.license_mask) 재계산 + 재매칭 표시"""
+        await session.flush()
+        names = await session.scalars(select(UserLicense.license_name).where(UserLicense.profile_id == profile_id))
+        await session.execute(
+            update(UserProfile)
+            .where(UserProfile.id == profile_id)
+            .values(license_mask=license_taxonomy.mask(names), matched_at=None)
+        )
+
 
 profile_service = ProfileService()
@@ -0,0 +1,106 @@
+"""
+키워드 → 구독자 역색인 (알림 대상 산출)
+
+활성 사용자의 포함 키워드(UserKeyword) 전체를 키워드별 구독자 목록으로 뒤집고,
+키워드 집합을 Aho–Corasick 오토마톤으로 컴파일합니다. 신규 공고 1건은 본문을 한 번
+훑어 적중 키워드를 찾은 뒤 구독자 목록으로 바로 펼치므로, 사용자 수 × 키워드 수를
+순회하지 않습니다.
+
+색인은 프로세스 단위로 캐시하며, UserKeyword / User 테이블 버전(행 수 + 최종 수정 시각)이
+바뀐 경우에만 다시 만듭니다.
+
+사용법:
+    from app.services.subscriber_index import subscriber_index
+
+    index = await subscriber_index.get(session)
+    for user_id, keywords in index.match(bid.search_text).items():
+        ...
+"""
+
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging import logger
+from app.db.models import User, UserKeyword
+from app.services.keyword_matcher import KeywordAutomaton
+
+
+class KeywordSubscriberIndex:
+    """키워드 → 구독 사용자 ID 역색인"""
+
+    def __init__(self, subscriptions: Iterable[tuple[int, str]], version: tuple | None = None):
+        subscribers: dict[str, set[int]] = defaultdict(set)
+        for user_id, keyword in subscriptions:
+            if keyword:
+                subscribers[keyword].add(user_id)
+
+        self.version = version
+        self.subscribers: dict[str, tuple[int, ...]] = {k: tuple(sorted(v)) for k, v in subscribers.items()}
+        self.subscription_count = sum(len(v) for v in self.subscribers.values())
+        self._automaton = KeywordAutomaton(self.subscribers)
+
+    def __len__(self) -> int:
+        return len(self.subscribers)
+
+    def match(self, text: str) -> dict[int, list[str]]:
+        """본문과 매칭되는 {사용자 ID: 매칭 키워드 목록}"""
+        matches: dict[int, list[str]] = defaultdict(list)
+        for keyword in sorted(self._automaton.find(text)):
+            for user_id in self.subscribers[keyword]:
+                matches[user_id].append(keyword)
+        return dict(matches)
+
+
+class SubscriberIndexCache:
+    """테이블 버전이 같으면 이전 색인을 재사용하는 캐시"""
+
+    def __init__(self):
+        self._index: KeywordSubscriberIndex | None = None
+
+    async def get(self, session: AsyncSession) -> KeywordSubscriberIndex:
+        version = await self._current_version(session)
+        if self._index is None or self._index.version != version:
+            self._index = await self._build(session, version)
+        return self._index
+
+    def invalidate(self) -> None:
+        self._index = None
+
+    @staticmethod
+    async def _current_version(session: AsyncSession) -> tuple:
+        stmt = select(
+            select(func.count(UserKeyword.id)).scalar_subquery(),
+            select(func.max(UserKeyword.updated_at)).scalar_subquery(),
+            select(func.count(User.id)).scalar_subquery(),
+            select(func.max(User.updated_at)).scalar_subquery(),
+        )
+        result = await session.execute(stmt)
+        return tuple(result.one())
+
+    @staticmethod
+    async def _build(session: AsyncSession, version: tuple) -> KeywordSubscriberIndex:
+        started = time.perf_counter()
+        stmt = (
+            select(UserKeyword.user_id, UserKeyword.keyword)
+            .join(User, User.id == UserKeyword.user_id)
+            .where(
+                UserKeyword.is_active.is_(True),
+                UserKeyword.category == "include",
+                User.is_active.is_(True),
+            )
+        )
+        result = await session.execute(stmt)
+        index = KeywordSubscriberIndex(result.all(), version=version)
+        logger.info(
+            f"키워드 구독자 색인 생성: 키워드 {len(index)}개, 구독 {index.subscription_count}건 "
+            f"({time.perf_counter() - started:.2f}초)"
+        )
+        return index
+
+
+# 싱글톤 인스턴스
+subscriber_index = SubscriberIndexCache()
@@ -0,0 +1,170 @@
+"""
+파일 업로드 임시 저장 (디스크 스풀)
+
+POST /bids/upload로 받은 파일을 메모리에 통째로 읽지 않고 임시 파일에 청크 단위로 기록합니다.
+텍스트 추출 / 공고 생성 / AI 분석은 Taskiq 작업(process_bid_upload)이 이 파일을 읽어 처리합니다.
+
+- 청크마다 크기 상한 검사 (초과하는 순간 중단하고 임시 파일 삭제)
+- 기록하면서 SHA-256 계산 (첨부파일 캐시와 같은 내용 해시)
+- 저장 경로: UPLOAD_SPOOL_DIR (API 서버와 Taskiq 워커가 같은 경로를 볼 수 있어야 함).
+  컨테이너를 나눠 띄우면 공유 볼륨이 필요하며, 시작 시 verify_shared_spool로 확인합니다.
+
+사용법:
+    from app.services.upload_service import upload_service
+
+    spooled = await upload_service.spool(file, max_bytes=MAX_FILE_SIZE_BYTES)
+    text = await upload_service.extract_text(spooled.path, filename)
+    upload_service.discard(spooled.path)
+"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastapi import UploadFile
+
+from app.core.cache import get_redis
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.process_pool import run_in_process
+from app.services.file_service import file_service
+
+CHUNK_SIZE = 64 * 1024
+
+# 스풀 공유 확인: 프로세스 역할별 표식 파일 / Redis 키 (같은 토큰을 기록)
+SPOOL_MARKER = ".spool-{role}"
+SPOOL_TOKEN_KEY = "upload:spool:{role}"
+SPOOL_CHECK_ATTEMPTS = 3
+SPOOL_CHECK_INTERVAL = 1.0
+
+
+class UploadTooLargeError(ValueError):
+    """업로드 파일이 크기 상한을 초과"""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"upload exceeds {max_bytes} bytes")
+        self.max_bytes = max_bytes
+
+
+class SpoolNotSharedError(RuntimeError):
+    """API 서버와 Taskiq 워커가 서로 다른 스풀 디렉터리를 사용"""
+
+
+@dataclass
+class SpooledUpload:
+    """디스크에 저장한 업로드 파일"""
+
+    path: Path
+    size: int
+    sha256: str
+
+
+class UploadService:
+    def __init__(self, directory: str | Path | None = None):
+        self._directory = Path(directory) if directory is not None else None
+
+    @property
+    def directory(self) -> Path:
+        if self._directory is not None:
+            return self._directory
+        if settings.UPLOAD_SPOOL_DIR:
+            return Path(settings.UPLOAD_SPOOL_DIR)
+        return Path(tempfile.gettempdir()) / "biz-retriever" / "uploads"
+
+    async def spool(self, file: UploadFile, max_bytes: int) -> SpooledUpload:
+        """
+        업로드 스트림을 임시 파일에 청크 단위로 기록
+
+        Raises:
+            UploadTooLargeError: max_bytes 초과 (임시 파일은 삭제됨)
+        """
+        await asyncio.to_thread(self.directory.mkdir, parents=True, exist_ok=True)
+        path = self.directory / f"{uuid.uuid4().hex}.upload"
+        digest = hashlib.sha256()
+        size = 0
+
+        handle = await asyncio.to_thread(open, path, "wb")
+        try:
+            while chunk := await file.read(CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(max_bytes)
+                digest.update(chunk)
+                await asyncio.to_thread(handle.write, chunk)
+        except BaseException:
+            await asyncio.to_thread(handle.close)
+            self.discard(path)
+            raise
+        await asyncio.to_thread(handle.close)
+
+        return SpooledUpload(path=path, size=size, sha256=digest.hexdigest())
+
+    async def extract_text(self, path: str | Path, filename: str, max_chars: int | None = None) -> str:
+        """
+        저장한 파일에서 텍스트 추출 (추출 프로세스 풀에서 실행)
+
+        Raises:
+            FileNotFoundError: 임시 파일이 없음 (이미 처리되었거나 다른 호스트에 저장됨)
+            Exception: 파싱 실패 (file_service.extract_text 예외 그대로 전파)
+        """
+        content = await asyncio.to_thread(Path(path).read_bytes)
+        return await run_in_process(file_service.extract_text, content, filename, max_chars)
+
+    async def verify_shared_spool(self, role: str) -> None:
+        """
+        API 서버("api")와 Taskiq 워커("worker")가 같은 스풀 디렉터리를 보는지 확인 (시작 시 1회)
+
+        각 프로세스는 스풀 디렉터리의 표식 파일(.spool-{role})과 Redis에 같은 임의 토큰을 기록하고,
+        상대 역할의 토큰이 Redis에 있으면 이 디렉터리의 상대 표식 파일과 비교합니다.
+        다르면 컨테이너별 임시 디렉터리처럼 공유되지 않는 경로이므로(업로드 작업이 모두 실패) 시작을 중단합니다.
+        상대가 아직 시작하지 않았으면 나중에 시작하는 쪽이 확인하고, Redis에 접근할 수 없으면 경고만 남깁니다.
+
+        Raises:
+            SpoolNotSharedError: 상대 역할의 표식 파일이 없거나 토큰이 다름
+        """
+        other = "worker" if role == "api" else "api"
+        token = uuid.uuid4().hex
+        await asyncio.to_thread(self.directory.mkdir, parents=True, exist_ok=True)
+        await asyncio.to_thread((self.directory / SPOOL_MARKER.format(role=role)).write_text, token)
+        try:
+            redis = await get_redis()
+            await redis.set(SPOOL_TOKEN_KEY.format(role=role), token)
+            for attempt in range(SPOOL_CHECK_ATTEMPTS):
+                expected = await redis.get(SPOOL_TOKEN_KEY.format(role=other))
+                if expected is None or await self._read_marker(other) == expected:
+                    return
+                # 상대가 재시작하며 표식 파일과 토큰을 바꾸는 중일 수 있으므로 잠시 후 다시 확인
+                if attempt + 1 < SPOOL_CHECK_ATTEMPTS:
+                    await asyncio.sleep(SPOOL_CHECK_INTERVAL)
+        except Exception as e:
+            logger.warning(f"업로드 스풀 공유 여부를 확인하지 못했습니다 (Redis): {e}")
+            return
+        raise SpoolNotSharedError(
+            f"업로드 스풀 디렉터리 {self.directory}를 {other}와 공유하지 않습니다: "
+            "UPLOAD_SPOOL_DIR을 API 서버와 Taskiq 워커가 함께 마운트한 경로로 설정하세요"
+        )
+
+    async def _read_marker(self, role: str) -> str | None:
+        try:
+            return await asyncio.to_thread((self.directory / SPOOL_MARKER.format(role=role)).read_text)
+        except FileNotFoundError:
+            return None
+
+    def discard(self, path: str | Path | None) -> None:
+        """임시 파일 삭제 (없으면 무시)"""
+        if not path:
+            return
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"업로드 임시 파일 삭제 실패: {path}: {e}")
+
+
+# 싱글톤 인스턴스
+upload_service = UploadService()
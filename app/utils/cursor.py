@@ -0,0 +1,84 @@
+"""
+목록 조회 커서 (keyset pagination)
+
+skip/limit(OFFSET)은 깊은 페이지일수록 앞 행을 모두 읽고 버리므로, 마지막으로 받은 행의
+정렬 키(예: (posted_at, id))를 커서에 담아 다음 페이지를 "그 키 다음부터" 조회합니다.
+
+- 커서 = base64url(JSON {"s": 정렬, "k": 정렬 키, "n": 지금까지 반환한 건수})
+- 클라이언트에게는 불투명한 문자열 (형식은 바뀔 수 있음)
+- 정렬이 다른 목록의 커서를 넘기면 InvalidCursorError (400)
+
+사용법:
+    from app.utils.cursor import decode_cursor, encode_cursor
+
+    next_cursor = encode_cursor("latest", (bid.posted_at, bid.id), position=20)
+    cursor = decode_cursor(next_cursor, "latest")  # Cursor(sort="latest", key=(datetime, int), position=20)
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from app.core.exceptions import InvalidCursorError
+
+# 요청 파라미터 길이 상한 (정렬 키 몇 개 + 숫자면 충분)
+MAX_CURSOR_LENGTH = 512
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """해석한 커서"""
+
+    sort: str
+    key: tuple[Any, ...]
+    position: int = 0
+
+
+def encode_cursor(sort: str, key: tuple[Any, ...], position: int = 0) -> str:
+    """정렬 키 → 불투명 커서 문자열 (datetime은 ISO 8601 문자열로 저장)"""
+    values = [value.isoformat() if isinstance(value, datetime) else value for value in key]
+    payload = json.dumps({"s": sort, "k": values, "n": position}, separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(value: str, sort: str, types: tuple[type, ...] | None = None) -> Cursor:
+    """
+    커서 문자열 → Cursor
+
+    Args:
+        sort: 현재 요청의 정렬 (커서를 만든 정렬과 달라야 하면 안 됨)
+        types: 정렬 키 각 값의 타입 (datetime이면 ISO 문자열을 datetime으로 변환, 개수도 검사)
+
+    Raises:
+        InvalidCursorError: 형식 오류 / 정렬 불일치 / 키 타입 불일치
+    """
+    if not value or len(value) > MAX_CURSOR_LENGTH:
+        raise InvalidCursorError()
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)))
+        key = payload["k"]
+        position = payload.get("n", 0)
+        if payload["s"] != sort or not isinstance(key, list) or not isinstance(position, int) or position < 0:
+            raise InvalidCursorError()
+        if types is not None:
+            if len(key) != len(types):
+                raise InvalidCursorError()
+            key = [_coerce(item, expected) for item, expected in zip(key, types, strict=True)]
+    except InvalidCursorError:
+        raise
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError() from e
+    return Cursor(sort=sort, key=tuple(key), position=position)
+
+
+def _coerce(value: Any, expected: type) -> Any:
+    if expected is datetime:
+        return datetime.fromisoformat(value)
+    if expected is float and isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    if not isinstance(value, expected) or isinstance(value, bool):
+        raise InvalidCursorError()
+    return value
@@ -0,0 +1,88 @@
+"""
+Hard Match 비교 키 (지역 코드 / 면허 비트마스크)
+
+HardMatchEngine(Python)과 BidRepository의 Hard Match 쿼리(SQL)가 같은 결과를 내도록,
+공고 저장 시 아래 규칙으로 만든 값을 BidAnnouncement.match_region_code / license_mask에 보관합니다.
+
+- 지역: region_code가 지역 코드면 그대로, 시/도 이름이면 코드로 변환, 없거나 "00"이면 기관명/제목에서
+        지역 사전(app.utils.region_gazetteer)으로 추출. "전국" 또는 추출 실패는 None (지역 제한 없음)
+- 면허: 면허 분류 사전(app.utils.license_taxonomy)으로 만든 비트마스크.
+        공고는 license_requirements(없으면 검색 텍스트)의 요구 면허, 사용자는 보유 면허
+        (UserProfile.license_mask)
+- 공고 요구 비트가 모두 사용자 비트에 포함되면 면허 조건 통과 (SQL: license_mask & :미보유 비트 = 0)
+
+사용법:
+    from app.utils.hard_match import bid_license_mask, bid_match_region_code, profile_license_mask
+
+    required = bid_license_mask(bid)
+    passed = license_taxonomy.covers(profile_license_mask(profile), required)
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from app.utils.license_taxonomy import LICENSE_KEYWORDS, license_taxonomy
+from app.utils.region_gazetteer import REGION_ALIASES, REGION_CODES, region_gazetteer
+from app.utils.search_text import bid_search_text
+
+# 지역 제한 없음 표기 (region_code "00"/빈 값은 기관명/제목에서 다시 추출)
+NATIONWIDE = "전국"
+
+_REGION_BY_NAME = {name: code for code, name in REGION_CODES.items()} | {
+    alias: code for code, aliases in REGION_ALIASES.items() for alias in aliases
+}
+
+
+def bid_region_code(region_code: str | None, agency: str | None, title: str | None) -> str | None:
+    """공고의 지역 코드 (None: 지역 제한 없음)"""
+    region = (region_code or "").strip()
+    if region == NATIONWIDE:
+        return None
+    if region in REGION_CODES:
+        return region
+    if region in _REGION_BY_NAME:
+        return _REGION_BY_NAME[region]
+
+    return region_gazetteer.resolve(f"{agency or ''} {title or ''}")
+
+
+def bid_match_region_code(bid: Any) -> str | None:
+    """공고 지역 코드 (저장된 match_region_code, 아직 저장 전인 객체는 즉석 계산)"""
+    state = vars(bid)
+    if "match_region_code" in state:
+        return state["match_region_code"]
+    return bid_region_code(bid.region_code, bid.agency, bid.title)
+
+
+def extract_license_keywords(search_text: str | None) -> list[str]:
+    """검색 텍스트에 나오는 면허 키워드 (분류별 첫 번째 적중)"""
+    text = search_text or ""
+    required = set()
+    for keywords in LICENSE_KEYWORDS.values():
+        for keyword in keywords:
+            if keyword in text:
+                required.add(keyword)
+                break
+    return list(required)
+
+
+def bid_license_mask(bid: Any) -> int:
+    """공고 요구 면허 비트마스크 (저장된 license_mask, 아직 저장 전인 객체는 즉석 계산)"""
+    mask = getattr(bid, "license_mask", None)
+    if isinstance(mask, int):
+        return mask
+    return license_taxonomy.required_mask(bid.license_requirements, bid_search_text(bid))
+
+
+def profile_license_mask(profile: Any) -> int:
+    """보유 면허 비트마스크 (저장된 license_mask, 없으면 보유 면허 이름으로 계산)"""
+    mask = getattr(profile, "license_mask", None)
+    if isinstance(mask, int):
+        return mask
+    return license_taxonomy.mask(lic.license_name for lic in profile.licenses or [])
+
+
+def bid_license_keys(license_requirements: Iterable[str] | None, search_text: str | None) -> list[str]:
+    """공고 요구 면허 표시 이름 (분류 대표 이름 + 사전에 없는 이름)"""
+    mask = license_taxonomy.required_mask(license_requirements, search_text)
+    return license_taxonomy.names(mask) + license_taxonomy.unknown_names(license_requirements)
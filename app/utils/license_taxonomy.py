@@ -0,0 +1,158 @@
+"""
+면허 분류 사전 (동의어 → 면허 id → 비트마스크)
+
+면허 이름은 자유 입력("전기공사업 면허", "조경공사업(1종)", "정보통신" ...)이므로 문자열끼리 비교하지 않고,
+분류 사전으로 면허 id를 찾아 비트마스크로 저장합니다.
+
+- 면허 id = 비트 번호. BidAnnouncement.license_mask / UserProfile.license_mask(BIGINT)에 저장되므로
+  기존 항목의 순서를 바꾸지 말고 새 면허는 뒤에 추가합니다 (추가 후 license_mask 재계산 마이그레이션 필요).
+- 동의어 검색: 정규화한 이름/본문에서 긴 동의어부터 찾고, 찾은 구간은 지워서 짧은 동의어가
+  다시 걸리지 않게 합니다 (예: "실내건축공사업"은 실내건축만, "건축"은 아님).
+- 한 동의어가 여러 면허를 뜻할 수 있습니다 (예: "종합건설업" → 건축 + 토목).
+- 공고 요구 면허 중 사전에 없는 이름은 UNKNOWN_BIT로 표시합니다. 사용자 마스크에는 이 비트가 없으므로
+  확인할 수 없는 요구 면허가 있는 공고는 매칭되지 않습니다 (Zero False Positive).
+- 면허 조건: (공고 마스크 & ~사용자 마스크) == 0  (SQL: license_mask & :미보유 비트 = 0)
+
+사용법:
+    from app.utils.license_taxonomy import license_taxonomy
+
+    owned = license_taxonomy.mask(["조경공사업", "전기"])
+    required = license_taxonomy.required_mask(["전기공사업 면허"], None)
+    passed = license_taxonomy.covers(owned, required)
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from app.utils.search_text import normalize_text
+
+# 기본 분류 (HardMatchEngine.LICENSE_KEYWORDS): 분류명 → 동의어, 첫 동의어가 대표 이름
+LICENSE_KEYWORDS = {
+    "조경": ["조경공사업", "조경", "조경시설"],
+    "건축": ["건축공사업", "건축", "종합건설업"],
+    "토목": ["토목공사업", "토목건축공사업", "종합건설업"],
+    "전기": ["전기공사업", "전기"],
+    "통신": ["정보통신공사업", "통신"],
+    "소방": ["소방시설공사업", "소방"],
+}
+
+# 추가 분류 (본문 일반 단어와 겹치지 않도록 정식 면허 이름만 동의어로 사용)
+EXTRA_LICENSES = {
+    "석면해체": ["석면해체제거업"],
+    "실내건축": ["실내건축공사업"],
+    "철근콘크리트": ["철근콘크리트공사업"],
+    "상하수도": ["상하수도설비공사업"],
+    "기계설비": ["기계설비공사업"],
+    "가스시설": ["가스시설시공업"],
+}
+
+
+@dataclass(frozen=True)
+class LicenseType:
+    """면허 분류 1건"""
+
+    id: int
+    key: str
+    name: str
+    synonyms: tuple[str, ...]
+
+    @property
+    def bit(self) -> int:
+        return 1 << self.id
+
+
+class LicenseTaxonomy:
+    """면허 분류 사전"""
+
+    # BIGINT(부호 있는 64비트) 안에서 0~61번은 면허, 62번은 미분류 요구 면허
+    MAX_TYPES = 62
+    UNKNOWN_BIT = 1 << 62
+    ALL_BITS = (1 << 63) - 1
+
+    def __init__(self, groups: dict[str, list[str]] | None = None):
+        self.types: list[LicenseType] = []
+        self._ids_by_synonym: dict[str, set[int]] = {}
+        self._synonyms: list[str] = []
+        for key, synonyms in (groups or {}).items():
+            self.register(key, synonyms)
+
+    def register(self, key: str, synonyms: Iterable[str]) -> LicenseType:
+        """면허 분류 추가 (id는 등록 순서)"""
+        if len(self.types) >= self.MAX_TYPES:
+            raise ValueError(f"면허 분류는 최대 {self.MAX_TYPES}개까지 등록할 수 있습니다")
+        normalized = tuple(dict.fromkeys(s for s in (normalize_text(name) for name in synonyms) if s))
+        if not normalized:
+            raise ValueError(f"면허 분류 '{key}'에 동의어가 없습니다")
+
+        license_type = LicenseType(id=len(self.types), key=key, name=normalized[0], synonyms=normalized)
+        self.types.append(license_type)
+        for synonym in normalized:
+            self._ids_by_synonym.setdefault(synonym, set()).add(license_type.id)
+        # 긴 동의어부터 (포함된 가장 긴 동의어 우선)
+        self._synonyms = sorted(self._ids_by_synonym, key=len, reverse=True)
+        return license_type
+
+    def ids(self, text: str | None) -> set[int]:
+        """이름/본문에 나오는 면허 id"""
+        remaining = normalize_text(text)
+        found: set[int] = set()
+        for synonym in self._synonyms:
+            if synonym in remaining:
+                found |= self._ids_by_synonym[synonym]
+                remaining = remaining.replace(synonym, "\x00")
+        return found
+
+    def mask(self, names: Iterable[str]) -> int:
+        """보유 면허 이름 → 비트마스크 (사전에 없는 이름은 무시)"""
+        mask = 0
+        for name in names:
+            for license_id in self.ids(name):
+                mask |= 1 << license_id
+        return mask
+
+    def required_mask(self, license_requirements: Iterable[str] | None, search_text: str | None) -> int:
+        """
+        공고 요구 면허 → 비트마스크
+
+        license_requirements가 있으면 그 목록(사전에 없는 이름은 UNKNOWN_BIT),
+        없으면 검색 텍스트에 나오는 면허.
+        """
+        names = [name for name in license_requirements or [] if normalize_text(name)]
+        if not names:
+            return self.mask([search_text or ""])
+        mask = 0
+        for name in names:
+            ids = self.ids(name)
+            if not ids:
+                mask |= self.UNKNOWN_BIT
+            for license_id in ids:
+                mask |= 1 << license_id
+        return mask
+
+    def unknown_names(self, license_requirements: Iterable[str] | None) -> list[str]:
+        """사전에 없는 요구 면허 이름 (표시용)"""
+        return [name for name in license_requirements or [] if normalize_text(name) and not self.ids(name)]
+
+    def names(self, mask: int) -> list[str]:
+        """비트마스크 → 대표 이름 (id 순, UNKNOWN_BIT 제외)"""
+        return [license_type.name for license_type in self.types if mask & license_type.bit]
+
+    @staticmethod
+    def covers(owned: int, required: int) -> bool:
+        """보유 마스크가 요구 마스크를 모두 포함"""
+        return required & ~owned == 0
+
+    def missing(self, owned: int) -> int:
+        """보유하지 않은 비트 (SQL 조건 license_mask & missing = 0 에 사용)"""
+        return self.ALL_BITS & ~owned
+
+
+def _default_taxonomy() -> LicenseTaxonomy:
+    taxonomy = LicenseTaxonomy(LICENSE_KEYWORDS)
+    for key, synonyms in EXTRA_LICENSES.items():
+        taxonomy.register(key, synonyms)
+    return taxonomy
+
+
+# 싱글톤 인스턴스
+license_taxonomy = _default_taxonomy()
@@ -0,0 +1,158 @@
+"""
+지역 사전 (시/도 · 시/군/구 · 기관명 패턴 → 시/도 코드)
+
+공고 저장 시 기관명/제목에서 지역 코드를 한 번 찾아 BidAnnouncement.match_region_code에 보관하고,
+매칭 엔진은 저장된 코드만 읽습니다. 사전은 모듈 로드 시 키워드 매처와 같은 Aho-Corasick 오토마톤
+(app.services.keyword_matcher.KeywordAutomaton)으로 한 번 컴파일하므로 이름 수와 관계없이 본문을 한 번만 훑습니다.
+
+- 시/도: 정식 이름, 줄임말(서울, 경기, 충북 ...), 새 이름(강원특별자치도, 전북특별자치도)
+- 시/군/구: "수원시", "해운대구"처럼 접미사까지 포함한 이름. 여러 시/도에 있는 이름(중구, 고성군 ...)은
+  어느 지역인지 알 수 없으므로 사전에서 뺍니다.
+- 기관명 패턴: 이름에 지역명이 없는 지방 공기업 약칭 (SH공사 등)
+- 여러 이름이 나오면 가장 앞에 나온 이름, 같은 위치면 가장 긴 이름 (예: "경기도 수원시" → 41)
+
+사용법:
+    from app.utils.region_gazetteer import region_gazetteer
+
+    region_gazetteer.resolve("부산광역시 해운대구청")  # "26"
+    region_gazetteer.resolve("조달청")  # None
+"""
+
+from app.services.keyword_matcher import KeywordAutomaton
+from app.utils.search_text import normalize_text
+
+REGION_CODES = {
+    "11": "서울특별시",
+    "26": "부산광역시",
+    "27": "대구광역시",
+    "28": "인천광역시",
+    "29": "광주광역시",
+    "30": "대전광역시",
+    "31": "울산광역시",
+    "36": "세종특별자치시",
+    "41": "경기도",
+    "42": "강원도",
+    "43": "충청북도",
+    "44": "충청남도",
+    "45": "전라북도",
+    "46": "전라남도",
+    "47": "경상북도",
+    "48": "경상남도",
+    "50": "제주특별자치도",
+}
+
+# 시/도 다른 이름 (줄임말, 개편된 이름). "광주"는 경기도 광주시와 겹치지만 광주광역시로 봅니다
+REGION_ALIASES = {
+    "11": ["서울"],
+    "26": ["부산"],
+    "27": ["대구"],
+    "28": ["인천"],
+    "29": ["광주"],
+    "30": ["대전"],
+    "31": ["울산"],
+    "36": ["세종"],
+    "41": ["경기"],
+    "42": ["강원", "강원특별자치도"],
+    "43": ["충청북", "충북"],
+    "44": ["충청남", "충남"],
+    "45": ["전라북", "전북", "전북특별자치도"],
+    "46": ["전라남", "전남"],
+    "47": ["경상북", "경북"],
+    "48": ["경상남", "경남"],
+    "50": ["제주"],
+}
+
+# 시/군/구 (시/도 코드별). 경기도 광주시는 광주광역시 약칭("광주시청")과 겹치므로 넣지 않습니다
+DISTRICTS = {
+    "11": (
+        "종로구 중구 용산구 성동구 광진구 동대문구 중랑구 성북구 강북구 도봉구 노원구 은평구 서대문구 "
+        "마포구 양천구 강서구 구로구 금천구 영등포구 동작구 관악구 서초구 강남구 송파구 강동구"
+    ),
+    "26": "중구 서구 동구 영도구 부산진구 동래구 남구 북구 해운대구 사하구 금정구 강서구 연제구 수영구 사상구 기장군",
+    "27": "중구 동구 서구 남구 북구 수성구 달서구 달성군 군위군",
+    "28": "중구 동구 미추홀구 연수구 남동구 부평구 계양구 서구 강화군 옹진군",
+    "29": "동구 서구 남구 북구 광산구",
+    "30": "동구 중구 서구 유성구 대덕구",
+    "31": "중구 남구 동구 북구 울주군",
+    "41": (
+        "수원시 성남시 의정부시 안양시 부천시 광명시 평택시 동두천시 안산시 고양시 과천시 구리시 남양주시 "
+        "오산시 시흥시 군포시 의왕시 하남시 용인시 파주시 이천시 안성시 김포시 화성시 양주시 "
+        "포천시 여주시 연천군 가평군 양평군"
+    ),
+    "42": (
+        "춘천시 원주시 강릉시 동해시 태백시 속초시 삼척시 홍천군 횡성군 영월군 평창군 정선군 철원군 "
+        "화천군 양구군 인제군 고성군 양양군"
+    ),
+    "43": "청주시 충주시 제천시 보은군 옥천군 영동군 증평군 진천군 괴산군 음성군 단양군",
+    "44": "천안시 공주시 보령시 아산시 서산시 논산시 계룡시 당진시 금산군 부여군 서천군 청양군 홍성군 예산군 태안군",
+    "45": "전주시 군산시 익산시 정읍시 남원시 김제시 완주군 진안군 무주군 장수군 임실군 순창군 고창군 부안군",
+    "46": (
+        "목포시 여수시 순천시 나주시 광양시 담양군 곡성군 구례군 고흥군 보성군 화순군 장흥군 강진군 "
+        "해남군 영암군 무안군 함평군 영광군 장성군 완도군 진도군 신안군"
+    ),
+    "47": (
+        "포항시 경주시 김천시 안동시 구미시 영주시 영천시 상주시 문경시 경산시 의성군 청송군 영양군 "
+        "영덕군 청도군 고령군 성주군 칠곡군 예천군 봉화군 울진군 울릉군"
+    ),
+    "48": (
+        "창원시 진주시 통영시 사천시 김해시 밀양시 거제시 양산시 의령군 함안군 창녕군 고성군 남해군 "
+        "하동군 산청군 함양군 거창군 합천군"
+    ),
+    "50": "제주시 서귀포시",
+}
+
+# 이름에 지역명이 없는 지방 공기업 약칭
+AGENCY_PATTERNS = {
+    "SH공사": "11",
+    "GH공사": "41",
+    "iH공사": "28",
+}
+
+
+class RegionGazetteer:
+    """지역 이름 → 시/도 코드 사전 (KeywordAutomaton 적중 중 가장 앞 · 가장 긴 이름 선택)"""
+
+    def __init__(self, names: dict[str, str]):
+        self.codes = {name: code for name, code in names.items() if normalize_text(name)}
+        self._lengths = {name: len(normalize_text(name)) for name in self.codes}
+        self.max_length = max(self._lengths.values(), default=0)
+        self._automaton = KeywordAutomaton(self.codes)
+
+    def find(self, text: str | None) -> tuple[int, str, str] | None:
+        """가장 앞에 나온(같은 위치면 가장 긴) 이름의 (시작 위치, 이름, 코드)"""
+        text = normalize_text(text)
+        best: tuple[int, int, str] | None = None  # (시작 위치, -길이, 이름): 작을수록 우선
+        for end, names in self._automaton.iter_matches(text):
+            # 이후 적중은 모두 best보다 뒤에서 시작
+            if best and end - self.max_length > best[0]:
+                break
+            for name in names:
+                length = self._lengths[name]
+                candidate = (end - length, -length, name)
+                if best is None or candidate < best:
+                    best = candidate
+        if best is None:
+            return None
+        start, negative_length, name = best
+        return start, text[start : start - negative_length], self.codes[name]
+
+    def resolve(self, text: str | None) -> str | None:
+        """텍스트에 나오는 지역의 시/도 코드 (없으면 None)"""
+        found = self.find(text)
+        return found[2] if found else None
+
+
+def gazetteer_names() -> dict[str, str]:
+    """사전 이름 → 시/도 코드 (여러 시/도에 있는 시/군/구 이름 제외)"""
+    district_codes: dict[str, set[str]] = {}
+    for code, districts in DISTRICTS.items():
+        for district in districts.split():
+            district_codes.setdefault(district, set()).add(code)
+    names = {district: codes.pop() for district, codes in district_codes.items() if len(codes) == 1}
+    names |= AGENCY_PATTERNS
+    names |= {name: code for code, aliases in REGION_ALIASES.items() for name in aliases}
+    return names | {name: code for code, name in REGION_CODES.items()}
+
+
+# 싱글톤 인스턴스
+region_gazetteer = RegionGazetteer(gazetteer_names())
@@ -0,0 +1,135 @@
+"""
+공고 검색 텍스트 정규화
+
+키워드/면허 매칭이 비교할 때마다 제목 + 본문을 이어 붙이고 소문자로 바꾸지 않도록,
+공고 저장 시 한 번 정규화한 결과를 BidAnnouncement.search_text에 보관합니다.
+
+- 호환 문자 통합 (NFKC: 전각 영숫자/기호 → 반각, 분리된 한글 자모 → 완성형, ㈜ → (주))
+- 소문자 변환
+- 제어 문자 / 줄바꿈 / 연속 공백 → 공백 1개, 폭 없는 문자(zero-width, soft hyphen) 제거
+- 구성: "제목\\n본문\\n첨부파일 앞부분" (각 구역 안에는 줄바꿈이 없으므로 첫 줄이 제목)
+- 검색 결과 미리보기(make_snippet): 적중 단어 주변 본문을 잘라 <mark> 표시
+- 2글자 조각(build_search_bigrams): trigram이 없는 2글자 검색어('소방', '전기')용 인덱스 키
+
+사용법:
+    from app.utils.search_text import bid_search_text, normalize_text, split_title
+
+    title, body = split_title(bid_search_text(bid))
+    if normalize_text(keyword) in title:
+        ...
+"""
+
+import html
+import re
+import unicodedata
+from typing import Any
+
+from app.core.config import settings
+
+SECTION_SEPARATOR = "\n"
+
+_INVISIBLE = re.compile("[\u00ad\u200b-\u200f\u202a-\u202e\u2060-\u2064\ufeff]")
+_SPACES = re.compile(r"[\s\x00-\x1f\x7f-\x9f]+")
+
+
+def normalize_text(text: str | None) -> str:
+    """비교용 정규화 (키워드와 본문에 같은 규칙 적용)"""
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = _INVISIBLE.sub("", text)
+    return _SPACES.sub(" ", text).strip()
+
+
+def build_search_text(
+    title: str | None,
+    content: str | None,
+    attachment_content: str | None = None,
+    attachment_chars: int | None = None,
+) -> str:
+    """
+    제목 / 본문 / 첨부파일 앞부분을 정규화하여 하나의 검색 텍스트로 결합
+
+    Args:
+        attachment_chars: 포함할 첨부파일 앞부분 글자 수 (None이면 SEARCH_TEXT_ATTACHMENT_CHARS)
+    """
+    if attachment_chars is None:
+        attachment_chars = settings.SEARCH_TEXT_ATTACHMENT_CHARS
+    sections = [normalize_text(title), normalize_text(content)]
+    if attachment_content and attachment_chars > 0:
+        sections.append(normalize_text(attachment_content[:attachment_chars]))
+    return SECTION_SEPARATOR.join(sections).rstrip(SECTION_SEPARATOR)
+
+
+def build_search_bigrams(search_text: str | None) -> list[str]:
+    """
+    검색 텍스트의 단어별 2글자 조각 (중복 제거, 정렬)
+
+    검색 단어에는 공백이 없으므로 "2글자 단어가 search_text에 포함됨"과
+    "단어가 이 목록에 있음"은 같습니다 (BidAnnouncement.search_bigrams, PostgreSQL GIN 인덱스).
+    """
+    grams: set[str] = set()
+    for word in set((search_text or "").split()):
+        grams.update(word[i : i + 2] for i in range(len(word) - 1))
+    return sorted(grams)
+
+
+def split_title(search_text: str) -> tuple[str, str]:
+    """검색 텍스트를 (제목, 본문 + 첨부파일)로 분리"""
+    title, _, body = search_text.partition(SECTION_SEPARATOR)
+    return title, body
+
+
+def bid_search_text(bid: Any) -> str:
+    """
+    공고의 검색 텍스트
+
+    저장된 search_text를 사용하고, 아직 저장 전인 객체(또는 마이그레이션 전 행)만 즉석에서 만듭니다.
+    """
+    if bid.search_text is not None:
+        return bid.search_text
+    return build_search_text(bid.title, bid.content, getattr(bid, "attachment_content", None))
+
+
+def search_terms(keyword: str | None, max_terms: int = 10) -> list[str]:
+    """검색어를 정규화한 뒤 공백 기준으로 나눈 검색 단어 (중복 제거, 입력 순서 유지)"""
+    return list(dict.fromkeys(normalize_text(keyword).split()))[:max_terms]
+
+
+def make_snippet(search_text: str, terms: list[str], width: int = 160) -> str:
+    """
+    검색 결과 미리보기: 본문(+첨부)에서 첫 적중 위치 주변 width자를 잘라 적중 단어를 <mark>로 표시
+
+    본문은 HTML 이스케이프하므로 그대로 innerHTML에 넣어도 안전합니다.
+    본문에 적중이 없으면(제목에만 있는 경우) 본문 앞부분을 반환합니다.
+    """
+    _, body = split_title(search_text)
+    body = body.replace(SECTION_SEPARATOR, " ")
+    hits = [pos for pos in (body.find(term) for term in terms if term) if pos >= 0]
+    start = max(0, min(hits) - width // 4) if hits else 0
+    end = min(len(body), start + width)
+    window = body[start:end]
+
+    # 창 안의 적중 구간 (겹치면 병합)
+    spans: list[list[int]] = []
+    for term in terms:
+        pos = window.find(term) if term else -1
+        while pos >= 0:
+            spans.append([pos, pos + len(term)])
+            pos = window.find(term, pos + len(term))
+    spans.sort()
+    merged: list[list[int]] = []
+    for span in spans:
+        if merged and span[0] <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], span[1])
+        else:
+            merged.append(span)
+
+    parts = []
+    cursor = 0
+    for begin, finish in merged:
+        parts.append(html.escape(window[cursor:begin]))
+        parts.append(f"<mark>{html.escape(window[begin:finish])}</mark>")
+        cursor = finish
+    parts.append(html.escape(window[cursor:]))
+    return ("…" if start > 0 else "") + "".join(parts) + ("…" if end < len(body) else "")
@@ -7,11 +7,13 @@ Taskiq는 async-native Task Queue로 Celery보다 가볍고 FastAPI와 완벽하
 - 단순한 설정 (Worker + Scheduler 통합)
 """
 
-from taskiq import TaskiqScheduler
+from taskiq import TaskiqEvents, TaskiqScheduler, TaskiqState
 from taskiq.schedule_sources import LabelScheduleSource
 from taskiq_redis import ListQueueBroker
 
 from app.core.config import settings
+from app.core.http_client import close_http_clients
+from app.core.process_pool import shutdown_process_pool
 
 # Redis Broker 생성
 broker = ListQueueBroker(url=settings.REDIS_URL)
@@ -38,3 +40,23 @@ async def shutdown():
     """Taskiq 종료 시 정리"""
     await broker.shutdown()
     await scheduler.shutdown()
+
+
+@broker.on_event(TaskiqEvents.WORKER_STARTUP)
+async def verify_worker_upload_spool(state: TaskiqState) -> None:
+    """워커 시작 시 API 서버와 업로드 스풀 디렉터리를 공유하는지 확인 (다르면 시작 중단)"""
+    from app.services.upload_service import upload_service
+
+    await upload_service.verify_shared_spool("worker")
+
+
+@broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)
+async def close_worker_http_clients(state: TaskiqState) -> None:
+    """워커 종료 시 외부 API 공유 HTTP 클라이언트 풀 정리"""
+    await close_http_clients()
+
+
+@broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)
+async def close_worker_process_pool(state: TaskiqState) -> None:
+    """워커 종료 시 PDF/HWP 추출 프로세스 풀 정리"""
+    shutdown_process_pool()
@@ -5,29 +5,42 @@ Celery tasks를 Taskiq로 변환 - async/await 네이티브 지원으로 더 간
 """
 
 import json
+import traceback
 from datetime import datetime, timedelta
 
-from sqlalchemy import select
+from sqlalchemy import and_, or_, select, update
 from sqlalchemy.orm import selectinload
 
+from app.core.config import settings
 from app.core.logging import logger
+from app.core.metrics import track_crawler_run
 from app.core.websocket import manager
 from app.db.models import (
     BidAnnouncement,
+    CrawlerLog,
     ExcludeKeyword,
     PaymentHistory,
     Subscription,
+    UploadJob,
     User,
     UserKeyword,
+    UserProfile,
 )
+from app.db.repositories.bid_repository import BidRepository
 from app.db.session import AsyncSessionLocal
+from app.schemas.bid import BidCreate
+from app.services.bid_service import bid_service
 from app.services.crawler_service import G2BCrawlerService
 from app.services.email_service import email_service
 from app.services.invoice_service import invoice_service
-from app.services.notification_service import NotificationService
+from app.services.match_percolator import match_percolator
+from app.services.notification_service import BidDigest, NotificationService
+from app.services.onbid_crawler import OnbidCrawlerService
 from app.services.payment_service import payment_service
 from app.services.rag_service import RAGService
+from app.services.subscriber_index import subscriber_index
 from app.services.subscription_service import subscription_service
+from app.services.upload_service import upload_service
 from app.worker.taskiq_app import broker
 
 # ============================================
@@ -48,112 +61,396 @@ async def crawl_g2b_bids():
     G2B 나라장터 크롤링 작업
 
     하루 3회 실행 (08:00, 12:00, 18:00)
+
+    직전 성공 실행의 워터마크(CrawlerLog.search_params["watermark"]) 이후 구간만 조회하며,
+    실패한 실행은 워터마크를 전진시키지 않아 다음 실행이 같은 구간부터 재개합니다.
     """
     logger.info("G2B 크롤링 작업 시작")
 
     async with AsyncSessionLocal() as session:
-        # 1. 동적 키워드 조회
-        stmt_exclude = select(ExcludeKeyword.word).where(ExcludeKeyword.is_active == True)
-        result = await session.execute(stmt_exclude)
-        dynamic_excludes = result.scalars().all()
-
-        stmt_include = (
-            select(UserKeyword.keyword)
-            .where(UserKeyword.is_active == True, UserKeyword.category == "include")
-            .distinct()
+        previous_watermark = await _get_g2b_watermark(session)
+        started_at = datetime.utcnow()
+        crawler_log = CrawlerLog(
+            source="G2B",
+            status="started",
+            started_at=started_at,
+            search_params={"watermark_from": previous_watermark},
         )
-        result = await session.execute(stmt_include)
-        dynamic_includes = result.scalars().all()
+        session.add(crawler_log)
+        await session.commit()
 
-        # 2. 크롤러 서비스 초기화
-        crawler = G2BCrawlerService()
+        total_new = 0
+        total_duplicate = 0
+        crawler = None
+        try:
+            # 1. 동적 키워드 조회
+            stmt_exclude = select(ExcludeKeyword.word).where(ExcludeKeyword.is_active == True)
+            result = await session.execute(stmt_exclude)
+            dynamic_excludes = result.scalars().all()
+
+            stmt_include = (
+                select(UserKeyword.keyword)
+                .where(UserKeyword.is_active == True, UserKeyword.category == "include")
+                .distinct()
+            )
+            result = await session.execute(stmt_include)
+            dynamic_includes = result.scalars().all()
+
+            # 2. 크롤러 서비스 초기화
+            crawler = G2BCrawlerService()
+
+            exclude_keywords = list(set(crawler.DEFAULT_EXCLUDE_KEYWORDS + list(dynamic_excludes)))
+            include_keywords = list(dynamic_includes) or (
+                crawler.INCLUDE_KEYWORDS_CONCESSION + crawler.INCLUDE_KEYWORDS_FLOWER
+            )
+
+            # 3. 크롤링 실행 (Async)
+            announcements = await crawler.fetch_new_announcements(
+                exclude_keywords=exclude_keywords,
+                include_keywords=include_keywords,
+                watermark=previous_watermark,
+            )
+
+            logger.info(f"G2B 크롤링 완료: {len(announcements)}건")
+
+            if not announcements:
+                _finish_crawler_log(
+                    crawler_log,
+                    started_at,
+                    crawler,
+                    0,
+                    0,
+                    0,
+                    search_params=_g2b_search_params(crawler, previous_watermark),
+                )
+                await session.commit()
+                return
+
+            # 4. 중요도 계산 후 일괄 저장 (url 중복은 ON CONFLICT DO NOTHING으로 건너뜀)
+            for announcement_data in announcements:
+                announcement_data["importance_score"] = crawler.calculate_importance_score(announcement_data)
+
+            inserted_ids = await BidRepository(session).bulk_insert_new(announcements)
+            await session.commit()
+            total_new = len(inserted_ids)
+            total_duplicate = len(announcements) - total_new
+
+            # 5. 신규 공고 분석 요청, 브로드캐스트, 키워드 알림
+            await _publish_new_bids(announcements, inserted_ids)
+
+            _finish_crawler_log(
+                crawler_log,
+                started_at,
+                crawler,
+                len(announcements),
+                total_new,
+                total_duplicate,
+                search_params=_g2b_search_params(crawler, previous_watermark),
+            )
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            _finish_crawler_log(crawler_log, started_at, crawler, 0, total_new, total_duplicate, error=e)
+            await session.commit()
+            raise
 
-        exclude_keywords = list(set(crawler.DEFAULT_EXCLUDE_KEYWORDS + list(dynamic_excludes)))
-        include_keywords = list(dynamic_includes) or (
-            crawler.INCLUDE_KEYWORDS_CONCESSION + crawler.INCLUDE_KEYWORDS_FLOWER
-        )
 
-        # 3. 크롤링 실행 (Async)
-        announcements = await crawler.fetch_new_announcements(
-            exclude_keywords=exclude_keywords, include_keywords=include_keywords
+# ============================================
+# Onbid 크롤링 작업 (하루 2회)
+# ============================================
+
+
+@broker.task(
+    task_name="crawl_onbid_bids",
+    schedule=[
+        {"cron": "30 8 * * *"},  # 매일 08:30
+        {"cron": "30 17 * * *"},  # 매일 17:30
+    ],
+)
+@track_crawler_run("Onbid")
+async def crawl_onbid_bids():
+    """
+    온비드 임대 공고 크롤링 작업
+
+    하루 2회 실행 (08:30, 17:30). 목록 페이지 동시 수집 → 키워드 필터 → 상세 페이지 보강 후
+    일괄 저장하며, 신규 공고는 G2B와 같은 후속 처리(분석 요청, 브로드캐스트, 키워드 알림)를 거칩니다.
+    """
+    logger.info("온비드 크롤링 작업 시작")
+
+    async with AsyncSessionLocal() as session:
+        started_at = datetime.utcnow()
+        crawler_log = CrawlerLog(
+            source="Onbid",
+            status="started",
+            started_at=started_at,
+            search_params={"max_pages": settings.ONBID_MAX_PAGES},
         )
+        session.add(crawler_log)
+        await session.commit()
+
+        total_new = 0
+        total_duplicate = 0
+        crawler = OnbidCrawlerService()
+        try:
+            announcements = await crawler.fetch_rental_announcements()
+            if "error" in crawler.last_crawl_stats:
+                raise RuntimeError(f"온비드 목록 수집 실패: {crawler.last_crawl_stats['error']}")
 
-        logger.info(f"G2B 크롤링 완료: {len(announcements)}건")
+            logger.info(f"온비드 크롤링 완료: {len(announcements)}건")
+
+            if announcements:
+                inserted_ids = await BidRepository(session).bulk_insert_new(announcements)
+                await session.commit()
+                total_new = len(inserted_ids)
+                total_duplicate = len(announcements) - total_new
 
-        if not announcements:
+                await _publish_new_bids(announcements, inserted_ids)
+
+            _finish_crawler_log(crawler_log, started_at, crawler, len(announcements), total_new, total_duplicate)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            _finish_crawler_log(crawler_log, started_at, crawler, 0, total_new, total_duplicate, error=e)
+            await session.commit()
+            raise
+
+
+async def _publish_new_bids(announcements: list[dict], inserted_ids: dict[str, int]) -> None:
+    """
+    실제로 삽입된 공고만 후속 처리 (재조회 없이 크롤링 결과로 구성)
+
+    - 중요 공고(2점 이상) AI 분석 요청
+    - WebSocket 브로드캐스트
+    - 매칭 피드(bid_matches) 갱신 / 사용자 키워드 알림은 별도 작업으로 분리 (수집 세션에서 사용자 순회 없음)
+    """
+    inserted_ids = dict(inserted_ids)
+    new_announcements = []
+    for announcement_data in announcements:
+        if announcement_data["url"] in inserted_ids:
+            bid_id = inserted_ids.pop(announcement_data["url"])
+            new_announcements.append(BidAnnouncement(id=bid_id, **announcement_data))
+
+    for new_announcement in new_announcements:
+        importance_score = new_announcement.importance_score
+
+        # AI 분석 요청 (중요 공고만)
+        if importance_score >= 2:
+            await process_bid_analysis.kiq(new_announcement.id)
+
+        logger.info(f"새 공고 저장: {new_announcement.title} " f"(중요도: {importance_score})")
+
+        # WebSocket 브로드캐스트
+        try:
+            message = json.dumps(
+                {
+                    "type": "new_bid",
+                    "bid_id": new_announcement.id,
+                    "title": new_announcement.title,
+                    "agency": new_announcement.agency,
+                }
+            )
+            await manager.broadcast(message)
+        except Exception as e:
+            logger.error(f"WebSocket 브로드캐스트 실패: {e}")
+
+    new_bid_ids = [bid.id for bid in new_announcements if bid.id is not None]
+    if new_bid_ids:
+        await percolate_bid_matches.kiq(new_bid_ids)
+        await dispatch_bid_notifications.kiq(new_bid_ids)
+
+
+def _finish_crawler_log(
+    crawler_log: CrawlerLog,
+    started_at: datetime,
+    crawler: G2BCrawlerService | OnbidCrawlerService | None,
+    total_filtered: int,
+    total_new: int,
+    total_duplicate: int,
+    error: Exception | None = None,
+    search_params: dict | None = None,
+) -> None:
+    """크롤링 결과 및 단계별 소요 시간/처리량을 CrawlerLog에 기록 (성공 시 search_params 갱신)"""
+    stage_stats = (crawler.last_crawl_stats if crawler else None) or {}
+    completed_at = datetime.utcnow()
+    crawler_log.completed_at = completed_at
+    crawler_log.duration_seconds = (completed_at - started_at).total_seconds()
+    crawler_log.total_fetched = stage_stats.get("list", {}).get("parsed", total_filtered)
+    crawler_log.total_filtered = total_filtered
+    crawler_log.total_new = total_new
+    crawler_log.total_duplicate = total_duplicate
+    crawler_log.stage_stats = stage_stats
+    if error is None:
+        crawler_log.status = "completed"
+        if search_params is not None:
+            crawler_log.search_params = search_params
+    else:
+        crawler_log.status = "failed"
+        crawler_log.error_message = str(error)
+        crawler_log.error_traceback = traceback.format_exc()
+
+
+def _g2b_search_params(crawler: G2BCrawlerService, previous_watermark: dict | None) -> dict:
+    """목록 수집이 끝까지 성공한 경우에만 워터마크 전진 (아니면 이전 값 유지)"""
+    watermark = crawler.next_watermark or previous_watermark
+    return {"watermark_from": previous_watermark, "watermark": watermark}
+
+
+async def _get_g2b_watermark(session) -> dict | None:
+    """직전 성공한 G2B 크롤링의 워터마크 (마지막 bidNtceDt, bidNtceNo)"""
+    stmt = (
+        select(CrawlerLog.search_params)
+        .where(CrawlerLog.source == "G2B", CrawlerLog.status == "completed")
+        .order_by(CrawlerLog.started_at.desc())
+        .limit(1)
+    )
+    search_params = await session.scalar(stmt)
+    return (search_params or {}).get("watermark")
+
+
+# ============================================
+# 매칭 피드 갱신 (crawl_g2b_bids에서 분리)
+# ============================================
+
+
+@broker.task(task_name="percolate_bid_matches")
+async def percolate_bid_matches(bid_ids: list[int]):
+    """
+    신규 공고와 Hard Match 되는 프로필을 찾아 bid_matches에 저장 (GET /bids/matched 피드)
+
+    프로필 조건 역색인(MatchPercolator)으로 공고 1건당 후보 프로필만 확인합니다.
+
+    Args:
+        bid_ids: 신규 저장된 공고 ID 목록
+    """
+    async with AsyncSessionLocal() as session:
+        await match_percolator.percolate_bids(session, bid_ids)
+
+
+@broker.task(task_name="rematch_profile_matches")
+async def rematch_profile_matches(profile_id: int):
+    """
+    프로필 수정 후 사용자 1명의 bid_matches 재계산 (ProfileService가 수정 커밋 후 등록)
+
+    이미 재계산된 프로필(중복 등록된 작업, matched_at 있음)은 건너뜁니다.
+
+    Args:
+        profile_id: 수정된 프로필 ID
+    """
+    async with AsyncSessionLocal() as session:
+        profile = await session.get(UserProfile, profile_id)
+        if profile is None or profile.matched_at is not None:
             return
+        await match_percolator.rematch_profile(session, profile)
 
-        # 4. 활성 사용자 조회 (알림용)
-        stmt = (
-            select(User)
-            .where(User.is_active == True)
-            .options(selectinload(User.full_profile), selectinload(User.keywords))
+
+@broker.task(
+    task_name="sweep_unmatched_profiles",
+    schedule=[
+        {"cron": "*/10 * * * *"},  # 10분마다
+    ],
+)
+async def sweep_unmatched_profiles():
+    """
+    재매칭이 끝나지 않은 프로필(matched_at 없음)의 rematch_profile_matches 작업 재등록
+
+    작업 등록 실패, 워커 중단, matched_at 컬럼 추가 직후(기존 프로필 전체)처럼 비어 남은 프로필을
+    오래된 순으로 MATCH_REMATCH_SWEEP_LIMIT개씩 다시 등록합니다 (피드 조회는 매칭을 쓰지 않음).
+    중복 등록된 작업은 rematch_profile_matches가 matched_at을 보고 건너뜁니다.
+
+    Returns:
+        등록한 프로필 수
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(UserProfile.id)
+            .where(UserProfile.matched_at.is_(None))
+            .order_by(UserProfile.id)
+            .limit(settings.MATCH_REMATCH_SWEEP_LIMIT)
         )
-        result = await session.execute(stmt)
-        active_users = result.scalars().all()
+        profile_ids = result.scalars().all()
 
-        # 5. 중복 체크를 위한 기존 URL 일괄 조회 (N+1 쿼리 방지)
-        announcement_urls = [a["url"] for a in announcements]
-        stmt = select(BidAnnouncement.url).where(BidAnnouncement.url.in_(announcement_urls))
-        result = await session.execute(stmt)
-        existing_urls = set(result.scalars().all())
+    for profile_id in profile_ids:
+        await match_percolator.enqueue_rematch(profile_id)
+    if profile_ids:
+        logger.info(f"재매칭 작업 재등록: 프로필 {len(profile_ids)}개")
+    return len(profile_ids)
 
-        # 6. 공고 저장 및 알림
-        for announcement_data in announcements:
-            # 중복 체크 (메모리에서 조회)
-            if announcement_data["url"] in existing_urls:
-                continue
 
-            # 중요도 계산
-            importance_score = crawler.calculate_importance_score(announcement_data)
-            announcement_data["importance_score"] = importance_score
+# ============================================
+# 키워드 알림 발송 (crawl_g2b_bids에서 분리)
+# ============================================
 
-            # DB 저장
-            new_announcement = BidAnnouncement(**announcement_data)
-            session.add(new_announcement)
-            await session.commit()
-            await session.refresh(new_announcement)
 
-            # AI 분석 요청 (중요 공고만)
-            if importance_score >= 2:
-                await process_bid_analysis.kiq(new_announcement.id)
+@broker.task(task_name="dispatch_bid_notifications")
+async def dispatch_bid_notifications(bid_ids: list[int]):
+    """
+    신규 공고를 키워드 구독자별로 묶어 발송 작업에 전달
 
-            # 사용자별 키워드 매칭 알림
-            for user in active_users:
-                if not user.keywords:
-                    continue
+    키워드 → 구독자 역색인으로 공고 1건당 본문을 한 번만 탐색해 대상 사용자를 찾고,
+    크롤링 1회분의 매칭을 사용자 단위로 모아 NOTIFICATION_BATCH_SIZE명씩
+    deliver_bid_notifications 작업으로 넘깁니다.
 
-                user_keywords = [k.keyword for k in user.keywords if k.is_active and k.category == "include"]
+    Args:
+        bid_ids: 신규 저장된 공고 ID 목록
+    """
+    async with AsyncSessionLocal() as session:
+        index = await subscriber_index.get(session)
+        if not index:
+            return
 
-                if not user_keywords:
-                    continue
+        stmt = select(BidAnnouncement.id, BidAnnouncement.search_text).where(BidAnnouncement.id.in_(bid_ids))
+        result = await session.execute(stmt)
+        rows = result.all()
 
-                # 키워드 매칭 확인
-                title = new_announcement.title
-                content = new_announcement.content or ""
-                full_text = f"{title} {content}"
+    matches_by_user: dict[int, list[dict]] = {}
+    for bid_id, search_text in rows:
+        for user_id, keywords in index.match(search_text or "").items():
+            matches_by_user.setdefault(user_id, []).append({"bid_id": bid_id, "keywords": keywords})
 
-                matched = [k for k in user_keywords if k in full_text]
+    batch = [{"user_id": user_id, "matches": matches} for user_id, matches in matches_by_user.items()]
+    batch_size = max(1, settings.NOTIFICATION_BATCH_SIZE)
+    for start in range(0, len(batch), batch_size):
+        await deliver_bid_notifications.kiq(batch[start : start + batch_size])
 
-                if matched:
-                    await NotificationService.notify_bid_match(user, new_announcement, matched)
-                    logger.info(f"알림 발송: User {user.id} -> Bid {new_announcement.id} " f"(키워드: {matched})")
+    logger.info(f"키워드 알림 예약: 공고 {len(rows)}건, 사용자 {len(batch)}명")
 
-            logger.info(f"새 공고 저장: {new_announcement.title} " f"(중요도: {importance_score})")
 
-            # WebSocket 브로드캐스트
-            try:
-                message = json.dumps(
-                    {
-                        "type": "new_bid",
-                        "bid_id": new_announcement.id,
-                        "title": new_announcement.title,
-                        "agency": new_announcement.agency,
-                    }
-                )
-                await manager.broadcast(message)
-            except Exception as e:
-                logger.error(f"WebSocket 브로드캐스트 실패: {e}")
+@broker.task(task_name="deliver_bid_notifications")
+async def deliver_bid_notifications(batch: list[dict]):
+    """
+    사용자별 묶음 알림 발송
+
+    사용자당 매칭 공고를 Slack 메시지 1건 / 이메일 1건으로 묶고, 채널별 동시 발송 수와
+    Slack 웹훅 간격을 지키며 전송합니다 (NotificationService.deliver_digests).
+
+    Args:
+        batch: [{"user_id": int, "matches": [{"bid_id": int, "keywords": [str]}]}]
+    """
+    user_ids = [entry["user_id"] for entry in batch]
+    bid_ids = {match["bid_id"] for entry in batch for match in entry["matches"]}
+
+    async with AsyncSessionLocal() as session:
+        stmt = select(User).where(User.id.in_(user_ids)).options(selectinload(User.full_profile))
+        result = await session.execute(stmt)
+        users = {user.id: user for user in result.scalars().all()}
+
+        result = await session.execute(select(BidAnnouncement).where(BidAnnouncement.id.in_(bid_ids)))
+        bids = {bid.id: bid for bid in result.scalars().all()}
+
+    digests = []
+    for entry in batch:
+        user = users.get(entry["user_id"])
+        if user is None:
+            continue
+        matches = [(bids[m["bid_id"]], m["keywords"]) for m in entry["matches"] if m["bid_id"] in bids]
+        if matches:
+            digests.append(BidDigest(user=user, matches=matches))
+
+    counts = await NotificationService.deliver_digests(digests)
+    logger.info(
+        f"키워드 알림 발송 완료: 사용자 {len(digests)}명, Slack {counts['slack']}건, "
+        f"이메일 {counts['email']}건, 실패 {counts['failed']}건"
+    )
 
 
 # ============================================
@@ -237,9 +534,126 @@ async def process_bid_analysis(bid_id: int):
 
         await session.commit()
 
+        # 4. 지역/면허 요건이 바뀌었으므로 이 공고의 매칭 피드 재계산
+        await match_percolator.percolate_bids(session, [bid.id])
+
         logger.info(f"AI 분석 완료: {bid.title}")
 
 
+@broker.task(task_name="process_bid_upload")
+async def process_bid_upload(job_id: str):
+    """
+    업로드 파일로 공고 생성 (POST /bids/upload 후속 작업)
+
+    임시 파일 텍스트 추출 → 공고 저장 → AI 분석 요청 순서로 처리하고,
+    진행 상태를 UploadJob에 기록합니다. 임시 파일은 성공/실패와 관계없이 삭제합니다.
+
+    작업은 queued → processing 조건부 UPDATE로 한 워커만 가져가며, 워커가 중단되어
+    UPLOAD_JOB_STALE_MINUTES분 넘게 processing으로 남은 작업은 다시 전달된 요청이 이어받을 수 있습니다
+    (그 전에 sweep_stale_upload_jobs가 정리하면 실패로 남음).
+
+    Args:
+        job_id: UploadJob ID
+    """
+    async with AsyncSessionLocal() as session:
+        now = datetime.utcnow()
+        stale_before = now - timedelta(minutes=settings.UPLOAD_JOB_STALE_MINUTES)
+        claimed = await session.execute(
+            update(UploadJob)
+            .where(
+                UploadJob.id == job_id,
+                or_(
+                    UploadJob.status == "queued",
+                    and_(UploadJob.status == "processing", UploadJob.started_at < stale_before),
+                ),
+            )
+            .values(status="processing", started_at=now)
+        )
+        await session.commit()
+        job = await session.get(UploadJob, job_id)
+        if not claimed.rowcount or not job:
+            logger.warning(f"업로드 작업 건너뜀: {job_id} (status={job.status if job else None})")
+            return
+
+        spool_path, filename = job.spool_path, job.filename
+        try:
+            text_content = await upload_service.extract_text(spool_path, filename)
+            if not text_content.strip():
+                raise ValueError("파일에서 텍스트를 추출할 수 없습니다.")
+
+            bid_in = BidCreate(
+                title=job.title,
+                content=text_content,
+                agency=job.agency,
+                posted_at=datetime.now(),
+                url=f"{job.url}/{filename}-{job_id}",
+            )
+            new_bid = await bid_service.create_bid(BidRepository(session), bid_in)
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"업로드 처리 실패: job={job_id}, file={filename}: {e}", exc_info=True)
+            # rollback으로 만료된 작업 상태를 다시 읽어 실패 기록
+            job = await session.get(UploadJob, job_id)
+            job.status = "failed"
+            job.error = str(e)[:1000]
+            job.spool_path = None
+            job.finished_at = datetime.utcnow()
+            await session.commit()
+            return
+        finally:
+            upload_service.discard(spool_path)
+
+        job.status = "completed"
+        job.bid_id = new_bid.id
+        job.spool_path = None
+        job.finished_at = datetime.utcnow()
+        await session.commit()
+
+    logger.info(f"업로드 공고 생성 완료: job={job_id}, bid={new_bid.id}")
+    await process_bid_analysis.kiq(new_bid.id)
+
+
+@broker.task(
+    task_name="sweep_stale_upload_jobs",
+    schedule=[
+        {"cron": "*/10 * * * *"},  # 10분마다
+    ],
+)
+async def sweep_stale_upload_jobs():
+    """
+    끝나지 않은 업로드 작업 정리
+
+    워커가 처리 중 종료되었거나(processing) 작업이 큐에서 사라진(queued) 채 UPLOAD_JOB_STALE_MINUTES분이
+    지난 작업을 실패로 기록하고 임시 파일을 삭제합니다.
+
+    Returns:
+        실패 처리한 작업 수
+    """
+    now = datetime.utcnow()
+    stale_before = now - timedelta(minutes=settings.UPLOAD_JOB_STALE_MINUTES)
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(UploadJob).where(
+                or_(
+                    and_(UploadJob.status == "processing", UploadJob.started_at < stale_before),
+                    and_(UploadJob.status == "queued", UploadJob.created_at < stale_before),
+                )
+            )
+        )
+        jobs = result.scalars().all()
+        for job in jobs:
+            upload_service.discard(job.spool_path)
+            job.status = "failed"
+            job.error = "처리 시간이 초과되었습니다. 파일을 다시 업로드해주세요."
+            job.spool_path = None
+            job.finished_at = now
+        await session.commit()
+
+    if jobs:
+        logger.warning(f"끝나지 않은 업로드 작업 {len(jobs)}건 실패 처리: {[job.id for job in jobs]}")
+    return len(jobs)
+
+
 # ============================================
 # 구독 갱신 배치 (매일 03:00)
 # ============================================